@@ -0,0 +1,6 @@
+"""Benchmarks for the cooking agent.
+
+Run individual benchmarks from the repository root, e.g.::
+
+    uv run python -m benchmarks.parallel_supervisor
+"""
@@ -0,0 +1,95 @@
+"""Shared helpers for benchmarks: scripted chat models and timing utilities."""
+
+import asyncio
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, BaseCallbackHandler
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatResult, LLMResult
+
+
+def tool_call(name: str, args: dict[str, Any], call_id: str) -> dict[str, Any]:
+    """Build a tool call dict as emitted by a chat model."""
+    return {"name": name, "args": args, "id": call_id, "type": "tool_call"}
+
+
+class ScriptedChatModel(GenericFakeChatModel):
+    """Fake chat model that replays scripted responses with simulated latency.
+
+    Each call pops the next message from ``messages``; tool binding is a no-op
+    so the model can be passed straight to ``create_agent``.
+    """
+
+    latency: float = 0.0
+
+    @classmethod
+    def from_script(
+        cls, script: Iterable[AIMessage], latency: float = 0.0
+    ) -> "ScriptedChatModel":
+        """Create a model that answers with ``script`` in order."""
+        return cls(messages=iter(list(script)), latency=latency)
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "ScriptedChatModel":
+        """Ignore tool binding; responses are scripted."""
+        return self
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """Sleep for the simulated latency, then return the next message."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._generate(messages, stop=stop, **kwargs)
+
+
+class Timer:
+    """Context manager measuring wall-clock time in seconds."""
+
+    def __enter__(self) -> "Timer":
+        self.start = time.perf_counter()
+        self.elapsed = 0.0
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.elapsed = time.perf_counter() - self.start
+
+
+class LLMCallCounter(BaseCallbackHandler):
+    """Callback handler counting chat model invocations."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def on_chat_model_start(self, *args: Any, **kwargs: Any) -> None:
+        self.calls += 1
+
+
+class UsageCounter(BaseCallbackHandler):
+    """Callback handler summing token usage and recording tool names."""
+
+    def __init__(self) -> None:
+        self.llm_calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.tools: list[str] = []
+
+    def on_chat_model_start(self, *args: Any, **kwargs: Any) -> None:
+        self.llm_calls += 1
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    self.input_tokens += usage.get("input_tokens", 0)
+                    self.output_tokens += usage.get("output_tokens", 0)
+
+    def on_tool_start(self, serialized: dict[str, Any], input_str: str, **kwargs: Any) -> None:
+        self.tools.append(serialized.get("name") or kwargs.get("name", ""))
@@ -0,0 +1,130 @@
+"""Benchmark decoding of Mealie recipe responses into the client's models.
+
+Compares the previous path (stdlib ``json`` plus field-by-field construction of
+``__dict__`` dataclasses) with the current one (``orjson`` when installed and
+lean construction of slotted dataclasses) on synthetic recipe payloads. Each
+recipe is padded with comments and assets to mimic large real-world responses.
+
+    uv run python -m benchmarks.decoding --recipes 2000 --comments 20
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from benchmarks.fake_mealie import SyntheticRecipes
+from cooking_agent.mealie import client as mealie_client
+
+
+@dataclass
+class LegacyIngredient:
+    note: str
+    quantity: float | None = None
+    unit: str | None = None
+    food: str | None = None
+
+
+@dataclass
+class LegacyRecipe:
+    slug: str
+    name: str
+    description: str | None
+    ingredients: list[LegacyIngredient]
+    instructions: list[str]
+    total_time: str | None = None
+    prep_time: str | None = None
+    cook_time: str | None = None
+
+
+def legacy_decode(body: bytes) -> LegacyRecipe:
+    """The decoding ``MealieClient.get_recipe`` used before."""
+    data = json.loads(body)
+    ingredients = [
+        LegacyIngredient(
+            note=ing.get("note", ""),
+            quantity=ing.get("quantity"),
+            unit=ing.get("unit", {}).get("name") if ing.get("unit") else None,
+            food=ing.get("food", {}).get("name") if ing.get("food") else None,
+        )
+        for ing in data.get("recipeIngredient", [])
+    ]
+    instructions = [step.get("text", "") for step in data.get("recipeInstructions", [])]
+    return LegacyRecipe(
+        slug=data["slug"],
+        name=data["name"],
+        description=data.get("description"),
+        ingredients=ingredients,
+        instructions=instructions,
+        total_time=data.get("totalTime"),
+        prep_time=data.get("prepTime"),
+        cook_time=data.get("cookTime"),
+    )
+
+
+def current_decode(body: bytes) -> mealie_client.Recipe:
+    """The decoding ``MealieClient.get_recipe`` uses now."""
+    return mealie_client.parse_recipe(mealie_client.json_loads(body))
+
+
+def payloads(n: int, comments: int) -> list[bytes]:
+    """Render ``n`` synthetic recipes as response bodies."""
+    recipes = SyntheticRecipes(n)
+    bodies = []
+    for i in range(n):
+        recipe = recipes.render(i)
+        recipe["comments"] = [
+            {"id": f"c{i}-{c}", "text": "Sehr lecker, beim nächsten Mal mit mehr Knoblauch! " * 3,
+             "createdAt": recipe["createdAt"], "user": {"id": recipe["userId"], "username": "cook"}}
+            for c in range(comments)
+        ]
+        recipe["assets"] = [{"name": f"asset-{a}", "icon": "mdi-file", "fileName": f"asset-{a}.pdf"} for a in range(5)]
+        recipe["nutrition"] |= {"fatContent": "12", "proteinContent": "30", "carbohydrateContent": "80",
+                                "fiberContent": "6", "sodiumContent": "900", "sugarContent": "9"}
+        bodies.append(json.dumps(recipe, ensure_ascii=False).encode())
+    return bodies
+
+
+def measure(decode: Callable[[bytes], Any], bodies: list[bytes], repeat: int) -> dict[str, float]:
+    """Best-of-``repeat`` decode time and memory of the decoded models."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for body in bodies:
+            decode(body)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    decoded = [decode(body) for body in bodies]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del decoded
+    return {
+        "total_ms": round(best * 1000, 1),
+        "us_per_recipe": round(best / len(bodies) * 1e6, 1),
+        "retained_kib": round(retained / 1024, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recipes", type=int, default=2000)
+    parser.add_argument("--comments", type=int, default=20, help="Comments added to every recipe")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bodies = payloads(args.recipes, args.comments)
+    print(f"{args.recipes} recipes, {sum(map(len, bodies)) / len(bodies) / 1024:.1f} KiB per response")
+    print(f"JSON decoder: {mealie_client.json_loads.__module__}")
+    legacy = measure(legacy_decode, bodies, args.repeat)
+    current = measure(current_decode, bodies, args.repeat)
+    for label, result in [("legacy", legacy), ("current", current)]:
+        print(f"{label:>8}: {result['us_per_recipe']:>7} µs/recipe  {result['retained_kib']:>9} KiB retained")
+    print(f"speedup: {legacy['total_ms'] / current['total_ms']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
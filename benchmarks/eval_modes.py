@@ -0,0 +1,108 @@
+"""Evaluate agent modes (flat vs. hierarchical) on a fixed task set.
+
+Runs every task in ``eval_tasks.jsonl`` through each mode against the services
+configured in ``.env`` and reports latency, LLM calls, token usage and task
+success. A task succeeds when the turn completes without error and every
+entry of ``expect_tools`` was called (``a|b`` accepts either tool).
+
+    uv run python -m benchmarks.eval_modes --modes supervisor flat
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+from pathlib import Path
+from typing import Any
+
+from benchmarks.common import Timer, UsageCounter
+from cooking_agent.modes import create_cooking_agent
+
+TASKS_FILE = Path(__file__).with_name("eval_tasks.jsonl")
+
+
+def load_tasks(path: Path) -> list[dict[str, Any]]:
+    """Load evaluation tasks from a JSONL file."""
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+def is_success(task: dict[str, Any], tools: list[str]) -> bool:
+    """Check that all expected tools were called."""
+    called = set(tools)
+    return all(
+        any(option in called for option in expected.split("|"))
+        for expected in task.get("expect_tools", [])
+    )
+
+
+async def run_task(mode: str, task: dict[str, Any]) -> dict[str, Any]:
+    """Run one task in one mode and collect its metrics."""
+    agent = create_cooking_agent(mode)
+    usage = UsageCounter()
+    error = None
+    with Timer() as timer:
+        try:
+            await agent.ainvoke(
+                {"messages": [{"role": "user", "content": task["prompt"]}]},
+                {"callbacks": [usage]},
+            )
+        except Exception as e:
+            error = str(e)
+
+    return {
+        "mode": mode,
+        "task": task["id"],
+        "latency_s": round(timer.elapsed, 3),
+        "llm_calls": usage.llm_calls,
+        "input_tokens": usage.input_tokens,
+        "output_tokens": usage.output_tokens,
+        "tools": usage.tools,
+        "success": error is None and is_success(task, usage.tools),
+        "error": error,
+    }
+
+
+def summarize(results: list[dict[str, Any]]) -> dict[str, dict[str, float]]:
+    """Aggregate per-mode metrics."""
+    summary = {}
+    for mode in dict.fromkeys(r["mode"] for r in results):
+        rows = [r for r in results if r["mode"] == mode]
+        summary[mode] = {
+            "median_latency_s": round(statistics.median(r["latency_s"] for r in rows), 3),
+            "mean_llm_calls": round(statistics.mean(r["llm_calls"] for r in rows), 2),
+            "mean_input_tokens": round(statistics.mean(r["input_tokens"] for r in rows)),
+            "mean_output_tokens": round(statistics.mean(r["output_tokens"] for r in rows)),
+            "success_rate": round(sum(r["success"] for r in rows) / len(rows), 2),
+        }
+    return summary
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run all tasks in all modes sequentially and print the report."""
+    tasks = load_tasks(args.tasks)
+    results = []
+    for _ in range(args.repeat):
+        for task in tasks:
+            for mode in args.modes:
+                result = await run_task(mode, task)
+                results.append(result)
+                print(json.dumps(result, ensure_ascii=False))
+
+    report = {"summary": summarize(results), "results": results}
+    print(json.dumps(report["summary"], indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modes", nargs="+", default=["supervisor", "flat"], help="Agent modes to compare")
+    parser.add_argument("--tasks", type=Path, default=TASKS_FILE, help="JSONL file with tasks")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per task and mode")
+    parser.add_argument("--output", type=Path, help="Write the full JSON report to this file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
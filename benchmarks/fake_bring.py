@@ -0,0 +1,98 @@
+"""Local stand-in for the Bring REST API used by ``bring_api``.
+
+Covers login, account/settings loading, list loading, reading list items and
+batch updates. Responses come from the fixtures in ``fixtures/bring``; batch
+updates are applied to an in-memory copy of the lists.
+"""
+
+import asyncio
+import copy
+import json
+import uuid
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+
+FIXTURES = Path(__file__).with_name("fixtures") / "bring"
+
+
+def _load(name: str) -> Any:
+    return json.loads((FIXTURES / f"{name}.json").read_text(encoding="utf-8"))
+
+
+class FakeBring:
+    """In-process fake Bring server (mounted below ``/rest``)."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Initialize the fake.
+
+        Args:
+            latency: Delay added to every response in seconds
+        """
+        self.latency = latency
+        self.requests = 0
+        self.auth = _load("auth")
+        self.user = _load("user")
+        self.user_settings = _load("usersettings")
+        self.lists = _load("lists")
+        self.items = copy.deepcopy(_load("list_items"))
+
+    def app(self) -> web.Application:
+        """Build the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_post("/rest/v2/bringauth", self.login)
+        app.router.add_get("/rest/v2/bringusers/{user}", self.get_user)
+        app.router.add_get("/rest/bringusersettings/{user}", self.get_user_settings)
+        app.router.add_get("/rest/bringusers/{user}/lists", self.get_lists)
+        app.router.add_get("/rest/v2/bringlists/{list}", self.get_list)
+        app.router.add_put("/rest/v2/bringlists/{list}/items", self.update_items)
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return await handler(request)
+
+    async def login(self, request: web.Request) -> web.Response:
+        return web.json_response(self.auth)
+
+    async def get_user(self, request: web.Request) -> web.Response:
+        return web.json_response(self.user)
+
+    async def get_user_settings(self, request: web.Request) -> web.Response:
+        return web.json_response(self.user_settings)
+
+    async def get_lists(self, request: web.Request) -> web.Response:
+        return web.json_response(self.lists)
+
+    async def get_list(self, request: web.Request) -> web.Response:
+        items = self.items.get(request.match_info["list"])
+        if items is None:
+            return web.json_response({"message": "not found"}, status=404)
+        return web.json_response(items)
+
+    async def update_items(self, request: web.Request) -> web.Response:
+        """Apply ``TO_PURCHASE``, ``TO_RECENTLY`` and ``REMOVE`` changes."""
+        lst = self.items.get(request.match_info["list"])
+        if lst is None:
+            return web.json_response({"message": "not found"}, status=404)
+        body = await request.json()
+        purchase, recently = lst["items"]["purchase"], lst["items"]["recently"]
+        for change in body.get("changes", []):
+            name = change["itemId"]
+            purchase[:] = [i for i in purchase if i["itemId"] != name]
+            recently[:] = [i for i in recently if i["itemId"] != name]
+            item = {
+                "uuid": change.get("uuid") or str(uuid.uuid4()),
+                "itemId": name,
+                "specification": change.get("spec", ""),
+                "attributes": [],
+            }
+            if change["operation"] == "TO_PURCHASE":
+                purchase.append(item)
+            elif change["operation"] == "TO_RECENTLY":
+                recently.insert(0, item)
+        return web.Response(status=204)
@@ -0,0 +1,383 @@
+"""Local stand-in for the Mealie REST endpoints used by ``MealieClient``.
+
+Serves recipes shaped like real Mealie responses, either from the JSON
+fixtures in ``fixtures/mealie/recipes`` or synthesized deterministically (100k
+recipes are generated in a few seconds and rendered lazily per request):
+
+- ``GET /api/recipes`` with ``search``, ``page``, ``perPage``, ``orderBy``,
+  ``orderDirection`` and ``queryFilter`` (``updatedAt``/``dateUpdated``
+  comparisons, as used for incremental sync)
+- ``GET /api/recipes/{slug}``
+
+Latency (fixed plus jitter) and errors (random 5xx, timeouts) can be injected
+with a seed, so load tests are reproducible. Run standalone with::
+
+    uv run python -m benchmarks.fake_mealie --recipes 100000 --port 9926 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import uuid
+from collections.abc import Iterator, Mapping
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+from aiohttp import web
+
+FIXTURES = Path(__file__).with_name("fixtures") / "mealie" / "recipes"
+
+# Fields of a full recipe that Mealie omits from search results.
+DETAIL_ONLY_FIELDS = (
+    "recipeIngredient",
+    "recipeInstructions",
+    "nutrition",
+    "settings",
+    "assets",
+    "notes",
+    "extras",
+    "comments",
+)
+
+ORDER_FIELDS = {"name", "createdAt", "updatedAt", "dateAdded", "dateUpdated", "totalTime"}
+QUERY_FILTER = re.compile(r'^\s*(updatedAt|dateUpdated|createdAt)\s*(>=|<=|>|<|=)\s*"([^"]+)"\s*$')
+
+
+def load_recipes(directory: Path = FIXTURES) -> dict[str, dict[str, Any]]:
+    """Load recipe fixtures keyed by slug."""
+    recipes = {}
+    for path in sorted(directory.glob("*.json")):
+        recipe = json.loads(path.read_text(encoding="utf-8"))
+        recipes[recipe["slug"]] = recipe
+    return recipes
+
+
+def summarize(recipe: dict[str, Any]) -> dict[str, Any]:
+    """Strip a full recipe down to a search result item."""
+    return {k: v for k, v in recipe.items() if k not in DETAIL_ONLY_FIELDS}
+
+
+_DISHES = [
+    "Pasta", "Nudeln", "Risotto", "Suppe", "Eintopf", "Curry", "Auflauf", "Salat", "Pfanne",
+    "Lasagne", "Gratin", "Bowl", "Quiche", "Omelett", "Stew", "Soup", "Tacos", "Pizza",
+]
+_STYLES = [
+    "Schnelle", "Cremige", "Würzige", "Einfache", "Herbstliche", "Italienische", "Asiatische",
+    "Vegetarische", "Classic", "Spicy", "Rustic", "Summer", "Winter", "Omas",
+]
+_FOODS = [
+    "Kartoffeln", "Lauch", "Zwiebel", "Knoblauch", "Karotte", "Zucchini", "Aubergine", "Paprika",
+    "Tomaten", "Spinat", "Brokkoli", "Blumenkohl", "Kürbis", "Pilze", "Erbsen", "Mais", "Kichererbsen",
+    "Linsen", "Reis", "Spaghetti", "Penne", "Nudeln", "Hähnchenbrust", "Hackfleisch", "Lachs", "Tofu",
+    "Feta", "Parmesan", "Mozzarella", "Sahne", "Milch", "Butter", "Eier", "Mehl", "Zitrone", "Ingwer",
+    "Kokosmilch", "Currypaste", "Gemüsebrühe", "Olivenöl", "Salz", "Pfeffer", "Petersilie", "Basilikum",
+    "Chicken breast", "Onion", "Garlic", "Rice", "Beans", "Cheddar", "Sweet potato", "Coriander",
+]
+_UNITS = [None, "g", "ml", "EL", "TL", "Stk", "Prise", "Zehe", "l"]
+_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _slugify(text: str) -> str:
+    text = text.lower().translate(str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"}))
+    return re.sub(r"[^a-z0-9]+", "-", text).strip("-")
+
+
+def _format_minutes(minutes: int, style: int) -> str:
+    """Render a duration in one of the free-form styles found in Mealie data."""
+    hours, rest = divmod(minutes, 60)
+    if style == 0:
+        return f"PT{hours}H{rest}M" if hours else f"PT{rest}M"
+    if style == 1 and hours:
+        return f"{hours} hour{'s' if hours > 1 else ''} {rest} minutes" if rest else f"{hours} hour{'s' if hours > 1 else ''}"
+    if style == 2:
+        return f"{minutes} Minuten"
+    return f"{minutes} minutes"
+
+
+class SyntheticRecipes(Mapping[str, dict[str, Any]]):
+    """Deterministic collection of ``n`` synthetic recipes.
+
+    Only slugs, names and update timestamps are kept in memory; full recipes
+    are rendered on access from a per-recipe seed.
+    """
+
+    def __init__(self, n: int, seed: int = 0) -> None:
+        """Generate the collection.
+
+        Args:
+            n: Number of recipes
+            seed: Seed for names, ingredients and timestamps
+        """
+        self.seed = seed
+        rng = random.Random(seed)
+        self.slugs: list[str] = []
+        self.names: list[str] = []
+        self.updated: list[datetime] = []
+        self._index: dict[str, int] = {}
+        for i in range(n):
+            name = f"{rng.choice(_STYLES)} {rng.choice(_DISHES)} mit {rng.choice(_FOODS)}"
+            slug = f"{_slugify(name)}-{i}"
+            self.slugs.append(slug)
+            self.names.append(name)
+            self.updated.append(_EPOCH + timedelta(minutes=i * 7 + rng.randrange(7)))
+            self._index[slug] = i
+
+    def __len__(self) -> int:
+        return len(self.slugs)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.slugs)
+
+    def __getitem__(self, slug: str) -> dict[str, Any]:
+        return self.render(self._index[slug])
+
+    def touch(self, slug: str, when: datetime | None = None) -> None:
+        """Mark a recipe as updated (for incremental sync tests)."""
+        self.updated[self._index[slug]] = when or datetime.now(timezone.utc)
+
+    def render(self, i: int) -> dict[str, Any]:
+        """Render recipe ``i`` as a full Mealie recipe response."""
+        rng = random.Random(self.seed * 1_000_003 + i)
+        slug, name = self.slugs[i], self.names[i]
+        prep, cook = rng.choice([5, 10, 15, 20, 30]), rng.choice([10, 15, 20, 30, 45, 60, 90, 120])
+        style = rng.randrange(4)
+        foods = rng.sample(_FOODS, rng.randint(4, 12))
+        updated = self.updated[i].isoformat()
+        created = (_EPOCH + timedelta(minutes=i * 7)).isoformat()
+        recipe_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        return {
+            "id": recipe_id,
+            "userId": "a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d",
+            "householdId": "0e9d8c7b-6a5f-4e3d-2c1b-0a9f8e7d6c5b",
+            "groupId": "5c6a1f1e-8d7b-4f2e-9a3c-1b2d3e4f5a6b",
+            "name": name,
+            "slug": slug,
+            "image": "Xy1z",
+            "recipeServings": float(rng.choice([2, 4, 6])),
+            "recipeYieldQuantity": 0.0,
+            "recipeYield": "",
+            "totalTime": _format_minutes(prep + cook, style),
+            "prepTime": _format_minutes(prep, style),
+            "cookTime": _format_minutes(cook, style),
+            "performTime": None,
+            "description": f"{name} – synthetisches Rezept Nr. {i}.",
+            "recipeCategory": [],
+            "tags": [],
+            "tools": [],
+            "rating": rng.choice([None, 3, 4, 5]),
+            "orgURL": None,
+            "dateAdded": created[:10],
+            "dateUpdated": updated,
+            "createdAt": created,
+            "updatedAt": updated,
+            "lastMade": None,
+            "recipeIngredient": [
+                {
+                    "quantity": float(rng.choice([0, 1, 2, 100, 200, 250, 500])),
+                    "unit": (
+                        {"id": str(uuid.uuid5(uuid.NAMESPACE_DNS, "u" + unit)), "name": unit, "abbreviation": ""}
+                        if (unit := rng.choice(_UNITS))
+                        else None
+                    ),
+                    "food": {"id": str(uuid.uuid5(uuid.NAMESPACE_DNS, "f" + food)), "name": food, "labelId": None},
+                    "note": rng.choice(["", "", "fein gehackt", "gewürfelt", "optional"]),
+                    "isFood": True,
+                    "disableAmount": False,
+                    "display": food,
+                    "title": None,
+                    "originalText": None,
+                    "referenceId": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                }
+                for food in foods
+            ],
+            "recipeInstructions": [
+                {
+                    "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                    "title": "",
+                    "summary": "",
+                    "text": f"Schritt {step + 1}: {rng.choice(foods)} vorbereiten und {rng.choice([5, 10, 15])} Minuten garen.",
+                    "ingredientReferences": [],
+                }
+                for step in range(rng.randint(3, 8))
+            ],
+            "nutrition": {"calories": str(rng.randint(250, 1100))},
+            "settings": {"public": True, "showNutrition": False, "showAssets": False, "landscapeView": False,
+                         "disableComments": False, "locked": False},
+            "assets": [],
+            "notes": [],
+            "extras": {},
+            "comments": [],
+        }
+
+    def summary(self, i: int) -> dict[str, Any]:
+        """Render recipe ``i`` as a search result item."""
+        return summarize(self.render(i))
+
+
+class FakeMealie:
+    """In-process fake Mealie server."""
+
+    def __init__(
+        self,
+        recipes: Mapping[str, dict[str, Any]] | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the fake.
+
+        Args:
+            recipes: Full recipes keyed by slug (a dict or ``SyntheticRecipes``),
+                defaults to the fixtures
+            latency: Delay added to every response in seconds
+            jitter: Additional uniformly random delay up to this many seconds
+            error_rate: Fraction of requests answered with HTTP 500
+            timeout_rate: Fraction of requests that hang for 60 seconds
+            seed: Seed for jitter and error injection
+        """
+        self.recipes = recipes if recipes is not None else load_recipes()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.requests = 0
+        self.errors = 0
+        self._rng = random.Random(seed)
+        self._search_text = [(slug, self._text_of(slug).lower()) for slug in self.recipes]
+        self._text_by_slug = dict(self._search_text)
+
+    def _text_of(self, slug: str) -> str:
+        if isinstance(self.recipes, SyntheticRecipes):
+            return self.recipes.names[self.recipes._index[slug]]
+        recipe = self.recipes[slug]
+        return f"{recipe['name']} {recipe.get('description') or ''}"
+
+    def _updated_at(self, slug: str) -> str:
+        if isinstance(self.recipes, SyntheticRecipes):
+            return self.recipes.updated[self.recipes._index[slug]].isoformat()
+        return self.recipes[slug].get("updatedAt") or ""
+
+    def _summary(self, slug: str) -> dict[str, Any]:
+        if isinstance(self.recipes, SyntheticRecipes):
+            return self.recipes.summary(self.recipes._index[slug])
+        return summarize(self.recipes[slug])
+
+    def app(self) -> web.Application:
+        """Build the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/api/recipes", self.search)
+        app.router.add_get("/api/recipes/{slug}", self.get_recipe)
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        self.requests += 1
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        roll = self._rng.random()
+        if roll < self.timeout_rate:
+            self.errors += 1
+            await asyncio.sleep(60)
+        elif roll < self.timeout_rate + self.error_rate:
+            self.errors += 1
+            return web.json_response({"detail": "Injected failure"}, status=500)
+        return await handler(request)
+
+    def _filter(self, slugs: list[str], query_filter: str) -> list[str]:
+        match = QUERY_FILTER.match(query_filter)
+        if not match:
+            raise web.HTTPBadRequest(text=f"Unsupported queryFilter: {query_filter}")
+        _, op, value = match.groups()
+        bound = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if bound.tzinfo is None:
+            bound = bound.replace(tzinfo=timezone.utc)
+        compare = {
+            ">": lambda a: a > bound, ">=": lambda a: a >= bound,
+            "<": lambda a: a < bound, "<=": lambda a: a <= bound, "=": lambda a: a == bound,
+        }[op]
+        return [s for s in slugs if compare(datetime.fromisoformat(self._updated_at(s)))]
+
+    async def search(self, request: web.Request) -> web.Response:
+        """``GET /api/recipes``: paginated, filtered and ordered recipe search."""
+        query = request.query.get("search", "").lower()
+        page = max(int(request.query.get("page", 1)), 1)
+        per_page = int(request.query.get("perPage", 50))
+        order_by = request.query.get("orderBy")
+        descending = request.query.get("orderDirection", "desc") == "desc"
+
+        slugs = [slug for slug, text in self._search_text if not query or query in text]
+        if query_filter := request.query.get("queryFilter"):
+            slugs = self._filter(slugs, query_filter)
+        if order_by in ("updatedAt", "dateUpdated"):
+            slugs.sort(key=self._updated_at, reverse=descending)
+        elif order_by == "name":
+            slugs.sort(key=self._text_by_slug.__getitem__, reverse=descending)
+        elif order_by and order_by not in ORDER_FIELDS:
+            raise web.HTTPBadRequest(text=f"Unsupported orderBy: {order_by}")
+
+        if per_page == -1:
+            per_page = max(len(slugs), 1)
+        total_pages = math.ceil(len(slugs) / per_page) if per_page else 0
+        start = (page - 1) * per_page
+
+        def link(target: int) -> str | None:
+            if not 1 <= target <= total_pages:
+                return None
+            params = {k: v for k, v in request.query.items() if k != "page"}
+            return f"/recipes?{urlencode({**params, 'page': target})}"
+
+        return web.json_response(
+            {
+                "page": page,
+                "per_page": per_page,
+                "total": len(slugs),
+                "total_pages": total_pages,
+                "items": [self._summary(s) for s in slugs[start : start + per_page]],
+                "next": link(page + 1),
+                "previous": link(page - 1),
+            }
+        )
+
+    async def get_recipe(self, request: web.Request) -> web.Response:
+        """``GET /api/recipes/{slug}``."""
+        recipe = self.recipes.get(request.match_info["slug"])
+        if recipe is None:
+            return web.json_response({"detail": "Not Found"}, status=404)
+        return web.json_response(recipe)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Serve a fake Mealie API")
+    parser.add_argument("--recipes", type=int, default=0, help="Synthesize this many recipes (0: use fixtures)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for synthesis, jitter and errors")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9926)
+    parser.add_argument("--latency", type=float, default=0.0, help="Fixed delay per request (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra delay up to (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of HTTP 500 responses")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Fraction of hanging requests")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    recipes = SyntheticRecipes(args.recipes, seed=args.seed) if args.recipes else None
+    fake = FakeMealie(
+        recipes,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        seed=args.seed,
+    )
+    print(f"Serving {len(fake.recipes)} recipes on http://{args.host}:{args.port} (MEALIE_URL)")
+    web.run_app(fake.app(), host=args.host, port=args.port, print=None)
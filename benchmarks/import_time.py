@@ -0,0 +1,70 @@
+"""Benchmark the import time of the package entry points.
+
+Each import runs in a fresh interpreter under ``-X importtime``; the reported
+time is the cumulative time of its top-level imports minus that of a bare
+interpreter. Client and CLI imports must not load the agent frameworks:
+
+    uv run python -m benchmarks.import_time
+    uv run python -m benchmarks.import_time --max-ms 300   # fail on regressions
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+
+# Statement, and modules it must not load.
+AGENT_FRAMEWORKS = ("langchain", "langchain_core", "langchain_openai", "langgraph")
+TARGETS = {
+    "mealie_client": ("from cooking_agent.mealie import MealieClient", (*AGENT_FRAMEWORKS, "bring_api")),
+    "bring_client": ("from cooking_agent.bring import BringClient", AGENT_FRAMEWORKS),
+    "package": ("import cooking_agent", (*AGENT_FRAMEWORKS, "bring_api", "httpx")),
+    "cli": ("import cooking_agent.cli", (*AGENT_FRAMEWORKS, "bring_api")),
+    "agents": ("from cooking_agent import create_cooking_agent", ()),
+}
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+def import_time_us(statement: str) -> tuple[int, set[str]]:
+    """Cumulative top-level import time of ``statement`` and the modules it loads."""
+    code = f"{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    total = 0
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match and len(match.group(3)) == 1:  # top level: one space of indentation
+            total += int(match.group(2))
+    return total, set(json.loads(proc.stdout.splitlines()[-1]))
+
+
+def measure(statement: str, repeat: int) -> tuple[float, set[str]]:
+    """Best-of-``repeat`` import time of ``statement`` in milliseconds."""
+    runs = [import_time_us(statement) for _ in range(repeat)]
+    return min(us for us, _ in runs) / 1000, runs[0][1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-ms", type=float, help="Fail if a client import takes longer")
+    args = parser.parse_args()
+
+    baseline, _ = measure("pass", args.repeat)
+    failed = False
+    for name, (statement, forbidden) in TARGETS.items():
+        elapsed, modules = measure(statement, args.repeat)
+        elapsed = max(elapsed - baseline, 0.0)
+        loaded = sorted(m for m in forbidden if m in modules)
+        over_budget = args.max_ms is not None and name != "agents" and elapsed > args.max_ms
+        failed |= bool(loaded) or over_budget
+        status = f"loads {', '.join(loaded)}" if loaded else ("over budget" if over_budget else "ok")
+        print(f"{name:>14}: {elapsed:>8.1f} ms  {statement:<48} {status}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Load test ``MealieClient`` against the local Mealie stand-in.
+
+Synthesizes a large collection in ``FakeMealie`` and runs a mix of searches,
+full pagination and recipe fetches from many concurrent workers through a
+single ``MealieClient``. Reports throughput, latency percentiles and errors per
+operation as JSON.
+
+    uv run python -m benchmarks.mealie_load --recipes 100000 --concurrency 32 --duration 10
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from collections import defaultdict
+from typing import Any
+
+from aiohttp import web
+
+from benchmarks.fake_mealie import FakeMealie, SyntheticRecipes
+from cooking_agent.mealie.client import MealieClient
+
+SEARCH_TERMS = ["pasta", "suppe", "curry", "kartoffeln", "lauch", "reis", "tofu", "salat"]
+
+
+async def start_server(fake: FakeMealie) -> tuple[web.AppRunner, str]:
+    """Serve the fake on a free local port and return its base URL."""
+    runner = web.AppRunner(fake.app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    return runner, f"http://{host}:{port}"
+
+
+async def worker(
+    client: MealieClient,
+    recipes: SyntheticRecipes,
+    rng: random.Random,
+    deadline: float,
+    samples: dict[str, list[float]],
+    errors: dict[str, int],
+    mix: dict[str, float],
+) -> None:
+    """Issue requests until the deadline, recording per-operation latency."""
+    operations = list(mix)
+    weights = list(mix.values())
+    while time.perf_counter() < deadline:
+        operation = rng.choices(operations, weights)[0]
+        start = time.perf_counter()
+        try:
+            if operation == "search":
+                await client.search_recipes(rng.choice(SEARCH_TERMS), limit=10)
+            elif operation == "get_recipe":
+                await client.get_recipe(recipes.slugs[rng.randrange(len(recipes))])
+            elif operation == "paginate":
+                page = rng.randrange(1, max(len(recipes) // 100, 1) + 1)
+                response = await client.client.get("/recipes", params={"page": page, "perPage": 100})
+                response.raise_for_status()
+        except Exception:
+            errors[operation] += 1
+            continue
+        samples[operation].append(time.perf_counter() - start)
+
+
+def latency_summary(values: list[float]) -> dict[str, float]:
+    """Percentiles in milliseconds."""
+    ordered = sorted(values)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000  # noqa: E731
+    return {
+        "p50": round(statistics.median(ordered) * 1000, 2),
+        "p95": round(pick(0.95), 2),
+        "p99": round(pick(0.99), 2),
+        "max": round(ordered[-1] * 1000, 2),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the load test and build the report."""
+    start = time.perf_counter()
+    recipes = SyntheticRecipes(args.recipes, seed=args.seed)
+    synthesis_s = time.perf_counter() - start
+    fake = FakeMealie(
+        recipes,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    runner, url = await start_server(fake)
+
+    samples: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    mix = {"search": args.search_weight, "get_recipe": args.get_weight, "paginate": args.paginate_weight}
+    try:
+        async with MealieClient(url, "load-test") as client:
+            deadline = time.perf_counter() + args.duration
+            await asyncio.gather(
+                *(
+                    worker(client, recipes, random.Random(args.seed + i), deadline, samples, errors, mix)
+                    for i in range(args.concurrency)
+                )
+            )
+    finally:
+        await runner.cleanup()
+
+    return {
+        "recipes": args.recipes,
+        "synthesis_s": round(synthesis_s, 2),
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "server_requests": fake.requests,
+        "operations": {
+            op: {
+                "count": len(samples[op]),
+                "errors": errors[op],
+                "per_s": round(len(samples[op]) / args.duration, 1),
+                "latency_ms": latency_summary(samples[op]) if samples[op] else None,
+            }
+            for op in mix
+        },
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recipes", type=int, default=100_000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--latency", type=float, default=0.0, help="Server delay per request (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra server delay up to (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of injected HTTP 500s")
+    parser.add_argument("--search-weight", type=float, default=0.3)
+    parser.add_argument("--get-weight", type=float, default=0.6)
+    parser.add_argument("--paginate-weight", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    print(json.dumps(asyncio.run(run(parse_args())), indent=2))
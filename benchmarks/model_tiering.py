@@ -0,0 +1,194 @@
+"""Benchmark per-agent model tiering: latency and cost vs. one model for all agents.
+
+Runs the offline scenarios (real agents, tools and clients against the fake
+Mealie and Bring) with scripted models that simulate two model tiers: a strong
+model for every agent, and a cheap, faster model for the Mealie and Bring
+sub-agents that escalates to the strong one. The cheap model emits a broken
+tool call (missing arguments) at a configurable rate, so the cost of
+escalating is part of the comparison. Token usage is estimated from the
+message sizes and priced per tier:
+
+    uv run python -m benchmarks.model_tiering
+    uv run python -m benchmarks.model_tiering --error-rates 0 0.2 0.5 --turns 30
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+from collections import Counter
+from collections.abc import Callable
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatResult
+
+from benchmarks.common import ScriptedChatModel
+from benchmarks.offline import SCENARIOS, start_fakes
+from cooking_agent.cli import run_agent_async
+from cooking_agent.config import AgentModelSettings, get_settings
+from cooking_agent.llm import set_chat_model_factory
+from cooking_agent.modes import create_cooking_agent
+from cooking_agent.stats import UsageTracker
+
+SUB_AGENTS = ("mealie", "bring")
+
+_scenario: ContextVar[str] = ContextVar("tiering_scenario")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of ``text`` (four characters per token)."""
+    return max(len(text) // 4, 1)
+
+
+class TierModel(ScriptedChatModel):
+    """Scripted model of one tier that records its estimated token usage."""
+
+    tier: str = "strong"
+    usage: Any = None  # Counter shared by all models of a run
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """Answer from the script and count input and output tokens."""
+        result = await super()._agenerate(messages, stop, run_manager, **kwargs)
+        message = result.generations[0].message
+        self.usage[f"{self.tier}_input"] += sum(estimate_tokens(m.text) for m in messages) + 400
+        self.usage[f"{self.tier}_output"] += estimate_tokens(message.text + json.dumps(message.tool_calls))
+        return result
+
+
+def break_tool_calls(message: AIMessage) -> AIMessage:
+    """Copy of ``message`` whose tool calls lack their arguments."""
+    return AIMessage("", tool_calls=[{**call, "args": {}} for call in message.tool_calls])
+
+
+def tiered_model_factory(
+    args: argparse.Namespace, tiered: bool, error_rate: float, usage: Counter, rng: random.Random
+) -> Callable[[str], TierModel]:
+    """Create models for ``agent`` or ``"<agent>:escalated"`` of the current scenario.
+
+    The cheap model breaks each tool-calling response with probability
+    ``error_rate``; the escalated model created for the same sub-agent run
+    answers exactly the broken steps correctly.
+    """
+    escalated_scripts: dict[str, list[AIMessage]] = {}
+
+    def model(script: list[AIMessage], tier: str) -> TierModel:
+        latency = args.cheap_latency if tier == "cheap" else args.strong_latency
+        return TierModel(messages=iter(script), latency=latency, tier=tier, usage=usage)
+
+    def factory(name: str) -> TierModel:
+        agent, _, escalated = name.partition(":")
+        script = SCENARIOS[_scenario.get()].get(agent, [AIMessage("ok")])
+        if not tiered or agent not in SUB_AGENTS:
+            return model(script, "strong")
+        if escalated:
+            return model(escalated_scripts.pop(agent, []), "strong")
+
+        broken = [i for i, m in enumerate(script) if m.tool_calls and rng.random() < error_rate]
+        escalated_scripts[agent] = [script[i] for i in broken]
+        return model([break_tool_calls(m) if i in broken else m for i, m in enumerate(script)], "cheap")
+
+    return factory
+
+
+def cost_usd(args: argparse.Namespace, usage: Counter) -> float:
+    """Price the recorded token usage of both tiers."""
+    return (
+        usage["strong_input"] * args.strong_prices[0]
+        + usage["strong_output"] * args.strong_prices[1]
+        + usage["cheap_input"] * args.cheap_prices[0]
+        + usage["cheap_output"] * args.cheap_prices[1]
+    ) / 1_000_000
+
+
+async def run_config(args: argparse.Namespace, tiered: bool, error_rate: float) -> dict[str, Any]:
+    """Run ``args.turns`` turns with one model configuration."""
+    settings = get_settings()
+    settings.agent_models = (
+        {agent: AgentModelSettings(model="cheap", escalate_to="strong") for agent in SUB_AGENTS}
+        if tiered
+        else {}
+    )
+    usage: Counter = Counter()
+    set_chat_model_factory(tiered_model_factory(args, tiered, error_rate, usage, random.Random(args.seed)))
+
+    tracker = UsageTracker()
+    names = list(SCENARIOS)
+    failed = 0
+    for i in range(args.turns):
+        _scenario.set(names[i % len(names)])
+        try:
+            await run_agent_async(SCENARIOS[_scenario.get()]["prompt"], create_cooking_agent("supervisor"), tracker)
+        except Exception:
+            failed += 1
+
+    latencies = [turn.duration_s * 1000 for turn in tracker.turns]
+    escalations = sum(turn.totals()["escalations"] for turn in tracker.turns)
+    return {
+        "config": f"tiered, {error_rate:.0%} invalid" if tiered else "strong model only",
+        "latency_ms_p50": round(statistics.median(latencies), 1),
+        "latency_ms_mean": round(statistics.fmean(latencies), 1),
+        "cost_usd_per_turn": round(cost_usd(args, usage) / args.turns, 6),
+        "escalations_per_turn": round(escalations / args.turns, 2),
+        "failed_turns": failed,
+    }
+
+
+async def run(args: argparse.Namespace) -> list[dict[str, Any]]:
+    """Run the baseline and the tiered configurations."""
+    runner, _, _ = await start_fakes(args)
+    try:
+        results = [await run_config(args, tiered=False, error_rate=0.0)]
+        for error_rate in args.error_rates:
+            results.append(await run_config(args, tiered=True, error_rate=error_rate))
+    finally:
+        await runner.cleanup()
+        set_chat_model_factory(None)
+        get_settings().agent_models = {}
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=12, help="Turns per configuration")
+    parser.add_argument("--error-rates", type=float, nargs="+", default=[0.0, 0.1, 0.3],
+                        help="Rates of invalid tool calls of the cheap model")
+    parser.add_argument("--strong-latency", type=float, default=0.08, help="Latency per strong model call (s)")
+    parser.add_argument("--cheap-latency", type=float, default=0.03, help="Latency per cheap model call (s)")
+    parser.add_argument("--strong-prices", type=float, nargs=2, default=[2.50, 10.00],
+                        metavar=("INPUT", "OUTPUT"), help="Strong model USD per million tokens")
+    parser.add_argument("--cheap-prices", type=float, nargs=2, default=[0.10, 0.40],
+                        metavar=("INPUT", "OUTPUT"), help="Cheap model USD per million tokens")
+    parser.add_argument("--service-latency", type=float, default=0.005, help="Fake server latency per request (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write the results as JSON to this file")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    args = parse_args()
+    results = asyncio.run(run(args))
+    print(f"{'configuration':<24} {'p50 ms':>8} {'mean ms':>8} {'$/turn':>10} {'escal./turn':>12} {'failed':>7}")
+    for r in results:
+        print(
+            f"{r['config']:<24} {r['latency_ms_p50']:>8} {r['latency_ms_mean']:>8} "
+            f"{r['cost_usd_per_turn']:>10.6f} {r['escalations_per_turn']:>12} {r['failed_turns']:>7}"
+        )
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""Offline end-to-end benchmark against recorded Mealie and Bring fixtures.
+
+Starts local stand-ins for Mealie and Bring (``fake_mealie``, ``fake_bring``),
+replaces every agent's chat model with a scripted one issuing the tool calls a
+real model would, and runs the real agents, tools and clients against them.
+
+Reports end-to-end turn latency per scenario, HTTP and LLM calls per turn,
+throughput with N concurrent sessions and memory allocations as JSON, so runs
+can be compared with ``--compare``:
+
+    uv run python -m benchmarks.offline --sessions 8 --output report.json
+    uv run python -m benchmarks.offline --compare report.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from collections.abc import Callable
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+from langchain_core.messages import AIMessage
+
+from benchmarks.common import ScriptedChatModel, tool_call
+from benchmarks.fake_bring import FakeBring
+from benchmarks.fake_mealie import FakeMealie
+
+# Settings must be importable before the package reads the environment.
+os.environ.setdefault("MEALIE_API_TOKEN", "offline")
+os.environ.setdefault("BRING_EMAIL", "cook@example.com")
+os.environ.setdefault("BRING_PASSWORD", "offline")
+os.environ.setdefault("OPENAI_API_KEY", "offline")
+
+from cooking_agent.cli import run_agent_async  # noqa: E402
+from cooking_agent.config import get_settings  # noqa: E402
+from cooking_agent.llm import set_chat_model_factory  # noqa: E402
+from cooking_agent.modes import create_cooking_agent  # noqa: E402
+from cooking_agent.stats import TurnStats, UsageTracker  # noqa: E402
+
+INGREDIENTS = ["400.0 g Spaghetti", "2.0 Zitrone", "100.0 g Parmesan", "50.0 g Butter"]
+
+# Scripted responses per agent; one fresh model is created per agent instance.
+SCENARIOS: dict[str, dict[str, Any]] = {
+    "search": {
+        "prompt": "Search for pasta recipes",
+        "supervisor": [
+            AIMessage("", tool_calls=[tool_call("mealie_recipes", {"query": "Search for pasta recipes"}, "s1")]),
+            AIMessage("I found Pasta al Limone."),
+        ],
+        "mealie": [
+            AIMessage("", tool_calls=[tool_call("search_recipes", {"query": "pasta"}, "m1")]),
+            AIMessage("Found Pasta al Limone (slug: pasta-al-limone)."),
+        ],
+    },
+    "recipe_to_list": {
+        "prompt": "Add the ingredients of Pasta al Limone to my Einkaufsliste",
+        "supervisor": [
+            AIMessage("", tool_calls=[tool_call("mealie_recipes", {"query": "Ingredients for Pasta al Limone"}, "s1")]),
+            AIMessage("", tool_calls=[tool_call("bring_shopping", {"query": "Add ingredients to Einkaufsliste"}, "s2")]),
+            AIMessage("Added the ingredients to your Einkaufsliste."),
+        ],
+        "mealie": [
+            AIMessage("", tool_calls=[tool_call("search_recipes", {"query": "Pasta al Limone"}, "m1")]),
+            AIMessage("", tool_calls=[tool_call("get_recipe_ingredients", {"recipe_slug": "pasta-al-limone"}, "m2")]),
+            AIMessage("\n".join(INGREDIENTS)),
+        ],
+        "bring": [
+            AIMessage(
+                "",
+                tool_calls=[
+                    tool_call(
+                        "add_to_shopping_list",
+                        {"list_name": "Einkaufsliste", "items": ["Spaghetti", "Zitrone", "Parmesan", "Butter"]},
+                        "b1",
+                    )
+                ],
+            ),
+            AIMessage("Added 4 items."),
+        ],
+    },
+    "parallel_mixed": {
+        "prompt": "Find a pasta recipe and show my Einkaufsliste",
+        "supervisor": [
+            AIMessage(
+                "",
+                tool_calls=[
+                    tool_call("mealie_recipes", {"query": "Find a pasta recipe"}, "s1"),
+                    tool_call("bring_shopping", {"query": "Show the Einkaufsliste"}, "s2"),
+                ],
+            ),
+            AIMessage("Here is a pasta recipe and your Einkaufsliste."),
+        ],
+        "mealie": [
+            AIMessage("", tool_calls=[tool_call("search_recipes", {"query": "pasta"}, "m1")]),
+            AIMessage("Found Pasta al Limone."),
+        ],
+        "bring": [
+            AIMessage("", tool_calls=[tool_call("view_shopping_list", {"list_name": "Einkaufsliste"}, "b1")]),
+            AIMessage("Milch, Eier, Brot, Butter"),
+        ],
+    },
+}
+
+_scenario: ContextVar[str] = ContextVar("benchmark_scenario")
+
+
+def scripted_model_factory(llm_latency: float) -> Callable[[str], ScriptedChatModel]:
+    """Create chat models that replay the current scenario's script for ``agent``."""
+
+    def factory(agent: str) -> ScriptedChatModel:
+        script = SCENARIOS[_scenario.get("search")].get(agent, [AIMessage("ok")])
+        return ScriptedChatModel.from_script(script, latency=llm_latency)
+
+    return factory
+
+
+async def start_fakes(args: argparse.Namespace) -> tuple[web.AppRunner, FakeMealie, FakeBring]:
+    """Serve the fake Mealie and Bring apps on one local port."""
+    mealie, bring = FakeMealie(latency=args.service_latency), FakeBring(latency=args.service_latency)
+    app = web.Application()
+    app.add_subapp("/mealie/", mealie.app())
+    app.add_subapp("/bring/", bring.app())
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+
+    settings = get_settings()
+    settings.mealie_url = f"http://{host}:{port}/mealie"
+    settings.bring_api_url = f"http://{host}:{port}/bring/rest/"
+    return runner, mealie, bring
+
+
+async def run_turn(scenario: str, tracker: UsageTracker) -> TurnStats:
+    """Run one scenario turn with a fresh agent."""
+    _scenario.set(scenario)
+    agent = create_cooking_agent("supervisor")
+    await run_agent_async(SCENARIOS[scenario]["prompt"], agent, tracker)
+    return tracker.turns[-1]
+
+
+async def run_session(turns: int, tracker: UsageTracker) -> None:
+    """Run ``turns`` turns cycling through all scenarios."""
+    names = list(SCENARIOS)
+    for i in range(turns):
+        # Each turn runs in its own task so the scenario context stays isolated.
+        await asyncio.create_task(run_turn(names[i % len(names)], tracker))
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+def scenario_report(turns: list[TurnStats]) -> dict[str, Any]:
+    """Aggregate latency, HTTP and LLM calls per scenario."""
+    prompts = {s["prompt"]: name for name, s in SCENARIOS.items()}
+    report = {}
+    for name in SCENARIOS:
+        rows = [t for t in turns if prompts[t.prompt] == name]
+        latencies = [t.duration_s * 1000 for t in rows]
+        clients = sorted({c for t in rows for c in t.http})
+        report[name] = {
+            "turns": len(rows),
+            "latency_ms": {
+                "p50": round(statistics.median(latencies), 2),
+                "p95": round(percentile(latencies, 0.95), 2),
+                "max": round(max(latencies), 2),
+            },
+            "http_calls_per_turn": {
+                c: round(statistics.mean(t.http[c].calls if c in t.http else 0 for t in rows), 2)
+                for c in clients
+            },
+            "llm_calls_per_turn": round(statistics.mean(t.totals()["llm_calls"] for t in rows), 2),
+        }
+    return report
+
+
+async def measure_memory() -> dict[str, Any]:
+    """Trace allocations of one pass over all scenarios."""
+    tracker = UsageTracker()
+    await run_session(len(SCENARIOS), tracker)  # warm up imports and caches
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    await run_session(len(SCENARIOS), tracker)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    diff = after.compare_to(before, "filename")
+    return {
+        "turns": len(SCENARIOS),
+        "peak_kib": round(peak / 1024, 1),
+        "allocated_blocks_per_turn": round(sum(max(d.count_diff, 0) for d in diff) / len(SCENARIOS)),
+        "retained_kib": round(sum(d.size_diff for d in diff) / 1024, 1),
+    }
+
+
+def git_revision() -> str | None:
+    """Current git commit, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the whole benchmark and build the report."""
+    set_chat_model_factory(scripted_model_factory(args.llm_latency))
+    runner, mealie, bring = await start_fakes(args)
+    try:
+        trackers = [UsageTracker() for _ in range(args.sessions)]
+        start = time.perf_counter()
+        await asyncio.gather(*(run_session(args.turns, tracker) for tracker in trackers))
+        wall = time.perf_counter() - start
+        turns = [turn for tracker in trackers for turn in tracker.turns]
+        requests = {"mealie": mealie.requests, "bring": bring.requests}
+
+        memory = await measure_memory()
+    finally:
+        await runner.cleanup()
+        set_chat_model_factory(None)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": vars(args) | {"output": str(args.output) if args.output else None, "compare": None},
+        },
+        "scenarios": scenario_report(turns),
+        "throughput": {
+            "sessions": args.sessions,
+            "turns": len(turns),
+            "wall_s": round(wall, 3),
+            "turns_per_s": round(len(turns) / wall, 2),
+            "server_requests": requests,
+        },
+        "memory": memory,
+    }
+
+
+def compare(old: dict[str, Any], new: dict[str, Any]) -> None:
+    """Print relative changes of the headline metrics."""
+
+    def row(label: str, before: float, after: float) -> None:
+        change = (after - before) / before if before else 0.0
+        print(f"{label:<45} {before:>10} → {after:<10} ({change:+.1%})")
+
+    for name, scenario in new["scenarios"].items():
+        if name not in old["scenarios"]:
+            continue
+        previous = old["scenarios"][name]
+        row(f"{name} p50 latency (ms)", previous["latency_ms"]["p50"], scenario["latency_ms"]["p50"])
+        for client, calls in scenario["http_calls_per_turn"].items():
+            row(f"{name} {client} HTTP calls/turn", previous["http_calls_per_turn"].get(client, 0), calls)
+    row("throughput (turns/s)", old["throughput"]["turns_per_s"], new["throughput"]["turns_per_s"])
+    row("memory peak (KiB)", old["memory"]["peak_kib"], new["memory"]["peak_kib"])
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=4, help="Concurrent sessions")
+    parser.add_argument("--turns", type=int, default=6, help="Turns per session")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Simulated latency per LLM call (s)")
+    parser.add_argument("--service-latency", type=float, default=0.005, help="Fake server latency per request (s)")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file")
+    parser.add_argument("--compare", type=Path, help="Compare against a previous JSON report")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark and print or write the report."""
+    args = parse_args()
+    report = asyncio.run(run(args))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.compare:
+        compare(json.loads(args.compare.read_text()), report)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
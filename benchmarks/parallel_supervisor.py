@@ -0,0 +1,101 @@
+"""Benchmark sequential vs. parallel delegation in the supervisor graph.
+
+Simulates "find a pasta recipe and show my Einkaufsliste": one Mealie and one
+Bring sub-task with no dependency between them. Delegating tools are replaced
+by stand-ins that sleep for a typical sub-agent latency, and the supervisor LLM
+is a scripted fake, so the numbers only reflect graph scheduling.
+
+    uv run python -m benchmarks.parallel_supervisor
+"""
+
+import argparse
+import asyncio
+
+from langchain.agents import create_agent
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+from benchmarks.common import ScriptedChatModel, Timer, tool_call
+from cooking_agent.supervisor import SUPERVISOR_SYSTEM_PROMPT
+
+
+def build_tools(mealie_latency: float, bring_latency: float) -> list:
+    """Create stand-ins for the delegating tools with fixed latency."""
+
+    @tool
+    async def mealie_recipes(query: str) -> str:
+        """Interact with Mealie recipes using natural language."""
+        await asyncio.sleep(mealie_latency)
+        return "Found 1 recipe: Pasta al Limone (slug: pasta-al-limone)"
+
+    @tool
+    async def bring_shopping(query: str) -> str:
+        """Interact with the Bring shopping list using natural language."""
+        await asyncio.sleep(bring_latency)
+        return "Items on 'Einkaufsliste': Milch, Eier"
+
+    return [mealie_recipes, bring_shopping]
+
+
+def sequential_script() -> list[AIMessage]:
+    """One delegation per model response, as the old prompt enforced."""
+    return [
+        AIMessage("", tool_calls=[tool_call("mealie_recipes", {"query": "pasta"}, "1")]),
+        AIMessage("", tool_calls=[tool_call("bring_shopping", {"query": "Einkaufsliste"}, "2")]),
+        AIMessage("Here is a pasta recipe and your Einkaufsliste."),
+    ]
+
+
+def parallel_script() -> list[AIMessage]:
+    """Both independent delegations in a single model response."""
+    return [
+        AIMessage(
+            "",
+            tool_calls=[
+                tool_call("mealie_recipes", {"query": "pasta"}, "1"),
+                tool_call("bring_shopping", {"query": "Einkaufsliste"}, "2"),
+            ],
+        ),
+        AIMessage("Here is a pasta recipe and your Einkaufsliste."),
+    ]
+
+
+async def run_once(script: list[AIMessage], args: argparse.Namespace) -> float:
+    """Run one supervisor turn and return its wall-clock time."""
+    agent = create_agent(
+        ScriptedChatModel.from_script(script, latency=args.llm_latency),
+        tools=build_tools(args.mealie_latency, args.bring_latency),
+        system_prompt=SUPERVISOR_SYSTEM_PROMPT,
+    )
+    with Timer() as timer:
+        await agent.ainvoke(
+            {"messages": [{"role": "user", "content": "Find a pasta recipe and show my Einkaufsliste"}]}
+        )
+    return timer.elapsed
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run both variants and print the comparison."""
+    results = {}
+    for name, script in (("sequential", sequential_script), ("parallel", parallel_script)):
+        timings = [await run_once(script(), args) for _ in range(args.repeat)]
+        results[name] = min(timings)
+
+    saved = results["sequential"] - results["parallel"]
+    print(f"sequential: {results['sequential']:.3f}s")
+    print(f"parallel:   {results['parallel']:.3f}s")
+    print(f"saved:      {saved:.3f}s ({saved / results['sequential']:.0%})")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--llm-latency", type=float, default=0.6, help="Supervisor LLM latency (s)")
+    parser.add_argument("--mealie-latency", type=float, default=2.0, help="Mealie sub-agent latency (s)")
+    parser.add_argument("--bring-latency", type=float, default=1.5, help="Bring sub-agent latency (s)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant (best is reported)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
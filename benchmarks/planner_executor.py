@@ -0,0 +1,194 @@
+"""Benchmark the planner/executor mode against the supervisor hierarchy.
+
+Scenario: "add the ingredients of a pasta recipe to my Einkaufsliste". The
+supervisor path delegates to scripted Mealie and Bring sub-agents; the planner
+path makes one planning call, runs the plan against stand-in clients and makes
+one summary call. All LLM and HTTP latencies are simulated.
+
+    uv run python -m benchmarks.planner_executor
+"""
+
+import argparse
+import asyncio
+
+from langchain.agents import create_agent
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+from benchmarks.common import LLMCallCounter, ScriptedChatModel, Timer, tool_call
+from cooking_agent.bring.client import ShoppingList
+from cooking_agent.mealie.client import Ingredient, MealieClient, Recipe, RecipeSummary
+from cooking_agent.planner import PlanExecutor, PlannerAgent
+from cooking_agent.supervisor import SUPERVISOR_SYSTEM_PROMPT
+
+REQUEST = "Add the ingredients of a pasta recipe to my Einkaufsliste"
+RECIPE = Recipe(
+    slug="pasta-al-limone",
+    name="Pasta al Limone",
+    description=None,
+    ingredients=[
+        Ingredient(note="", quantity=400, unit="g", food="Spaghetti"),
+        Ingredient(note="", quantity=2, unit=None, food="Zitronen"),
+        Ingredient(note="", quantity=100, unit="g", food="Parmesan"),
+    ],
+    instructions=["Cook pasta", "Mix with lemon and cheese"],
+)
+
+
+class StubMealie:
+    """Stand-in for MealieClient with fixed latency."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    async def search_recipes(self, query: str | None = None, limit: int = 10) -> list[RecipeSummary]:
+        await asyncio.sleep(self.latency)
+        return [RecipeSummary(slug=RECIPE.slug, name=RECIPE.name)]
+
+    async def get_recipe(self, slug: str) -> Recipe:
+        await asyncio.sleep(self.latency)
+        return RECIPE
+
+    async def get_recipe_ingredients(self, slug: str) -> list[str]:
+        return MealieClient.format_ingredients(await self.get_recipe(slug))
+
+
+class StubBring:
+    """Stand-in for BringClient with fixed latency."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.lists = [ShoppingList(uuid="list-1", name="Einkaufsliste")]
+
+    async def get_shopping_lists(self) -> list[ShoppingList]:
+        await asyncio.sleep(self.latency)
+        return self.lists
+
+    async def get_list_by_name(self, name: str) -> ShoppingList | None:
+        lists = await self.get_shopping_lists()
+        return next((lst for lst in lists if lst.name.lower() == name.lower()), None)
+
+    async def add_items(self, list_uuid: str, items: list[str]) -> None:
+        await asyncio.sleep(self.latency)
+
+
+async def run_supervisor(args: argparse.Namespace, counter: LLMCallCounter) -> None:
+    """Supervisor → sub-agent → tool, as in create_supervisor_agent."""
+    mealie, bring = StubMealie(args.http_latency), StubBring(args.http_latency)
+    ingredients = MealieClient.format_ingredients(RECIPE)
+
+    @tool
+    async def search_recipes(query: str) -> str:
+        """Search recipes."""
+        return str(await mealie.search_recipes(query))
+
+    @tool
+    async def get_recipe_ingredients(recipe_slug: str) -> str:
+        """Get ingredients."""
+        return "\n".join(await mealie.get_recipe_ingredients(recipe_slug))
+
+    @tool
+    async def add_to_shopping_list(list_name: str, items: list[str]) -> str:
+        """Add items."""
+        lst = await bring.get_list_by_name(list_name)
+        await bring.add_items(lst.uuid, items)
+        return f"Added {len(items)} items"
+
+    def sub_agent(tools: list, script: list[AIMessage]):
+        model = ScriptedChatModel.from_script(script, latency=args.llm_latency)
+        return create_agent(model, tools=tools)
+
+    @tool
+    async def mealie_recipes(query: str) -> str:
+        """Interact with Mealie recipes using natural language."""
+        agent = sub_agent(
+            [search_recipes, get_recipe_ingredients],
+            [
+                AIMessage("", tool_calls=[tool_call("search_recipes", {"query": "pasta"}, "m1")]),
+                AIMessage("", tool_calls=[tool_call("get_recipe_ingredients", {"recipe_slug": RECIPE.slug}, "m2")]),
+                AIMessage("\n".join(ingredients)),
+            ],
+        )
+        result = await agent.ainvoke({"messages": [{"role": "user", "content": query}]}, {"callbacks": [counter]})
+        return result["messages"][-1].text
+
+    @tool
+    async def bring_shopping(query: str) -> str:
+        """Interact with the Bring shopping list using natural language."""
+        agent = sub_agent(
+            [add_to_shopping_list],
+            [
+                AIMessage("", tool_calls=[tool_call("add_to_shopping_list", {"list_name": "Einkaufsliste", "items": ingredients}, "b1")]),
+                AIMessage("Added the items."),
+            ],
+        )
+        result = await agent.ainvoke({"messages": [{"role": "user", "content": query}]}, {"callbacks": [counter]})
+        return result["messages"][-1].text
+
+    supervisor = create_agent(
+        ScriptedChatModel.from_script(
+            [
+                AIMessage("", tool_calls=[tool_call("mealie_recipes", {"query": "pasta ingredients"}, "s1")]),
+                AIMessage("", tool_calls=[tool_call("bring_shopping", {"query": "add ingredients"}, "s2")]),
+                AIMessage("Done."),
+            ],
+            latency=args.llm_latency,
+        ),
+        tools=[mealie_recipes, bring_shopping],
+        system_prompt=SUPERVISOR_SYSTEM_PROMPT,
+    )
+    await supervisor.ainvoke({"messages": [{"role": "user", "content": REQUEST}]}, {"callbacks": [counter]})
+
+
+async def run_planner(args: argparse.Namespace, counter: LLMCallCounter) -> None:
+    """One planning call, local execution, one summary call."""
+    plan_message = AIMessage(
+        "",
+        tool_calls=[
+            tool_call(
+                "Plan",
+                {
+                    "steps": [
+                        {"id": "s1", "operation": "search_recipes", "args": {"query": "pasta"}},
+                        {"id": "s2", "operation": "get_recipe_ingredients", "args": {"slug": "$s1"}, "depends_on": ["s1"]},
+                        {
+                            "id": "s3",
+                            "operation": "add_to_shopping_list",
+                            "args": {"list_name": "Einkaufsliste", "items": "$s2"},
+                            "depends_on": ["s2"],
+                        },
+                    ]
+                },
+                "p1",
+            )
+        ],
+    )
+    model = ScriptedChatModel.from_script([plan_message, AIMessage("Done.")], latency=args.llm_latency)
+    model.callbacks = [counter]
+    agent = PlannerAgent(model)
+
+    plan = await agent.plan(REQUEST)
+    executor = PlanExecutor(StubMealie(args.http_latency), StubBring(args.http_latency))
+    results = await executor.execute(plan)
+    await agent.summarize(REQUEST, plan, results)
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run both modes and print LLM calls and wall-clock time."""
+    for name, runner in (("supervisor", run_supervisor), ("planner", run_planner)):
+        counter = LLMCallCounter()
+        with Timer() as timer:
+            await runner(args, counter)
+        print(f"{name:<11} llm_calls={counter.calls}  wall={timer.elapsed:.3f}s")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--llm-latency", type=float, default=0.8, help="Latency per LLM call (s)")
+    parser.add_argument("--http-latency", type=float, default=0.1, help="Latency per API call (s)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
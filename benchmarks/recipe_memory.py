@@ -0,0 +1,85 @@
+"""Benchmark the memory needed to keep a large recipe collection in memory.
+
+Decodes synthetic Mealie responses and keeps every recipe alive as:
+
+- ``legacy``: the previous ``__dict__`` dataclasses with one string per field
+- ``models``: the current slotted, frozen models with interned foods and units
+- ``collection``: a columnar ``RecipeCollection``
+
+    uv run python -m benchmarks.recipe_memory --recipes 50000
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.decoding import legacy_decode
+from benchmarks.fake_mealie import SyntheticRecipes
+from cooking_agent.mealie.client import parse_recipe
+from cooking_agent.mealie.collection import RecipeCollection
+
+
+def bodies(n: int) -> list[bytes]:
+    """Render ``n`` synthetic recipe response bodies."""
+    recipes = SyntheticRecipes(n)
+    return [json.dumps(recipes.render(i), ensure_ascii=False).encode() for i in range(n)]
+
+
+def build_legacy(bodies: list[bytes]) -> Any:
+    return [legacy_decode(body) for body in bodies]
+
+
+def build_models(bodies: list[bytes]) -> Any:
+    return [parse_recipe(json.loads(body)) for body in bodies]
+
+
+def build_collection(bodies: list[bytes]) -> Any:
+    return RecipeCollection(parse_recipe(json.loads(body)) for body in bodies)
+
+
+def measure(build: Callable[[list[bytes]], Any], bodies: list[bytes]) -> dict[str, float]:
+    """Build time and memory retained by the result of ``build(bodies)``."""
+    start = time.perf_counter()
+    build(bodies)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    result = build(bodies)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {
+        "retained_mib": round(retained / 2**20, 1),
+        "bytes_per_recipe": round(retained / len(bodies)),
+        "build_s": round(elapsed, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recipes", type=int, default=50_000)
+    args = parser.parse_args()
+
+    payloads = bodies(args.recipes)
+    results = {
+        "legacy": measure(build_legacy, payloads),
+        "models": measure(build_models, payloads),
+        "collection": measure(build_collection, payloads),
+    }
+    baseline = results["legacy"]["retained_mib"]
+    for name, result in results.items():
+        share = result["retained_mib"] / baseline if baseline else 0.0
+        print(
+            f"{name:>10}: {result['retained_mib']:>7} MiB retained ({share:.0%}), "
+            f"{result['bytes_per_recipe']:>6} B/recipe, built in {result['build_s']} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
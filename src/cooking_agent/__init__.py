@@ -1,13 +1,28 @@
-"""Cooking Agent - Multi-agent system for recipe and shopping list management."""
+"""Cooking Agent - Multi-agent system for recipe and shopping list management.
 
-from cooking_agent.supervisor import create_supervisor_agent
-from cooking_agent.bring import BringClient
-from cooking_agent.mealie import MealieClient
+Public names are imported on first access, so using only the API clients does
+not load LangChain, LangGraph or the Bring library.
+"""
+
+from typing import TYPE_CHECKING
+
+from cooking_agent._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from cooking_agent.bring import BringClient
+    from cooking_agent.flat import create_flat_agent
+    from cooking_agent.mealie import MealieClient
+    from cooking_agent.modes import create_cooking_agent
+    from cooking_agent.planner import create_planner_agent
+    from cooking_agent.supervisor import create_supervisor_agent
 
 __version__ = "0.1.0"
 
-__all__ = [
-    "create_supervisor_agent",
-    "BringClient",
-    "MealieClient",
-]
+__getattr__, __dir__, __all__ = lazy_module(__name__, {
+    "create_supervisor_agent": "cooking_agent.supervisor",
+    "create_flat_agent": "cooking_agent.flat",
+    "create_planner_agent": "cooking_agent.planner",
+    "create_cooking_agent": "cooking_agent.modes",
+    "BringClient": "cooking_agent.bring.client",
+    "MealieClient": "cooking_agent.mealie.client",
+})
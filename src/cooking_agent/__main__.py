@@ -1,6 +1,6 @@
 """Entry point for python -m cooking_agent."""
 
-from cooking_agent.cli import run_cli
+from cooking_agent.cli import main
 
 if __name__ == "__main__":
-    run_cli()
+    main()
@@ -0,0 +1,41 @@
+"""Lazy imports of a package's public names.
+
+The packages re-export their clients, tools and agents, but importing the
+tools and agents loads LangChain. Their ``__init__`` modules therefore import
+public names only on first access (PEP 562):
+
+    __getattr__, __dir__, __all__ = lazy_module(__name__, {"MealieClient": "cooking_agent.mealie.client"})
+"""
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_module(
+    name: str, attributes: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    """Build the module ``__getattr__``, ``__dir__`` and ``__all__`` of a package.
+
+    Args:
+        name: The package's ``__name__``
+        attributes: Public names mapped to the modules defining them
+
+    Returns:
+        ``__getattr__``, ``__dir__`` and ``__all__`` for the package
+    """
+
+    def __getattr__(attribute: str) -> Any:
+        """Import public names on first access."""
+        module = attributes.get(attribute)
+        if module is None:
+            raise AttributeError(f"module {name!r} has no attribute {attribute!r}")
+        value = getattr(importlib.import_module(module), attribute)
+        setattr(sys.modules[name], attribute, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted([*vars(sys.modules[name]), *attributes])
+
+    return __getattr__, __dir__, list(attributes)
@@ -0,0 +1,152 @@
+"""Non-interactive batch runs of many prompts.
+
+Reads prompts from JSONL (one ``{"id": ..., "prompt": ...}`` object or one
+JSON string per line), runs them through one shared agent with a bounded
+number of concurrent workers and writes one JSON result per prompt as soon as
+it finishes: the answer or error, the latency and the LLM, token, tool and
+HTTP usage of the turn. All workers share the pooled clients and caches, which
+are warmed up before the first prompt.
+
+    python -m cooking_agent batch prompts.jsonl -o results.jsonl --workers 8
+"""
+
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from cooking_agent.cli import create_usage_tracker, run_agent_async
+from cooking_agent.warmup import build_agent, shut_down, warm_up
+
+
+@dataclass
+class BatchItem:
+    """One prompt of a batch, or the error of an unreadable input line."""
+
+    id: Any
+    prompt: str | None
+    error: str | None = None
+
+
+@dataclass
+class BatchSummary:
+    """Outcome of a batch run."""
+
+    total: int = 0
+    failed: int = 0
+    duration_s: float = 0.0
+    latencies_s: list[float] = field(default_factory=list)
+
+    def describe(self) -> str:
+        """One-line summary for the console."""
+        text = f"{self.total} prompts, {self.failed} failed in {self.duration_s:.1f}s"
+        if self.latencies_s:
+            p50 = statistics.median(self.latencies_s)
+            text += f" (latency p50 {p50:.2f}s, max {max(self.latencies_s):.2f}s)"
+        return text
+
+
+def read_items(lines: Iterable[str]) -> Iterator[BatchItem]:
+    """Parse JSONL input lines; blank lines are skipped.
+
+    Items without an ``id`` are numbered by their line number.
+    """
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield BatchItem(number, None, f"Invalid JSON: {e}")
+            continue
+        if isinstance(data, str):
+            data = {"prompt": data}
+        prompt = data.get("prompt") if isinstance(data, dict) else None
+        item_id = data.get("id", number) if isinstance(data, dict) else number
+        if not isinstance(prompt, str) or not prompt.strip():
+            yield BatchItem(item_id, None, "Missing prompt")
+        else:
+            yield BatchItem(item_id, prompt)
+
+
+async def run_item(item: BatchItem, agent: Any, timeout: float | None = None) -> dict[str, Any]:
+    """Run one prompt and describe the outcome as a JSON-serializable result."""
+    result: dict[str, Any] = {"id": item.id, "prompt": item.prompt, "answer": None, "error": item.error}
+    if item.prompt is None:
+        return result
+
+    tracker = create_usage_tracker()
+    try:
+        result["answer"] = await asyncio.wait_for(run_agent_async(item.prompt, agent, tracker), timeout)
+    except TimeoutError:
+        result["error"] = f"Timed out after {timeout}s"
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    turn = tracker.last_turn
+    if turn is not None:
+        result["latency_s"] = round(turn.duration_s, 3)
+        result.update({k: round(v, 3) if isinstance(v, float) else v for k, v in turn.totals().items()})
+        result["cost_usd"] = turn.cost_usd
+    return result
+
+
+async def run_batch(
+    items: Iterable[BatchItem],
+    agent: Any,
+    write: Callable[[dict[str, Any]], None],
+    workers: int = 4,
+    timeout: float | None = None,
+) -> BatchSummary:
+    """Run prompts with at most ``workers`` in flight and write each result when done.
+
+    Args:
+        items: Prompts to run; consumed lazily, so large inputs are not read
+            into memory at once
+        agent: Agent shared by all workers
+        write: Called with each result, in completion order
+        workers: Maximum concurrent prompts
+        timeout: Seconds after which a prompt is abandoned
+
+    Returns:
+        Counts and latencies of the run
+    """
+    summary = BatchSummary()
+    queue: asyncio.Queue[BatchItem | None] = asyncio.Queue(maxsize=workers * 2)
+    start = time.perf_counter()
+
+    async def worker() -> None:
+        while (item := await queue.get()) is not None:
+            result = await run_item(item, agent, timeout)
+            summary.total += 1
+            summary.failed += result["error"] is not None
+            if "latency_s" in result:
+                summary.latencies_s.append(result["latency_s"])
+            write(result)
+
+    tasks = [asyncio.create_task(worker()) for _ in range(max(workers, 1))]
+    for item in items:
+        await queue.put(item)
+    for _ in tasks:
+        await queue.put(None)
+    await asyncio.gather(*tasks)
+    summary.duration_s = time.perf_counter() - start
+    return summary
+
+
+async def run_batch_file(
+    input_lines: Iterable[str],
+    write: Callable[[dict[str, Any]], None],
+    workers: int = 4,
+    mode: str | None = None,
+    timeout: float | None = None,
+) -> BatchSummary:
+    """Warm up, build the agent and run the prompts of a JSONL input."""
+    agent, _ = await asyncio.gather(build_agent(mode), warm_up())
+    try:
+        return await run_batch(read_items(input_lines), agent, write, workers, timeout)
+    finally:
+        await shut_down()
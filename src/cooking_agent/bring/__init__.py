@@ -1,20 +1,29 @@
-"""Bring shopping list domain module."""
+"""Bring shopping list domain module.
 
-from cooking_agent.bring.client import BringClient, ShoppingList, ShoppingItem
-from cooking_agent.bring.tools import (
-    list_shopping_lists,
-    view_shopping_list,
-    add_to_shopping_list,
-)
-from cooking_agent.bring.agent import bring_shopping, create_bring_agent
+Names are imported on first access, so ``from cooking_agent.bring import
+BringClient`` does not load the LangChain tools and agent.
+"""
 
-__all__ = [
-    "BringClient",
-    "ShoppingList",
-    "ShoppingItem",
-    "list_shopping_lists",
-    "view_shopping_list",
-    "add_to_shopping_list",
-    "bring_shopping",
-    "create_bring_agent",
-]
+from typing import TYPE_CHECKING
+
+from cooking_agent._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from cooking_agent.bring.agent import bring_shopping, create_bring_agent
+    from cooking_agent.bring.client import BringClient, ShoppingItem, ShoppingList
+    from cooking_agent.bring.tools import (
+        add_to_shopping_list,
+        list_shopping_lists,
+        view_shopping_list,
+    )
+
+__getattr__, __dir__, __all__ = lazy_module(__name__, {
+    "BringClient": "cooking_agent.bring.client",
+    "ShoppingList": "cooking_agent.bring.client",
+    "ShoppingItem": "cooking_agent.bring.client",
+    "list_shopping_lists": "cooking_agent.bring.tools",
+    "view_shopping_list": "cooking_agent.bring.tools",
+    "add_to_shopping_list": "cooking_agent.bring.tools",
+    "bring_shopping": "cooking_agent.bring.agent",
+    "create_bring_agent": "cooking_agent.bring.agent",
+})
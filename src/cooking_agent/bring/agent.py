@@ -1,11 +1,13 @@
 """Bring shopping list agent using LangGraph."""
 
 from langchain.agents import create_agent
-from langchain.chat_models import init_chat_model
 from langchain.tools import tool
 
 
-from cooking_agent.config import get_settings
+from cooking_agent.escalation import escalation_middleware
+from cooking_agent.instrumentation import usage_handler
+from cooking_agent.llm import create_chat_model, ordered_tools, shared_agent
+from cooking_agent.tracing import traced
 from cooking_agent.bring.tools import (
     list_shopping_lists,
     view_shopping_list,
@@ -25,21 +27,27 @@ When users want to manage shopping:
 2. Use view_shopping_list to see current items
 3. Use add_to_shopping_list to add new items
 
-When adding items from a recipe, extract the key ingredient names (e.g., "chicken", "garlic", "olive oil") rather than full descriptions with quantities.
+When adding items from a recipe, pass the ingredient lines as they are (e.g., "400 g Spaghetti", "2 Zwiebeln"); they are mapped to Bring catalog items with the amount as specification.
 
 Be helpful and confirm actions you've taken."""
 
 
 def create_bring_agent():
     bring_agent = create_agent(
-        init_chat_model(model=get_settings().model_name, api_key=get_settings().openai_api_key),
-        tools=[list_shopping_lists, view_shopping_list, add_to_shopping_list],
+        create_chat_model("bring"),
+        tools=ordered_tools([list_shopping_lists, view_shopping_list, add_to_shopping_list]),
         system_prompt=BRING_SYSTEM_PROMPT,
+        name="bring",
+        middleware=escalation_middleware("bring"),
     )
-    return bring_agent
+    return bring_agent.with_config(callbacks=[usage_handler])
+
+
+get_bring_agent = shared_agent(create_bring_agent)
 
 
 @tool
+@traced("agent.bring")
 async def bring_shopping(query: str) -> str:
     """Interact with the Bring shopping list using natural language.
     
@@ -48,7 +56,7 @@ async def bring_shopping(query: str) -> str:
     Args:
         query: Natural language query about shopping lists (e.g Add "100g pasta" to "Grocery List")
     """
-    bring_agent = create_bring_agent()
+    bring_agent = get_bring_agent()
     
     result = await bring_agent.ainvoke({"messages": [{"role": "user", "content": query}]})
     return result["messages"][-1].text
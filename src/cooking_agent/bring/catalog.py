@@ -0,0 +1,176 @@
+"""Mapping of ingredients to Bring catalog items.
+
+Bring shows icons, categories and translations only for items of its catalog,
+named in the list's article language ("Zwiebeln" on a German list). Recipes
+name foods freely ("Onion", "Zwiebel", "400 g Spaghetti"), so pushing them
+raw creates custom items, and asking the model to clean every name costs an
+LLM pass. ``BringCatalog`` maps them deterministically instead, using the
+article translations shipped with ``bring_api``: the food is looked up by
+normalized name (singular/plural, umlauts) in the list's language, the
+catalog's German ids and English, then fuzzily; amounts and unmatched words
+become the item's specification.
+"""
+
+import json
+import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import resources
+from typing import TYPE_CHECKING
+
+from bring_api.const import BRING_DEFAULT_LOCALE
+
+from cooking_agent.bring.matching import ITEM_THRESHOLD, best_match
+from cooking_agent.mealie.index import normalize_food
+
+if TYPE_CHECKING:
+    from cooking_agent.bring.client import BringClient, ShoppingList
+
+logger = logging.getLogger(__name__)
+
+# Languages foods are also looked up in, besides the list's language and the
+# (German) catalog ids: recipes are often written in English.
+ALIAS_LOCALES = ("en-US",)
+
+_UNITS = (
+    "g", "kg", "mg", "ml", "cl", "dl", "l", "el", "tl", "msp", "prise", "prisen", "stk", "stück",
+    "zehe", "zehen", "bund", "dose", "dosen", "pck", "packung", "päckchen", "becher", "glas",
+    "tasse", "tassen", "scheibe", "scheiben", "flasche", "flaschen", "rolle", "rollen", "beutel",
+    "kopf", "knolle", "knollen", "cup", "cups", "tbsp", "tsp", "oz", "lb", "lbs",
+    "can", "cans", "clove", "cloves", "pinch", "slice", "slices", "bunch", "piece", "pieces",
+)
+_AMOUNT = re.compile(
+    r"^\s*(?P<quantity>\d+(?:[.,]\d+)?(?:\s*[-–/]\s*\d+(?:[.,]\d+)?)?|[½¼¾⅓⅔])"
+    rf"\s*(?P<unit>(?:{'|'.join(sorted(_UNITS, key=len, reverse=True))})\b\.?)?\s*(?P<rest>.*)$",
+    re.IGNORECASE,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class CatalogItem:
+    """An item to add to a list."""
+
+    name: str
+    specification: str = ""
+    key: str | None = None  # Bring article id; None for custom items
+
+
+def split_amount(line: str) -> tuple[str, str]:
+    """Split a leading amount off an ingredient line.
+
+    "400 g Spaghetti" → ("400 g", "Spaghetti"), "2 Zitronen" → ("2", "Zitronen").
+    """
+    match = _AMOUNT.match(line)
+    if match is None or not match["rest"]:
+        return "", line.strip()
+    amount = " ".join(part for part in (match["quantity"], match["unit"]) if part)
+    return amount, match["rest"].strip()
+
+
+def _join(*parts: str) -> str:
+    return ", ".join(part for part in parts if part)
+
+
+class BringCatalog:
+    """Lookup of foods in the Bring catalog of one article language."""
+
+    def __init__(self, articles: dict[str, str], aliases: Iterable[dict[str, str]] = ()) -> None:
+        """Build the lookup tables.
+
+        Args:
+            articles: Catalog ids mapped to their names in the list's language
+            aliases: Further translations (catalog id → name) to look foods up in
+        """
+        self.articles = articles
+        self._keys: dict[str, str] = {}
+        # Later tables win: aliases, then the ids, then the list's own names.
+        for table in (*aliases, {key: key for key in articles}, articles):
+            for key, name in table.items():
+                if key in articles and (normalized := normalize_food(name)):
+                    self._keys[normalized] = key
+        self._by_initial: dict[str, list[str]] = {}
+        for normalized in self._keys:
+            self._by_initial.setdefault(normalized[0], []).append(normalized)
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def lookup(self, food: str) -> str | None:
+        """Catalog id of ``food``, matched exactly (normalized) or fuzzily."""
+        normalized = normalize_food(food)
+        if not normalized:
+            return None
+        if normalized in self._keys:
+            return self._keys[normalized]
+        match = best_match(normalized, self._by_initial.get(normalized[0], ()), ITEM_THRESHOLD)
+        return self._keys[match.name] if match is not None else None
+
+    def match(self, food: str, specification: str = "") -> CatalogItem:
+        """Map a food name to a catalog item.
+
+        If the whole name is not in the catalog, its words are tried from the
+        last; the remaining words are added to the specification ("Tomaten
+        passiert" → "Tomaten" with specification "passiert"). Foods not in the
+        catalog are returned unchanged as custom items.
+        """
+        food = food.strip()
+        if (key := self.lookup(food)) is not None:
+            return CatalogItem(self.articles[key], specification, key)
+        words = food.split()
+        if len(words) > 1:
+            for i in reversed(range(len(words))):
+                if (key := self._keys.get(normalize_food(words[i]))) is not None:
+                    rest = " ".join(words[:i] + words[i + 1:])
+                    return CatalogItem(self.articles[key], _join(specification, rest), key)
+        return CatalogItem(food, specification)
+
+    def parse(self, line: str) -> CatalogItem:
+        """Map an ingredient line such as "400 g Spaghetti, gekocht" to a catalog item."""
+        amount, rest = split_amount(line)
+        food, _, note = rest.partition(",")
+        return self.match(food, _join(amount, note.strip()))
+
+
+def _load_articles(locale: str) -> dict[str, str]:
+    """Article translations of ``locale`` shipped with ``bring_api`` (empty if missing)."""
+    try:
+        text = (resources.files("bring_api") / "locales" / f"articles.{locale}.json").read_text("utf-8")
+    except (FileNotFoundError, ModuleNotFoundError):
+        logger.warning("No Bring article translations for locale %s", locale)
+        return {}
+    # Skip the section headings ("Milch & Käse"), which are not items.
+    return {key: name for key, name in json.loads(text).items() if "&" not in key}
+
+
+@lru_cache(maxsize=8)
+def get_catalog(locale: str = BRING_DEFAULT_LOCALE) -> BringCatalog:
+    """Get the catalog of an article language, loaded once per language."""
+    articles = _load_articles(locale)
+    if not articles and locale != BRING_DEFAULT_LOCALE:
+        return get_catalog(BRING_DEFAULT_LOCALE)
+    aliases = [_load_articles(alias) for alias in ALIAS_LOCALES if alias != locale]
+    return BringCatalog(articles, aliases)
+
+
+async def add_ingredients(client: "BringClient", lst: "ShoppingList", lines: list[str]) -> list[CatalogItem]:
+    """Add ingredient lines to a list as catalog items with specifications.
+
+    Names are also spelled like matching items already on the list (see
+    ``BringClient.resolve_item_names``).
+
+    Returns:
+        The items added
+    """
+    catalog = get_catalog(client.list_locale(lst.uuid))
+    parsed = [catalog.parse(line) for line in lines]
+    names = await client.resolve_item_names(lst.uuid, [item.name for item in parsed])
+    items = [CatalogItem(name, item.specification, item.key) for name, item in zip(names, parsed)]
+    await client.add_items(lst.uuid, [(i.name, i.specification) if i.specification else i.name for i in items])
+    return items
+
+
+def describe_items(items: Iterable[CatalogItem]) -> str:
+    """Comma-separated item names with their specifications."""
+    return ", ".join(f"{i.name} ({i.specification})" if i.specification else i.name for i in items)
@@ -1,10 +1,20 @@
 """Async Bring shopping list client wrapper."""
 
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TypeVar
 
 import aiohttp
 from bring_api import Bring, BringItemOperation
+from yarl import URL
+
+from cooking_agent.bring.matching import ITEM_THRESHOLD, LIST_THRESHOLD, best_match
+from cooking_agent.ratelimit import RateLimiter
+from cooking_agent.singleflight import SingleFlight
+from cooking_agent.stats import aiohttp_trace_config
+from cooking_agent.tracing import aiohttp_tracing_config
 
 
 @dataclass
@@ -23,32 +33,80 @@ class ShoppingItem:
     specification: str | None = None
 
 
+T = TypeVar("T")
+
+# Seconds shopping lists are cached; lists are rarely created or renamed.
+LISTS_TTL = 300.0
+
+# Concurrent identical reads of all clients share one request (see singleflight).
+_inflight = SingleFlight()
+
+
 class BringClient:
-    """Async wrapper around the bring-api library."""
+    """Async wrapper around the bring-api library.
 
-    def __init__(self, email: str, password: str) -> None:
+    The client may be entered by several tasks at once (e.g. when shared via
+    ``cooking_agent.pool``): it logs in on the first entry and closes its
+    session when the last one exits. Shopping lists are cached for
+    ``LISTS_TTL`` seconds.
+    """
+
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        api_url: str | None = None,
+        limiter: RateLimiter | None = None,
+    ) -> None:
         """Initialize the Bring client.
 
         Args:
             email: Bring account email
             password: Bring account password
+            api_url: Override of the Bring REST base URL (e.g. a local stand-in)
+            limiter: Rate limiter shared with the other clients of the account
+                (unlimited if None)
         """
         self.email = email
         self.password = password
+        self.api_url = api_url
+        self.limiter = limiter if limiter is not None else RateLimiter()
         self._session: aiohttp.ClientSession | None = None
         self._bring: Bring | None = None
+        self._login: asyncio.Task[None] | None = None
+        self._users = 0
+        self._lists: tuple[float, list[ShoppingList]] | None = None
 
     async def __aenter__(self) -> "BringClient":
         """Enter async context and login."""
-        self._session = aiohttp.ClientSession()
-        self._bring = Bring(self._session, self.email, self.password)
-        await self._bring.login()
+        self._users += 1
+        if self._login is None:
+            self._login = asyncio.get_running_loop().create_task(self._open())
+        try:
+            await asyncio.shield(self._login)
+        except BaseException:
+            await self.__aexit__()
+            raise
         return self
 
+    async def _open(self) -> None:
+        self._session = aiohttp.ClientSession(
+            trace_configs=[aiohttp_trace_config("bring"), aiohttp_tracing_config("bring")]
+        )
+        self._bring = Bring(self._session, self.email, self.password)
+        if self.api_url:
+            self._bring.url = URL(self.api_url.rstrip("/") + "/")
+        async with self.limiter.slot():
+            await self._bring.login()
+
     async def __aexit__(self, *args: Any) -> None:
         """Exit async context."""
-        if self._session:
-            await self._session.close()
+        self._users -= 1
+        if self._users == 0:
+            session, self._session, self._bring, self._login = self._session, None, None, None
+            self._lists = None
+            if session:
+                await session.close()
 
     @property
     def bring(self) -> Bring:
@@ -57,17 +115,44 @@ class BringClient:
             raise RuntimeError("BringClient must be used as async context manager")
         return self._bring
 
-    async def get_shopping_lists(self) -> list[ShoppingList]:
+    def _flight_key(self, endpoint: str, *params: Any) -> tuple[Any, ...]:
+        """Key under which identical concurrent reads are shared."""
+        return (type(self).__name__, self.api_url, self.email, endpoint, *params)
+
+    async def _get_list(self, list_uuid: str) -> Any:
+        """Load a list's items, sharing concurrent loads of the same list."""
+        return await _inflight.do(
+            self._flight_key("list", list_uuid), lambda: self._limited(self.bring.get_list, list_uuid)
+        )
+
+    async def _limited(self, method: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """Call a Bring API method within the rate limit."""
+        async with self.limiter.slot():
+            return await method(*args)
+
+    async def get_shopping_lists(self, refresh: bool = False) -> list[ShoppingList]:
         """Get all available shopping lists.
 
+        Args:
+            refresh: Reload the lists even if they are cached
+
         Returns:
             List of shopping lists
         """
-        result = await self.bring.load_lists()
-        return [
+        if not refresh and self._lists is not None and time.monotonic() - self._lists[0] < LISTS_TTL:
+            return list(self._lists[1])
+        result = await _inflight.do(self._flight_key("lists"), lambda: self._limited(self.bring.load_lists))
+        lists = [
             ShoppingList(uuid=lst.listUuid, name=lst.name)
             for lst in result.lists
         ]
+        self._lists = (time.monotonic(), lists)
+        return list(lists)
+
+    def list_locale(self, list_uuid: str) -> str:
+        """Article language of a list (e.g. "de-DE"), in which item names are read and written."""
+        settings = self.bring.user_list_settings.get(list_uuid, {})
+        return settings.get("listArticleLanguage", self.bring.user_locale)
 
     async def get_list_items(self, list_uuid: str) -> list[ShoppingItem]:
         """Get items from a shopping list.
@@ -78,7 +163,7 @@ class BringClient:
         Returns:
             List of items currently on the list
         """
-        result = await self.bring.get_list(list_uuid)
+        result = await self._get_list(list_uuid)
         return [
             ShoppingItem(
                 name=item.itemId,
@@ -87,6 +172,23 @@ class BringClient:
             for item in result.items.purchase
         ]
 
+    async def get_list_contents(
+        self, list_uuid: str
+    ) -> tuple[list[ShoppingItem], list[ShoppingItem]]:
+        """Get the items to buy and the recently bought items of a list.
+
+        Args:
+            list_uuid: UUID of the shopping list
+
+        Returns:
+            Items currently on the list and items recently bought from it
+        """
+        result = await self._get_list(list_uuid)
+        return (
+            [ShoppingItem(item.itemId, item.specification or None) for item in result.items.purchase],
+            [ShoppingItem(item.itemId, item.specification or None) for item in result.items.recently],
+        )
+
     async def add_items(
         self,
         list_uuid: str,
@@ -107,7 +209,8 @@ class BringClient:
                 batch_items.append({"itemId": item})
 
         if batch_items:
-            await self.bring.batch_update_list(
+            await self._limited(
+                self.bring.batch_update_list,
                 list_uuid,
                 batch_items,
                 BringItemOperation.ADD,
@@ -120,7 +223,8 @@ class BringClient:
             list_uuid: UUID of the shopping list
             item_name: Name of item to remove
         """
-        await self.bring.batch_update_list(
+        await self._limited(
+            self.bring.batch_update_list,
             list_uuid,
             {"itemId": item_name},
             BringItemOperation.REMOVE,
@@ -133,14 +237,20 @@ class BringClient:
             list_uuid: UUID of the shopping list
             item_name: Name of item to complete
         """
-        await self.bring.batch_update_list(
+        await self._limited(
+            self.bring.batch_update_list,
             list_uuid,
             {"itemId": item_name},
             BringItemOperation.COMPLETE,
         )
 
     async def get_list_by_name(self, name: str) -> ShoppingList | None:
-        """Find a shopping list by name.
+        """Find a shopping list by name, tolerating small misspellings.
+
+        Exact (case-insensitive) names win, in the cached lists or else in the
+        reloaded ones; only then is the closest reloaded list name taken if it
+        matches confidently (see ``matching``), so a list created since the
+        cache was filled is not shadowed by a similar older one.
 
         Args:
             name: Name of the shopping list
@@ -148,8 +258,34 @@ class BringClient:
         Returns:
             ShoppingList if found, None otherwise
         """
-        lists = await self.get_shopping_lists()
-        for lst in lists:
-            if lst.name.lower() == name.lower():
-                return lst
+        for refresh in (False, True):
+            lists = await self.get_shopping_lists(refresh)
+            for lst in lists:
+                if lst.name.lower() == name.lower():
+                    return lst
+        match = best_match(name, [lst.name for lst in lists], LIST_THRESHOLD)
+        if match is not None:
+            return next(lst for lst in lists if lst.name == match.name)
         return None
+
+    async def resolve_item_names(self, list_uuid: str, names: list[str]) -> list[str]:
+        """Spell item names like the matching items already on or recently bought from a list.
+
+        Adding "Kaese" when the list knows "Käse" would otherwise create a
+        second item without Bring's catalog icon.
+
+        Args:
+            list_uuid: UUID of the shopping list
+            names: Item names to add
+
+        Returns:
+            ``names`` with confidently matched names replaced by the list's
+            spelling
+        """
+        to_buy, recently = await self.get_list_contents(list_uuid)
+        known = list(dict.fromkeys(item.name for item in (*to_buy, *recently)))
+        resolved = []
+        for name in names:
+            match = best_match(name, known, ITEM_THRESHOLD)
+            resolved.append(match.name if match is not None else name)
+        return resolved
@@ -0,0 +1,105 @@
+"""Fuzzy matching of shopping list and item names.
+
+The model often gets names slightly wrong ("einkauf" for "Einkaufsliste",
+"Kaese" for "Käse"). Resolving them locally against the cached names saves the
+"not found" answer and the extra LLM round-trip to retry. Names are compared
+normalized (case, accents and umlaut spellings folded) by the best of three
+scores: prefix, token containment and edit distance. A match is only taken
+above a confidence threshold and when no other name scores about as well.
+"""
+
+import re
+import unicodedata
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Minimum scores to accept a match: list names are few and distinct, item
+# names many and short, so items need a closer match.
+LIST_THRESHOLD = 0.75
+ITEM_THRESHOLD = 0.9
+
+# A match is ambiguous if another name scores within this margin.
+AMBIGUITY_MARGIN = 0.05
+
+_FOLD = str.maketrans({"ß": "ss", "æ": "ae", "ø": "o", "œ": "oe"})
+_UMLAUT_SPELLINGS = re.compile(r"ae|oe|ue")
+
+
+@dataclass(slots=True, frozen=True)
+class NameMatch:
+    """A candidate name matching a query, with its score in [0, 1]."""
+
+    name: str
+    score: float
+
+
+@lru_cache(maxsize=4096)
+def normalize_name(name: str) -> str:
+    """Normalize a name for matching: lowercase, accents and umlauts folded, single spaces.
+
+    "Käse", "Kaese" and "kase" all normalize to "kase".
+    """
+    text = unicodedata.normalize("NFKD", name.casefold().translate(_FOLD))
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = _UMLAUT_SPELLINGS.sub(lambda m: m.group()[0], text)
+    return " ".join(re.findall(r"[a-z0-9]+", text))
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance between ``a`` and ``b``."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def similarity(query: str, name: str) -> float:
+    """Score how well ``query`` matches ``name`` (both normalized), 1.0 meaning equal."""
+    if query == name:
+        return 1.0
+    if not query or not name:
+        return 0.0
+    scores = [1 - edit_distance(query, name) / max(len(query), len(name))]
+
+    shorter, longer = sorted((query, name), key=len)
+    if len(shorter) >= 3 and longer.startswith(shorter):
+        # "einkauf" → "einkaufsliste", but not "butter" → "butterschmalz"
+        scores.append(0.6 + 0.4 * len(shorter) / len(longer))
+
+    query_words, name_words = set(query.split()), set(name.split())
+    common = query_words & name_words
+    if common and (common == query_words or common == name_words):
+        # "liste wg" → "wg liste", "liste" → "wg liste"
+        scores.append(0.75 + 0.2 * len(common) / len(query_words | name_words))
+    return max(scores)
+
+
+def best_match(query: str, names: Iterable[str], threshold: float) -> NameMatch | None:
+    """Find the name ``query`` most likely refers to.
+
+    Args:
+        query: Name as given, e.g. by the model
+        names: Known names to match against
+        threshold: Minimum score to accept
+
+    Returns:
+        The best matching name, or None if no name scores at least
+        ``threshold`` or another name scores almost as well
+    """
+    normalized = normalize_name(query)
+    ranked = sorted(
+        (NameMatch(name, similarity(normalized, normalize_name(name))) for name in names),
+        key=lambda m: m.score,
+        reverse=True,
+    )
+    if not ranked or ranked[0].score < threshold:
+        return None
+    if ranked[0].score < 1.0 and len(ranked) > 1 and ranked[0].score - ranked[1].score < AMBIGUITY_MARGIN:
+        return None
+    return ranked[0]
@@ -2,24 +2,20 @@
 
 from langchain_core.tools import tool
 
-from cooking_agent.bring.client import BringClient
-from cooking_agent.config import get_settings
-
-
-def _get_bring_client() -> BringClient:
-    """Get a configured Bring client."""
-    settings = get_settings()
-    return BringClient(settings.bring_email, settings.bring_password)
+from cooking_agent.bring.catalog import add_ingredients, describe_items
+from cooking_agent.pool import get_bring_client
+from cooking_agent.tracing import traced
 
 
 @tool
+@traced("tool.list_shopping_lists")
 async def list_shopping_lists() -> str:
     """List all available shopping lists.
 
     Returns:
         List of shopping list names and their UUIDs
     """
-    async with _get_bring_client() as client:
+    async with get_bring_client() as client:
         lists = await client.get_shopping_lists()
 
     if not lists:
@@ -33,6 +29,7 @@ async def list_shopping_lists() -> str:
 
 
 @tool
+@traced("tool.view_shopping_list")
 async def view_shopping_list(list_name: str) -> str:
     """View items currently on a shopping list.
 
@@ -42,7 +39,7 @@ async def view_shopping_list(list_name: str) -> str:
     Returns:
         List of items on the shopping list
     """
-    async with _get_bring_client() as client:
+    async with get_bring_client() as client:
         lst = await client.get_list_by_name(list_name)
         if not lst:
             lists = await client.get_shopping_lists()
@@ -52,9 +49,9 @@ async def view_shopping_list(list_name: str) -> str:
         items = await client.get_list_items(lst.uuid)
 
     if not items:
-        return f"Shopping list '{list_name}' is empty"
+        return f"Shopping list '{lst.name}' is empty"
 
-    lines = [f"Items on '{list_name}':"]
+    lines = [f"Items on '{lst.name}':"]
     for item in items:
         spec = f" ({item.specification})" if item.specification else ""
         lines.append(f"• {item.name}{spec}")
@@ -63,23 +60,27 @@ async def view_shopping_list(list_name: str) -> str:
 
 
 @tool
+@traced("tool.add_to_shopping_list")
 async def add_to_shopping_list(list_name: str, items: list[str]) -> str:
     """Add items to a shopping list.
 
+    Items are mapped to Bring catalog items; amounts and details become the
+    item's specification.
+
     Args:
         list_name: Name of the shopping list
-        items: List of item names to add
+        items: Items to add, as named or as ingredient lines (e.g. "400 g Spaghetti")
 
     Returns:
         Confirmation of items added
     """
-    async with _get_bring_client() as client:
+    async with get_bring_client() as client:
         lst = await client.get_list_by_name(list_name)
         if not lst:
             lists = await client.get_shopping_lists()
             available = ", ".join(l.name for l in lists)
             return f"Shopping list '{list_name}' not found. Available lists: {available}"
 
-        await client.add_items(lst.uuid, items)
+        added = await add_ingredients(client, lst, items)
 
-    return f"Added {len(items)} items to '{list_name}': {', '.join(items)}"
+    return f"Added {len(added)} items to '{lst.name}': {describe_items(added)}"
@@ -1,13 +1,27 @@
 """Interactive CLI for the cooking agent."""
 
+import argparse
 import asyncio
+import json
+import sys
+from concurrent.futures import Future
+from typing import Any
 
 from rich.console import Console
 from rich.markdown import Markdown
+from rich.markup import escape
 from rich.panel import Panel
 from rich.prompt import Prompt
+from rich.table import Table
 
-from cooking_agent.supervisor import create_supervisor_agent
+from cooking_agent.config import get_settings
+from cooking_agent.cooking import HELP as COOKING_HELP, CookingSession, CookingTimer, ring_when_done
+from cooking_agent.mealie.store import sync_recipe_store
+from cooking_agent.ratelimit import get_rate_limiter
+from cooking_agent.runtime import BackgroundLoop
+from cooking_agent.stats import TokenPrices, UsageTracker
+from cooking_agent.tracing import configure_tracing, span, tracer
+from cooking_agent.warmup import WarmupReport, build_agent, shut_down, warm_up
 
 
 console = Console()
@@ -21,7 +35,10 @@ def print_welcome() -> None:
             "[dim]Multi-agent assistant for recipes and shopping lists[/dim]\n\n"
             "Commands:\n"
             "  [cyan]quit[/cyan] or [cyan]exit[/cyan] - Exit the agent\n"
-            "  [cyan]help[/cyan] - Show example prompts\n",
+            "  [cyan]help[/cyan] - Show example prompts\n"
+            "  [cyan]stats[/cyan] - Show token, latency and HTTP usage\n"
+            "  [cyan]sync[/cyan] - Sync the local recipe store with Mealie\n"
+            "  [cyan]/cook <recipe>[/cyan] - Cook a recipe step by step\n",
             title="Welcome",
             border_style="green",
         )
@@ -46,61 +63,292 @@ def print_help() -> None:
     )
 
 
-async def run_agent_async(user_input: str, agent) -> str:
+def create_usage_tracker() -> UsageTracker:
+    """Create a usage tracker from the settings."""
+    settings = get_settings()
+    prices = None
+    if settings.input_token_price is not None and settings.output_token_price is not None:
+        prices = TokenPrices(
+            input=settings.input_token_price,
+            cached_input=(
+                settings.cached_input_token_price
+                if settings.cached_input_token_price is not None
+                else settings.input_token_price
+            ),
+            output=settings.output_token_price,
+        )
+    return UsageTracker(settings.stats_file, prices)
+
+
+def print_warmup(report: WarmupReport) -> None:
+    """Print the duration (or error) of each startup warm-up step."""
+    steps = [
+        f"{name} {'failed: ' + report.errors[name] if name in report.errors else f'{duration:.2f}s'}"
+        for name, duration in report.durations.items()
+    ]
+    console.print(f"[dim]Warm-up: {', '.join(steps)}[/dim]")
+
+
+def print_stats(tracker: UsageTracker, warmup: "Future[WarmupReport] | None" = None) -> None:
+    """Print usage of the last turn and totals of the session."""
+    if warmup is not None and warmup.done() and not warmup.cancelled() and warmup.exception() is None:
+        print_warmup(warmup.result())
+
+    turn = tracker.last_turn
+    if turn is None:
+        console.print("[dim]No turns yet.[/dim]")
+        return
+
+    table = Table(title=f"Last turn ({turn.duration_s:.2f}s)")
+    for column in ("Agent / tool", "Calls", "Latency", "In tokens", "Cached", "Out tokens"):
+        table.add_column(column, justify="left" if column == "Agent / tool" else "right")
+    for path, agent in turn.agents.items():
+        table.add_row(
+            f"[bold]{path}[/bold]",
+            str(agent.llm_calls),
+            f"{agent.llm_latency_s:.2f}s",
+            str(agent.input_tokens),
+            str(agent.cached_input_tokens),
+            str(agent.output_tokens),
+        )
+        for name, tool in agent.tools.items():
+            table.add_row(f"  {name}", str(tool.calls), f"{tool.latency_s:.2f}s", "", "", "")
+    for client, http in turn.http.items():
+        table.add_row(f"[cyan]http:{client}[/cyan]", str(http.calls), f"{http.latency_s:.2f}s", "", "", "")
+    console.print(table)
+
+    totals = tracker.session_totals()
+    input_tokens = totals.get("input_tokens", 0)
+    cache_hit_rate = totals.get("cached_input_tokens", 0) / input_tokens if input_tokens else 0.0
+    summary = (
+        f"Session: {totals['turns']} turns, {totals['duration_s']:.1f}s, "
+        f"{totals.get('llm_calls', 0)} LLM calls, "
+        f"{totals.get('input_tokens', 0)} in ({totals.get('cached_input_tokens', 0)} cached, "
+        f"{cache_hit_rate:.0%}) / "
+        f"{totals.get('output_tokens', 0)} out tokens, {totals.get('http_calls', 0)} HTTP calls"
+    )
+    if totals.get("escalations"):
+        summary += f", {totals['escalations']} model escalations"
+    if "cost_usd" in totals:
+        summary += f", ${totals['cost_usd']:.4f}"
+    console.print(f"[dim]{summary}[/dim]")
+
+    for backend in ("mealie", "bring"):
+        limits = get_rate_limiter(backend).stats()
+        console.print(
+            f"[dim]Rate limit {backend}: {limits['active']} in flight, {limits['queue_depth']} queued; "
+            f"interactive {limits['interactive_requests']} requests (max {limits['interactive_max_waiting']} "
+            f"queued, {limits['interactive_wait_s']:.2f}s waited), "
+            f"background {limits['background_requests']} requests (max {limits['background_max_waiting']} "
+            f"queued, {limits['background_wait_s']:.2f}s waited)[/dim]"
+        )
+
+
+async def run_agent_async(user_input: str, agent, tracker: UsageTracker | None = None) -> str:
     """Run the agent with user input asynchronously.
 
     Args:
         user_input: The user's message
-        agent: The supervisor agent
+        agent: The cooking agent (supervisor, flat or planner)
+        tracker: Records LLM, tool and HTTP usage of the turn if given
 
     Returns:
         The agent's response
     """
-    result = await agent.ainvoke(
-        {"messages": [{"role": "user", "content": user_input}]}
-    )
+    if tracker is None:
+        tracker = UsageTracker()
+
+    with tracker.turn(user_input), span("turn", prompt=user_input):
+        result = await agent.ainvoke(
+            {"messages": [{"role": "user", "content": user_input}]}
+        )
     
     # Get the final message from the agent
     return result["messages"][-1].text
 
 
+def run_cooking(runtime: BackgroundLoop, agent_future: "Future[Any]", tracker: UsageTracker, query: str) -> None:
+    """Cook a recipe step by step until the user types ``done``.
+
+    Navigation, ingredient and timer commands are answered locally from the
+    recipe loaded once; other input goes to the agent with the recipe and the
+    current step as context. Timers ring on the background loop.
+    """
+    timers: list[Future[None]] = []
+
+    def announce(timer: CookingTimer) -> None:
+        console.print(f"\n[bold yellow]⏰ Timer '{timer.label}' is done![/bold yellow]\a")
+
+    def schedule(timer: CookingTimer) -> None:
+        timers.append(runtime.submit(ring_when_done(timer, announce)))
+
+    try:
+        with console.status("[bold blue]Loading recipe...[/bold blue]"):
+            session = runtime.run(CookingSession.load(query, on_timer=schedule))
+    except LookupError:
+        console.print(f"[yellow]No recipe found for '{escape(query)}'.[/yellow]")
+        return
+    console.print(Panel.fit(f"[bold]{escape(session.recipe.name)}[/bold]\n[dim]{escape(COOKING_HELP)}[/dim]",
+                            title="Cooking", border_style="yellow"))
+    console.print(session.format_step(), markup=False)
+
+    try:
+        while True:
+            try:
+                command = Prompt.ask("\n[bold yellow]Cooking[/bold yellow]")
+                if not command.strip():
+                    continue
+                if command.lower() in ("done", "quit", "exit", "q", "fertig"):
+                    console.print("[dim]Left cooking mode.[/dim]")
+                    return
+                if (answer := session.handle(command)) is not None:
+                    console.print(answer, markup=False)
+                    continue
+                with console.status("[bold blue]Thinking...[/bold blue]"):
+                    agent = agent_future.result()
+                    response = runtime.run(run_agent_async(session.question_prompt(command), agent, tracker))
+                console.print()
+                console.print(Markdown(response))
+            except EOFError:
+                return
+            except KeyboardInterrupt:
+                console.print("\n[dim]Interrupted. Type 'done' to leave cooking mode.[/dim]")
+            except Exception as e:
+                console.print(f"[red]Error: {escape(str(e))}[/red]")
+    finally:
+        for timer in timers:
+            timer.cancel()
+
+
 def run_cli() -> None:
-    """Run the interactive CLI loop."""
+    """Run the interactive CLI loop.
+
+    Turns run on a persistent background event loop, so connections, the
+    Bring login and the agents are reused across turns. The agent is built and
+    the warm-up runs on that loop while the prompt is already shown.
+    """
     print_welcome()
 
     try:
-        agent = create_supervisor_agent()
+        settings = get_settings()
+        tracker = create_usage_tracker()
+        configure_tracing(settings.trace_file, settings.otlp_endpoint)
     except Exception as e:
         console.print(f"[red]Error initializing agent: {e}[/red]")
         console.print("[dim]Make sure your .env file is configured correctly.[/dim]")
         return
 
-    while True:
+    runtime = BackgroundLoop().start()
+    agent_future: Future[Any] = runtime.submit(build_agent())
+    warmup = runtime.submit(warm_up()) if settings.warmup else None
+
+    try:
+        while True:
+            try:
+                user_input = Prompt.ask("\n[bold green]You[/bold green]")
+
+                if not user_input.strip():
+                    continue
+
+                if user_input.lower() in ("quit", "exit", "q"):
+                    console.print("[dim]Goodbye! 👋[/dim]")
+                    break
+
+                if user_input.lower() == "help":
+                    print_help()
+                    continue
+
+                if user_input.lower() == "stats":
+                    print_stats(tracker, warmup)
+                    continue
+
+                if user_input.lower() in ("sync", "sync full"):
+                    with console.status("[bold blue]Syncing recipes...[/bold blue]"):
+                        changed = runtime.run(sync_recipe_store(full=user_input.lower() == "sync full"))
+                    console.print(f"[dim]Synced recipe store: {changed} new or changed recipes.[/dim]")
+                    continue
+
+                if user_input.lower() == "/cook" or user_input.lower().startswith("/cook "):
+                    if not (query := user_input[5:].strip()):
+                        console.print("[dim]Usage: /cook <recipe slug or name>[/dim]")
+                    else:
+                        run_cooking(runtime, agent_future, tracker, query)
+                    continue
+
+                with console.status("[bold blue]Thinking...[/bold blue]"):
+                    try:
+                        agent = agent_future.result()
+                    except Exception as e:
+                        console.print(f"[red]Error initializing agent: {e}[/red]")
+                        console.print("[dim]Make sure your .env file is configured correctly.[/dim]")
+                        return
+                    response = runtime.run(run_agent_async(user_input, agent, tracker))
+
+                console.print()
+                console.print(Markdown(response))
+
+            except KeyboardInterrupt:
+                console.print("\n[dim]Interrupted. Type 'quit' to exit.[/dim]")
+            except Exception as e:
+                console.print(f"[red]Error: {e}[/red]")
+    finally:
         try:
-            user_input = Prompt.ask("\n[bold green]You[/bold green]")
+            runtime.run(shut_down())
+        finally:
+            runtime.stop()
+            tracer.shutdown()
 
-            if not user_input.strip():
-                continue
 
-            if user_input.lower() in ("quit", "exit", "q"):
-                console.print("[dim]Goodbye! 👋[/dim]")
-                break
+def run_batch_cli(args: argparse.Namespace) -> int:
+    """Run the ``batch`` command; returns the exit status (1 if any prompt failed)."""
+    from cooking_agent.batch import run_batch_file
 
-            if user_input.lower() == "help":
-                print_help()
-                continue
+    try:
+        get_settings()
+    except Exception as e:
+        console.print(f"[red]Error initializing agent: {e}[/red]")
+        return 2
 
-            with console.status("[bold blue]Thinking...[/bold blue]"):
-                response = asyncio.run(run_agent_async(user_input, agent))
+    def write(result: dict[str, Any]) -> None:
+        args.output.write(json.dumps(result, ensure_ascii=False) + "\n")
+        args.output.flush()
 
-            console.print()
-            console.print(Markdown(response))
+    try:
+        summary = asyncio.run(run_batch_file(args.input, write, args.workers, args.mode, args.timeout))
+    finally:
+        tracer.shutdown()
+    Console(stderr=True).print(f"[dim]{summary.describe()}[/dim]")
+    return 1 if summary.failed else 0
 
-        except KeyboardInterrupt:
-            console.print("\n[dim]Interrupted. Type 'quit' to exit.[/dim]")
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
 
+def main(argv: list[str] | None = None) -> None:
+    """Parse the command line and run the interactive CLI or a batch."""
+    parser = argparse.ArgumentParser(
+        prog="cooking_agent", description="Multi-agent assistant for recipes and shopping lists"
+    )
+    commands = parser.add_subparsers(dest="command")
+    batch = commands.add_parser("batch", help="Run prompts from a JSONL file and write results as JSONL")
+    batch.add_argument(
+        "input",
+        type=argparse.FileType("r", encoding="utf-8"),
+        help='JSONL file of {"id": ..., "prompt": ...} objects or strings ("-" for stdin)',
+    )
+    batch.add_argument(
+        "-o",
+        "--output",
+        type=argparse.FileType("w", encoding="utf-8"),
+        default="-",
+        help="File to write the results to (default: stdout)",
+    )
+    batch.add_argument("-w", "--workers", type=int, default=4, help="Prompts run concurrently (default: 4)")
+    batch.add_argument("--mode", choices=["supervisor", "flat", "planner"], help="Agent mode (default: AGENT_MODE)")
+    batch.add_argument("--timeout", type=float, help="Seconds after which a prompt is abandoned")
+    args = parser.parse_args(argv)
 
-if __name__ == "__main__":
+    if args.command == "batch":
+        sys.exit(run_batch_cli(args))
     run_cli()
+
+
+if __name__ == "__main__":
+    main()
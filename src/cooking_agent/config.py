@@ -1,10 +1,23 @@
 """Configuration management using Pydantic Settings."""
 
 from functools import lru_cache
+from typing import Literal
 
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class AgentModelSettings(BaseModel):
+    """Chat model of one agent; unset fields use the global model and provider defaults."""
+
+    model: str | None = None
+    temperature: float | None = None
+    max_tokens: int | None = None
+    timeout: float | None = None
+    # Stronger model retried when this one fails or emits invalid tool calls
+    escalate_to: str | None = None
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
@@ -21,11 +34,60 @@ class Settings(BaseSettings):
     # Bring Shopping List
     bring_email: str
     bring_password: str
+    bring_api_url: str | None = None
+
+    # Pantry: JSON file of foods the household has at home (in memory if unset)
+    pantry_file: str | None = None
+
+    # Local SQLite recipe store, read before Mealie and used during outages
+    recipe_store_path: str | None = None
+    # Sync the store in the background once its last sync is older than this
+    # many seconds (0: only at startup and with the `sync` command)
+    recipe_store_max_age: float = 900.0
+
+    # Fetch the details of this many top search results in the background
+    # (0 disables prefetching)
+    prefetch_recipes: int = 0
+
+    # Warm-up at CLI startup: open connections, log into Bring, load the
+    # shopping lists, sync the recipe store and build the agents
+    warmup: bool = True
+
+    # Client-side rate limits per backend: sustained requests per second (unset:
+    # unlimited), burst size and maximum requests in flight
+    mealie_rate_limit: float | None = None
+    mealie_burst: int = 10
+    mealie_max_concurrency: int | None = 8
+    bring_rate_limit: float | None = 5.0
+    bring_burst: int = 10
+    bring_max_concurrency: int | None = 4
 
     # OpenAI LLM
     openai_api_key: str
     model_name: str = "gpt-4o-mini"
 
+    # Per-agent models as JSON keyed by agent (supervisor, mealie, bring, flat,
+    # planner), e.g. {"bring": {"model": "gpt-4.1-nano", "max_tokens": 512}}, and
+    # the model agents escalate to unless they set their own ``escalate_to``
+    agent_models: dict[str, AgentModelSettings] = {}
+    escalation_model: str | None = None
+
+    # Execution mode: "supervisor" routes through sub-agents, "flat" gives one
+    # agent all tools, "planner" compiles the request into one tool plan
+    agent_mode: Literal["supervisor", "flat", "planner"] = "supervisor"
+
+    # Usage accounting: append per-turn stats as JSON lines to this file, and
+    # optional token prices (USD per million tokens) to compute turn costs
+    stats_file: str | None = None
+    input_token_price: float | None = None
+    cached_input_token_price: float | None = None
+    output_token_price: float | None = None
+
+    # Tracing: write a Chrome trace event file and/or export to an OTLP/HTTP
+    # collector (e.g. http://localhost:4318)
+    trace_file: str | None = None
+    otlp_endpoint: str | None = None
+
 
 @lru_cache
 def get_settings() -> Settings:
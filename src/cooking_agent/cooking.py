@@ -0,0 +1,221 @@
+"""Step-by-step cooking sessions.
+
+While cooking, users mostly ask for the next step, the previous one, the
+ingredients of this step or a timer. Sent to the agent, each of these costs a
+supervisor → Mealie agent → fetch chain. A ``CookingSession`` loads the recipe
+once and answers them locally; only free-form questions go to the agent,
+together with the recipe and the current step as context.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+
+from cooking_agent.mealie.client import MealieClient, Recipe
+from cooking_agent.mealie.durations import find_durations, parse_duration
+from cooking_agent.mealie.index import normalize_food
+
+HELP = (
+    "next / back / repeat · step <n> · steps · ingredients (of this step) · all ingredients · "
+    "timer [duration] · timers · done"
+)
+
+_COMMANDS = {
+    "next": ("next", "n", "weiter", "nächster schritt"),
+    "previous": ("back", "previous", "prev", "p", "zurück"),
+    "repeat": ("repeat", "again", "r", "nochmal", "wiederholen"),
+    "steps": ("steps", "overview", "schritte"),
+    "ingredients": ("ingredients", "i", "zutaten"),
+    "all_ingredients": ("all ingredients", "alle zutaten"),
+    "timers": ("timers",),
+    "help": ("help", "?", "hilfe"),
+}
+_ALIASES = {alias: command for command, aliases in _COMMANDS.items() for alias in aliases}
+
+
+def step_durations(text: str) -> list[float]:
+    """Durations mentioned in an instruction, in minutes ("Zwei Stunden schmoren" → [120.0])."""
+    return [minutes for minutes in find_durations(text) if minutes > 0]
+
+
+def format_minutes(minutes: float) -> str:
+    """Format minutes as "1 h 30 min", "45 min" or "1 min 30 s"."""
+    hours, rest = divmod(round(minutes * 60), 3600)
+    mins, secs = divmod(rest, 60)
+    parts = [f"{hours} h" if hours else "", f"{mins} min" if mins else "", f"{secs} s" if secs and not hours else ""]
+    return " ".join(part for part in parts if part) or "0 s"
+
+
+@dataclass
+class CookingTimer:
+    """A countdown started during a cooking session."""
+
+    label: str
+    minutes: float
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def remaining_s(self) -> float:
+        """Seconds until the timer rings (0 once it has)."""
+        return max(self.started_at + self.minutes * 60 - time.monotonic(), 0.0)
+
+    @property
+    def done(self) -> bool:
+        return self.remaining_s == 0.0
+
+
+async def ring_when_done(timer: CookingTimer, notify: Callable[[CookingTimer], None]) -> None:
+    """Wait for ``timer`` and call ``notify`` when it rings."""
+    await asyncio.sleep(timer.remaining_s)
+    notify(timer)
+
+
+class CookingSession:
+    """Navigation through the steps of one recipe, answered without the agent."""
+
+    def __init__(self, recipe: Recipe, on_timer: Callable[[CookingTimer], None] | None = None) -> None:
+        """Start cooking a recipe at its first step.
+
+        Args:
+            recipe: Recipe to cook
+            on_timer: Called with every timer started, e.g. to schedule its
+                notification
+        """
+        self.recipe = recipe
+        self.position = 0
+        self.timers: list[CookingTimer] = []
+        self.on_timer = on_timer
+
+    @classmethod
+    async def load(cls, query: str, on_timer: Callable[[CookingTimer], None] | None = None) -> "CookingSession":
+        """Load a recipe by slug, or by the best search result for ``query``.
+
+        Raises:
+            LookupError: If no recipe matches
+        """
+        import httpx
+
+        from cooking_agent.pool import get_mealie_client
+
+        async with get_mealie_client() as client:
+            slug = query.strip()
+            try:
+                recipe = await client.get_recipe(slug)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 404:
+                    raise
+                results = await client.search_recipes(query, limit=1)
+                if not results:
+                    raise LookupError(f"No recipe found for '{query}'") from None
+                slug = results[0].slug
+                recipe = await client.get_recipe(slug)
+        return cls(recipe, on_timer)
+
+    @property
+    def steps(self) -> tuple[str, ...]:
+        return self.recipe.instructions
+
+    def format_step(self) -> str:
+        """The current step, with the durations it mentions as timer hint."""
+        if not self.steps:
+            return f"{self.recipe.name} has no instructions."
+        text = f"Step {self.position + 1}/{len(self.steps)}: {self.steps[self.position]}"
+        if durations := step_durations(self.steps[self.position]):
+            text += f"\n(type 'timer' for {format_minutes(durations[0])})"
+        return text
+
+    def go_to(self, position: int) -> str:
+        """Move to a step (0-based), clamped to the recipe."""
+        self.position = min(max(position, 0), max(len(self.steps) - 1, 0))
+        return self.format_step()
+
+    def step_ingredients(self) -> list[str]:
+        """Ingredient lines of the foods the current step mentions."""
+        if not self.steps:
+            return []
+        words = set(normalize_food(self.steps[self.position]).split())
+        used = tuple(
+            ing
+            for ing in self.recipe.ingredients
+            if ing.food and (food := normalize_food(ing.food)) and set(food.split()) <= words
+        )
+        return MealieClient.format_ingredients(replace(self.recipe, ingredients=used))
+
+    def start_timer(self, duration: str = "") -> CookingTimer:
+        """Start a timer for ``duration``, or the first duration of the current step.
+
+        Raises:
+            ValueError: If no duration is given and the step mentions none
+        """
+        if duration:
+            minutes = parse_duration(duration)
+            label = duration
+        else:
+            found = step_durations(self.steps[self.position]) if self.steps else []
+            minutes = found[0] if found else None
+            label = f"step {self.position + 1}"
+        if not minutes:
+            raise ValueError("Give a duration, e.g. 'timer 10 min'")
+        timer = CookingTimer(label, minutes)
+        self.timers.append(timer)
+        if self.on_timer is not None:
+            self.on_timer(timer)
+        return timer
+
+    def format_timers(self) -> str:
+        """Running timers and their remaining time."""
+        running = [t for t in self.timers if not t.done]
+        if not running:
+            return "No timers running."
+        return "\n".join(f"⏰ {t.label}: {format_minutes(t.remaining_s / 60)} left" for t in running)
+
+    def handle(self, command: str) -> str | None:
+        """Answer a navigation, ingredient or timer command.
+
+        Returns:
+            The answer, or None if ``command`` is a free-form question for the
+            agent
+        """
+        text = command.strip().lower()
+        if text.isdigit() or (text.startswith(("step ", "schritt ")) and text.split()[-1].isdigit()):
+            return self.go_to(int(text.split()[-1]) - 1)
+        if text == "timer" or text.startswith("timer "):
+            try:
+                timer = self.start_timer(text.removeprefix("timer").strip())
+            except ValueError as e:
+                return str(e)
+            return f"⏰ Timer '{timer.label}' set for {format_minutes(timer.minutes)}."
+
+        match _ALIASES.get(text):
+            case "next":
+                if self.position + 1 >= len(self.steps):
+                    return "That was the last step. Enjoy your meal!"
+                return self.go_to(self.position + 1)
+            case "previous":
+                return self.go_to(self.position - 1)
+            case "repeat":
+                return self.format_step()
+            case "steps":
+                return "\n".join(f"{i}. {step}" for i, step in enumerate(self.steps, 1))
+            case "ingredients":
+                return "\n".join(self.step_ingredients()) or "This step uses no listed ingredients."
+            case "all_ingredients":
+                return "\n".join(MealieClient.format_ingredients(self.recipe))
+            case "timers":
+                return self.format_timers()
+            case "help":
+                return HELP
+        return None
+
+    def question_prompt(self, question: str) -> str:
+        """Prompt for a free-form question, with the recipe and current step as context."""
+        lines = [
+            f"I am cooking {self.recipe.name} (slug: {self.recipe.slug}).",
+            "Ingredients:",
+            *MealieClient.format_ingredients(self.recipe),
+        ]
+        if self.steps:
+            lines.append(f"I am at step {self.position + 1} of {len(self.steps)}: {self.steps[self.position]}")
+        lines.append(f"Question: {question}")
+        return "\n".join(lines)
@@ -0,0 +1,93 @@
+"""Escalation from an agent's cheap model to a stronger one.
+
+Sub-agents such as Bring mostly map names to one tool call, which a small,
+fast model does well. ``ModelEscalationMiddleware`` keeps every model call on
+the agent's own model and retries only the calls that fail (errors, timeouts)
+or answer with tool calls the agent cannot execute on the stronger model, so
+the common case stays cheap without losing accuracy on the hard ones.
+"""
+
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from langchain.agents.middleware import AgentMiddleware, ModelRequest, ModelResponse
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.tools import BaseTool
+from langgraph.errors import GraphBubbleUp
+from pydantic import BaseModel, ValidationError
+
+from cooking_agent.llm import create_chat_model, escalation_model_name
+from cooking_agent.stats import current_turn
+
+logger = logging.getLogger(__name__)
+
+
+def tool_call_problems(message: AIMessage, tools: Sequence[BaseTool | dict[str, Any]]) -> list[str]:
+    """Describe the tool calls of ``message`` that cannot be executed.
+
+    Covers calls whose arguments could not be parsed, calls of unknown tools
+    and arguments that do not match the tool's schema.
+    """
+    problems = [f"{call.get('name')}: {call.get('error')}" for call in message.invalid_tool_calls]
+    by_name = {tool.name: tool for tool in tools if isinstance(tool, BaseTool)}
+    for call in message.tool_calls:
+        tool = by_name.get(call["name"])
+        if tool is None:
+            problems.append(f"{call['name']}: unknown tool")
+            continue
+        schema = tool.tool_call_schema
+        if isinstance(schema, type) and issubclass(schema, BaseModel):
+            try:
+                schema.model_validate(call["args"])
+            except ValidationError as e:
+                problems.append(f"{call['name']}: {e.error_count()} invalid arguments")
+    return problems
+
+
+class ModelEscalationMiddleware(AgentMiddleware):
+    """Retry failed or invalid model calls of an agent on a stronger model."""
+
+    def __init__(self, agent: str, model: BaseChatModel) -> None:
+        """Initialize the middleware.
+
+        Args:
+            agent: Agent name, used when recording escalations
+            model: Stronger model to retry on
+        """
+        super().__init__()
+        self.agent = agent
+        self.model = model
+
+    def _escalate(self, reason: str) -> None:
+        logger.info("Escalating %s model call: %s", self.agent, reason)
+        if (turn := current_turn()) is not None:
+            turn.record_escalation(self.agent)
+
+    async def awrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
+    ) -> ModelResponse:
+        """Call the agent's model, escalating on errors and invalid tool calls."""
+        try:
+            response = await handler(request)
+        except GraphBubbleUp:
+            raise
+        except Exception as e:
+            self._escalate(f"{type(e).__name__}: {e}")
+        else:
+            messages = [m for m in response.result if isinstance(m, AIMessage)]
+            problems = [p for m in messages for p in tool_call_problems(m, request.tools)]
+            if not problems:
+                return response
+            self._escalate("; ".join(problems))
+        return await handler(request.override(model=self.model))
+
+
+def escalation_middleware(agent: str) -> list[AgentMiddleware]:
+    """Middleware for ``create_agent`` escalating ``agent``'s model calls, if configured."""
+    if escalation_model_name(agent) is None:
+        return []
+    return [ModelEscalationMiddleware(agent, create_chat_model(agent, escalated=True))]
@@ -0,0 +1,88 @@
+"""Flat single-agent mode with direct access to all Mealie and Bring tools."""
+
+from langchain.agents import create_agent
+
+from cooking_agent.escalation import escalation_middleware
+from cooking_agent.instrumentation import usage_handler
+from cooking_agent.llm import create_chat_model, ordered_tools
+from cooking_agent.mealie.tools import (
+    search_recipes,
+    get_recipe_details,
+    get_recipe_ingredients,
+    find_recipes_by_ingredients,
+    find_recipes_by_time,
+)
+from cooking_agent.bring.tools import (
+    list_shopping_lists,
+    view_shopping_list,
+    add_to_shopping_list,
+)
+from cooking_agent.mealplan import plan_meals
+from cooking_agent.shopping import add_recipes_to_shopping_list, update_pantry
+
+
+FLAT_SYSTEM_PROMPT = """You are a cooking assistant that helps users find recipes in their Mealie collection and manage their Bring shopping lists.
+
+Your capabilities:
+- Search for recipes by name, ingredients, or keywords
+- Get full recipe details including ingredients and instructions
+- Extract ingredient lists for shopping
+- Find recipes that use ingredients the user has
+- Find recipes by cooking time
+- List available shopping lists
+- View items on a specific shopping list
+- Add items to shopping lists
+
+Recipes:
+1. Use search_recipes to find matching recipes
+2. Use get_recipe_details to show full recipe information
+3. Use get_recipe_ingredients when users want ingredients for shopping
+4. Use find_recipes_by_ingredients when users ask what they can cook with certain ingredients
+5. Use find_recipes_by_time for time constraints ("quick recipes under 30 minutes"); search_recipes
+   also accepts max_minutes
+6. Use plan_meals to plan meals for several days instead of searching recipe by recipe
+
+Shopping lists:
+1. Use list_shopping_lists to show available lists
+2. Use view_shopping_list to see current items
+3. Use add_to_shopping_list to add new items
+4. Use add_recipes_to_shopping_list to add the ingredients of recipes by slug; it skips items already
+   on the list or in the pantry (and recently bought ones with skip_recently_bought)
+5. Use update_pantry when the user tells you what they have at home or have used up
+
+When adding items from a recipe by hand, pass the ingredient lines as they are (e.g., "400 g Spaghetti", "2 Zwiebeln"); they are mapped to Bring catalog items with the amount as specification.
+
+Call independent tools in the same response so they run concurrently. Only wait for a result when the next call needs it (e.g. get the ingredients before adding them to a list).
+
+Always provide helpful, concise responses and confirm actions you've taken.
+
+Recipes might be in English or German."""
+
+
+def create_flat_agent():
+    """Create a single agent that calls all Mealie and Bring tools directly.
+
+    Avoids the supervisor → sub-agent hop, so every delegated action costs one
+    LLM call instead of two.
+    """
+    llm = create_chat_model("flat")
+    flat_agent = create_agent(
+        llm,
+        tools=ordered_tools([
+            search_recipes,
+            get_recipe_details,
+            get_recipe_ingredients,
+            find_recipes_by_ingredients,
+            find_recipes_by_time,
+            list_shopping_lists,
+            view_shopping_list,
+            add_to_shopping_list,
+            add_recipes_to_shopping_list,
+            update_pantry,
+            plan_meals,
+        ]),
+        system_prompt=FLAT_SYSTEM_PROMPT,
+        name="flat",
+        middleware=escalation_middleware("flat"),
+    )
+    return flat_agent.with_config(callbacks=[usage_handler])
@@ -0,0 +1,124 @@
+"""Instrumentation of LLM calls via LangChain callbacks."""
+
+import time
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from cooking_agent.stats import ToolStats, current_turn
+
+
+def usage_from_result(response: LLMResult) -> list[dict[str, Any]]:
+    """Extract ``usage_metadata`` dicts from an LLM result."""
+    usages = []
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                usages.append(usage)
+    return usages
+
+
+class UsageCallbackHandler(BaseCallbackHandler):
+    """Record LLM and tool usage into the current turn's ``TurnStats``.
+
+    Runs are attributed to agents via the ``lc_agent_name`` metadata set by
+    ``create_agent(name=...)``; an agent started below another one (e.g. the
+    Mealie sub-agent inside the supervisor's ``mealie_recipes`` tool) is
+    recorded under the nested path ``supervisor/mealie``.
+
+    The same instance is attached to every agent; LangChain does not add a
+    handler twice, so inherited callbacks do not double count.
+    """
+
+    run_inline = True
+
+    def __init__(self) -> None:
+        self._paths: dict[UUID, str] = {}
+        self._started: dict[UUID, float] = {}
+        self._tool_names: dict[UUID, str] = {}
+
+    def _enter(self, run_id: UUID, parent_run_id: UUID | None, metadata: dict[str, Any] | None) -> str:
+        """Resolve and remember the agent path of a run."""
+        parent = self._paths.get(parent_run_id) if parent_run_id else None
+        name = (metadata or {}).get("lc_agent_name")
+        if name is None:
+            path = parent or "agent"
+        elif parent is None:
+            path = name
+        elif parent.rsplit("/", 1)[-1] == name:
+            path = parent
+        else:
+            path = f"{parent}/{name}"
+        self._paths[run_id] = path
+        self._started[run_id] = time.perf_counter()
+        return path
+
+    def _exit(self, run_id: UUID) -> tuple[str, float]:
+        """Forget a finished run and return its agent path and latency."""
+        path = self._paths.pop(run_id, "agent")
+        started = self._started.pop(run_id, time.perf_counter())
+        return path, time.perf_counter() - started
+
+    def on_chain_start(self, serialized: dict[str, Any], inputs: Any, *, run_id: UUID,
+                       parent_run_id: UUID | None = None, metadata: dict[str, Any] | None = None,
+                       **kwargs: Any) -> None:
+        self._enter(run_id, parent_run_id, metadata)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._exit(run_id)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._exit(run_id)
+
+    def on_chat_model_start(self, serialized: dict[str, Any], messages: Any, *, run_id: UUID,
+                            parent_run_id: UUID | None = None, metadata: dict[str, Any] | None = None,
+                            **kwargs: Any) -> None:
+        self._enter(run_id, parent_run_id, metadata)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        path, latency = self._exit(run_id)
+        turn = current_turn()
+        if turn is None:
+            return
+        agent = turn.agent(path)
+        agent.llm_calls += 1
+        agent.llm_latency_s += latency
+        for usage in usage_from_result(response):
+            details = usage.get("input_token_details") or {}
+            agent.input_tokens += usage.get("input_tokens", 0)
+            agent.cached_input_tokens += details.get("cache_read") or 0
+            agent.output_tokens += usage.get("output_tokens", 0)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        path, latency = self._exit(run_id)
+        if (turn := current_turn()) is not None:
+            agent = turn.agent(path)
+            agent.llm_calls += 1
+            agent.llm_latency_s += latency
+
+    def on_tool_start(self, serialized: dict[str, Any], input_str: str, *, run_id: UUID,
+                      parent_run_id: UUID | None = None, metadata: dict[str, Any] | None = None,
+                      **kwargs: Any) -> None:
+        self._enter(run_id, parent_run_id, metadata)
+        self._tool_names[run_id] = serialized.get("name") or kwargs.get("name") or "tool"
+
+    def _record_tool(self, run_id: UUID, error: bool) -> None:
+        path, latency = self._exit(run_id)
+        name = self._tool_names.pop(run_id, "tool")
+        if (turn := current_turn()) is not None:
+            tool = turn.agent(path).tools.setdefault(name, ToolStats())
+            tool.calls += 1
+            tool.errors += error
+            tool.latency_s += latency
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._record_tool(run_id, error=False)
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._record_tool(run_id, error=True)
+
+
+usage_handler = UsageCallbackHandler()
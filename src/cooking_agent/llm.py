@@ -0,0 +1,125 @@
+"""Chat model construction shared by the agent factories.
+
+Provider-side prompt caching only applies to byte-identical prompt prefixes.
+Every agent therefore sends its static system prompt first and its tool schemas
+in a fixed order, and per-request content (the user query) last. On OpenAI
+models each agent also gets its own ``prompt_cache_key`` so its requests are
+routed to the same cache.
+
+Agents can run on different models (``Settings.agent_models``): simple
+sub-agents on a cheap, fast one, escalating to a stronger model only for the
+calls the cheap one gets wrong (see ``escalation``).
+"""
+
+import asyncio
+from collections.abc import Callable, Sequence
+from functools import wraps
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
+
+from langchain.chat_models import init_chat_model
+from langchain_core.language_models import BaseChatModel
+from langchain_core.tools import BaseTool
+
+from cooking_agent.config import AgentModelSettings, get_settings
+
+
+_model_factory: Callable[[str], BaseChatModel] | None = None
+_shared_agents: list[WeakKeyDictionary[asyncio.AbstractEventLoop, Any]] = []
+
+A = TypeVar("A")
+
+
+def set_chat_model_factory(factory: Callable[[str], BaseChatModel] | None) -> None:
+    """Replace how agents create their chat model.
+
+    Used by the offline benchmarks to plug in scripted models. Pass None to
+    restore the default.
+    """
+    global _model_factory
+    _model_factory = factory
+    for agents in _shared_agents:
+        agents.clear()
+
+
+def _model_settings(agent: str) -> AgentModelSettings:
+    return get_settings().agent_models.get(agent) or AgentModelSettings()
+
+
+def escalation_model_name(agent: str) -> str | None:
+    """Name of the stronger model ``agent`` escalates to, if escalation is configured."""
+    return _model_settings(agent).escalate_to or get_settings().escalation_model
+
+
+def model_provider(model: str) -> str | None:
+    """Provider of a model name as ``init_chat_model`` resolves it ("openai:gpt-4o", "gpt-4o" → "openai")."""
+    prefix, sep, _ = model.partition(":")
+    if sep:
+        return prefix.replace("-", "_").lower()
+    try:
+        from langchain.chat_models.base import _attempt_infer_model_provider
+    except ImportError:  # private helper; fall back to OpenAI's model names
+        return "openai" if model.startswith(("gpt-", "o1", "o3", "o4")) else None
+    return _attempt_infer_model_provider(model)
+
+
+def create_chat_model(agent: str, escalated: bool = False) -> BaseChatModel:
+    """Create the chat model for an agent.
+
+    Args:
+        agent: Agent name, used to look up its model settings, as prompt cache
+            key (OpenAI models) and as instrumentation label
+        escalated: Create the stronger model the agent escalates to instead;
+            a model factory set with ``set_chat_model_factory`` is then called
+            with ``"<agent>:escalated"``
+
+    Returns:
+        Chat model recording cached vs. uncached input tokens per call
+    """
+    if _model_factory is not None:
+        return _model_factory(f"{agent}:escalated" if escalated else agent)
+
+    settings = get_settings()
+    config = _model_settings(agent)
+    model = escalation_model_name(agent) if escalated else config.model
+    options = {
+        name: value
+        for name in ("temperature", "max_tokens", "timeout")
+        if (value := getattr(config, name)) is not None
+    }
+    model = model or settings.model_name
+    if model_provider(model) == "openai":
+        # Only OpenAI takes a cache routing key; other providers reject it.
+        options["model_kwargs"] = {"prompt_cache_key": f"cooking-agent:{agent}"}
+    return init_chat_model(
+        model=model,
+        api_key=settings.openai_api_key,
+        **options,
+    )
+
+
+def ordered_tools(tools: Sequence[BaseTool]) -> list[BaseTool]:
+    """Sort tools by name so their schemas always serialize in the same order."""
+    return sorted(tools, key=lambda t: t.name)
+
+
+def shared_agent(create: Callable[[], A]) -> Callable[[], A]:
+    """Turn an agent factory into a getter that reuses the agent per event loop.
+
+    Building a sub-agent graph on every delegation is wasted work; the graphs
+    hold no per-request state. Chat models set with ``set_chat_model_factory``
+    may be stateful (scripted), so then every call builds a fresh agent.
+    """
+    agents: WeakKeyDictionary[asyncio.AbstractEventLoop, A] = WeakKeyDictionary()
+    _shared_agents.append(agents)
+
+    @wraps(create)
+    def get() -> A:
+        if _model_factory is not None:
+            return create()
+        loop = asyncio.get_running_loop()
+        if loop not in agents:
+            agents[loop] = create()
+        return agents[loop]
+
+    return get
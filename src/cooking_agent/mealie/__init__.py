@@ -1,21 +1,40 @@
-"""Mealie recipe management domain module."""
+"""Mealie recipe management domain module.
 
-from cooking_agent.mealie.client import MealieClient, Recipe, RecipeSummary, Ingredient
-from cooking_agent.mealie.tools import (
-    search_recipes,
-    get_recipe_details,
-    get_recipe_ingredients,
-)
-from cooking_agent.mealie.agent import mealie_recipes, create_mealie_agent
+Names are imported on first access, so ``from cooking_agent.mealie import
+MealieClient`` does not load the LangChain tools and agent.
+"""
 
-__all__ = [
-    "MealieClient",
-    "Recipe",
-    "RecipeSummary",
-    "Ingredient",
-    "search_recipes",
-    "get_recipe_details",
-    "get_recipe_ingredients",
-    "mealie_recipes",
-    "create_mealie_agent",
-]
+from typing import TYPE_CHECKING
+
+from cooking_agent._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from cooking_agent.mealie.agent import create_mealie_agent, mealie_recipes
+    from cooking_agent.mealie.client import Ingredient, MealieClient, Recipe, RecipeSummary
+    from cooking_agent.mealie.collection import RecipeCollection
+    from cooking_agent.mealie.index import IngredientIndex
+    from cooking_agent.mealie.store import RecipeStore
+    from cooking_agent.mealie.tools import (
+        find_recipes_by_ingredients,
+        find_recipes_by_time,
+        get_recipe_details,
+        get_recipe_ingredients,
+        search_recipes,
+    )
+
+__getattr__, __dir__, __all__ = lazy_module(__name__, {
+    "MealieClient": "cooking_agent.mealie.client",
+    "Recipe": "cooking_agent.mealie.client",
+    "RecipeSummary": "cooking_agent.mealie.client",
+    "Ingredient": "cooking_agent.mealie.client",
+    "RecipeCollection": "cooking_agent.mealie.collection",
+    "RecipeStore": "cooking_agent.mealie.store",
+    "IngredientIndex": "cooking_agent.mealie.index",
+    "search_recipes": "cooking_agent.mealie.tools",
+    "get_recipe_details": "cooking_agent.mealie.tools",
+    "get_recipe_ingredients": "cooking_agent.mealie.tools",
+    "find_recipes_by_ingredients": "cooking_agent.mealie.tools",
+    "find_recipes_by_time": "cooking_agent.mealie.tools",
+    "mealie_recipes": "cooking_agent.mealie.agent",
+    "create_mealie_agent": "cooking_agent.mealie.agent",
+})
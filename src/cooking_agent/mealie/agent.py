@@ -1,14 +1,18 @@
 """Mealie recipe agent using LangGraph."""
 
 from langchain.agents import create_agent
-from langchain.chat_models import init_chat_model
 from langchain.tools import tool
 
-from cooking_agent.config import get_settings
+from cooking_agent.escalation import escalation_middleware
+from cooking_agent.instrumentation import usage_handler
+from cooking_agent.llm import create_chat_model, ordered_tools, shared_agent
+from cooking_agent.tracing import traced
 from cooking_agent.mealie.tools import (
     search_recipes,
     get_recipe_details,
     get_recipe_ingredients,
+    find_recipes_by_ingredients,
+    find_recipes_by_time,
 )
 
 
@@ -18,11 +22,16 @@ Your capabilities:
 - Search for recipes by name, ingredients, or keywords
 - Get full recipe details including ingredients and instructions
 - Extract ingredient lists for shopping
+- Find recipes that use ingredients the user has
+- Find recipes by cooking time
 
 When users ask about recipes:
 1. Use search_recipes to find matching recipes
 2. Use get_recipe_details to show full recipe information
 3. Use get_recipe_ingredients when users want ingredients for shopping
+4. Use find_recipes_by_ingredients when users ask what they can cook with certain ingredients
+5. Use find_recipes_by_time for time constraints ("quick recipes under 30 minutes"); search_recipes
+   also accepts max_minutes
 
 Always provide helpful, concise responses about the recipes you find.
 
@@ -32,23 +41,38 @@ Recipes might be in English or German.
 
 def create_mealie_agent():
     mealie_agent = create_agent(
-        init_chat_model(model=get_settings().model_name, api_key=get_settings().openai_api_key),
-        tools=[search_recipes, get_recipe_details, get_recipe_ingredients],
+        create_chat_model("mealie"),
+        tools=ordered_tools(
+            [
+                search_recipes,
+                get_recipe_details,
+                get_recipe_ingredients,
+                find_recipes_by_ingredients,
+                find_recipes_by_time,
+            ]
+        ),
         system_prompt=MEALIE_SYSTEM_PROMPT,
+        name="mealie",
+        middleware=escalation_middleware("mealie"),
     )
-    return mealie_agent
+    return mealie_agent.with_config(callbacks=[usage_handler])
+
+
+get_mealie_agent = shared_agent(create_mealie_agent)
 
 
 @tool
+@traced("agent.mealie")
 async def mealie_recipes(query: str) -> str:
     """Interact with Mealie recipes using natural language.
     
-    Use this when the users wants to search for recipes, get recipe details, or extract ingredient lists.
+    Use this when the users wants to search for recipes, get recipe details, extract ingredient lists,
+    or find recipes that use certain ingredients.
 
     Args:
         query: Natural language query about recipes (e.g "Retrieve the ingrendients for the "Nudeln mit Kartoffeln" recipe)
     """
-    mealie_agent = create_mealie_agent()
+    mealie_agent = get_mealie_agent()
     
     result = await mealie_agent.ainvoke({"messages": [{"role": "user", "content": query}]})
     return result["messages"][-1].text
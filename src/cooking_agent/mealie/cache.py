@@ -0,0 +1,56 @@
+"""Short-lived in-memory cache of full recipes."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cooking_agent.mealie.client import Recipe
+
+
+class RecipeCache:
+    """Bounded LRU cache of recipes whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of recipes kept; the least recently
+                used are dropped first
+            ttl: Seconds a recipe is served after it was stored
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, "Recipe"]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and time.monotonic() - entry[0] < self.ttl
+
+    def get(self, key: Hashable) -> "Recipe | None":
+        """Get a cached recipe, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, recipe: "Recipe") -> None:
+        """Cache a recipe."""
+        self._entries[key] = (time.monotonic(), recipe)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached recipes."""
+        self._entries.clear()
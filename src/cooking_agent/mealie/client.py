@@ -1,12 +1,28 @@
 """Async Mealie API client."""
 
+import asyncio
+import sys
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional (the "fast" extra)
+    from json import loads as json_loads
 
-@dataclass
+from cooking_agent.mealie.cache import RecipeCache
+from cooking_agent.ratelimit import RateLimiter, background
+from cooking_agent.singleflight import SingleFlight
+from cooking_agent.stats import httpx_event_hooks
+from cooking_agent.tracing import httpx_tracing_hooks
+
+if TYPE_CHECKING:
+    from cooking_agent.mealie.store import RecipeStore
+
+
+@dataclass(slots=True, frozen=True)
 class RecipeSummary:
     """Summary of a recipe from search results."""
 
@@ -15,11 +31,16 @@ class RecipeSummary:
     description: str | None = None
     total_time: str | None = None
     image: str | None = None
+    updated_at: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Ingredient:
-    """Recipe ingredient."""
+    """Recipe ingredient.
+
+    Unit and food names are interned by ``parse_recipe``: there are only a few
+    thousand distinct foods, so large collections share the strings.
+    """
 
     note: str
     quantity: float | None = None
@@ -27,47 +48,134 @@ class Ingredient:
     food: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Recipe:
     """Full recipe details."""
 
     slug: str
     name: str
     description: str | None
-    ingredients: list[Ingredient]
-    instructions: list[str]
+    ingredients: tuple[Ingredient, ...]
+    instructions: tuple[str, ...]
     total_time: str | None = None
     prep_time: str | None = None
     cook_time: str | None = None
 
 
+def parse_recipe_summary(item: dict[str, Any]) -> RecipeSummary:
+    """Build a ``RecipeSummary`` from a search result item."""
+    get = item.get
+    return RecipeSummary(
+        item["slug"],
+        item["name"],
+        get("description"),
+        get("totalTime"),
+        get("image"),
+        get("updatedAt") or get("dateUpdated"),
+    )
+
+
+def parse_recipe(data: dict[str, Any]) -> Recipe:
+    """Build a ``Recipe`` from a full Mealie recipe response.
+
+    Only the fields the assistant uses are read; nutrition, assets, comments
+    and the like are never touched.
+    """
+    intern = sys.intern
+    ingredients = []
+    for ing in data.get("recipeIngredient") or ():
+        unit = ing.get("unit")
+        food = ing.get("food")
+        unit_name = unit.get("name") if unit else None
+        food_name = food.get("name") if food else None
+        ingredients.append(
+            Ingredient(
+                ing.get("note", ""),
+                ing.get("quantity"),
+                intern(unit_name) if unit_name else None,
+                intern(food_name) if food_name else None,
+            )
+        )
+    get = data.get
+    return Recipe(
+        data["slug"],
+        data["name"],
+        get("description"),
+        tuple(ingredients),
+        tuple(step.get("text", "") for step in get("recipeInstructions") or ()),
+        get("totalTime"),
+        get("prepTime"),
+        get("cookTime"),
+    )
+
+
+def _is_outage(error: httpx.HTTPError) -> bool:
+    """Whether an error means Mealie is unavailable (as opposed to e.g. a 404)."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+# Concurrent identical reads of all clients share one request (see singleflight).
+_inflight = SingleFlight()
+
+# Recipes fetched ahead of use by ``prefetch_recipes``.
+prefetched = RecipeCache()
+
+
 class MealieClient:
-    """Async client for Mealie REST API."""
+    """Async client for Mealie REST API.
 
-    def __init__(self, base_url: str, api_token: str) -> None:
+    The client may be entered by several tasks at once (e.g. when shared via
+    ``cooking_agent.pool``): the connection pool opens on the first entry and
+    closes when the last one exits.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_token: str,
+        store: "RecipeStore | None" = None,
+        limiter: RateLimiter | None = None,
+    ) -> None:
         """Initialize the Mealie client.
 
         Args:
             base_url: Mealie instance URL (e.g., http://localhost:9925)
             api_token: API token from Mealie user profile
+            store: Local recipe store read before the API and used as a
+                fallback while Mealie is unreachable
+            limiter: Rate limiter shared with the other clients of the
+                instance (unlimited if None)
         """
         self.base_url = base_url.rstrip("/")
         self.api_token = api_token
+        self.store = store
+        self.limiter = limiter if limiter is not None else RateLimiter()
         self._client: httpx.AsyncClient | None = None
+        self._users = 0
 
     async def __aenter__(self) -> "MealieClient":
         """Enter async context."""
-        self._client = httpx.AsyncClient(
-            base_url=f"{self.base_url}/api",
-            headers={"Authorization": f"Bearer {self.api_token}"},
-            timeout=30.0,
-        )
+        self._users += 1
+        if self._client is None:
+            event_hooks = httpx_event_hooks("mealie")
+            for event, hooks in httpx_tracing_hooks("mealie").items():
+                event_hooks[event].extend(hooks)
+            self._client = httpx.AsyncClient(
+                base_url=f"{self.base_url}/api",
+                headers={"Authorization": f"Bearer {self.api_token}"},
+                timeout=30.0,
+                event_hooks=event_hooks,
+            )
         return self
 
     async def __aexit__(self, *args: Any) -> None:
         """Exit async context."""
-        if self._client:
-            await self._client.aclose()
+        self._users -= 1
+        if self._users == 0 and self._client:
+            client, self._client = self._client, None
+            await client.aclose()
 
     @property
     def client(self) -> httpx.AsyncClient:
@@ -76,6 +184,17 @@ class MealieClient:
             raise RuntimeError("MealieClient must be used as async context manager")
         return self._client
 
+    def _flight_key(self, endpoint: str, *params: Any) -> tuple[Any, ...]:
+        """Key under which identical concurrent reads are shared."""
+        return (type(self).__name__, self.base_url, self.api_token, endpoint, *params)
+
+    async def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request within the rate limit and raise for error statuses."""
+        async with self.limiter.slot():
+            response = await self.client.get(url, **kwargs)
+        response.raise_for_status()
+        return response
+
     async def search_recipes(
         self,
         query: str | None = None,
@@ -90,24 +209,61 @@ class MealieClient:
         Returns:
             List of recipe summaries
         """
+        if self.store is not None and self.store.synced and query:
+            if local := self.store.search(query, limit):
+                return local
+
+        results = await _inflight.do(
+            self._flight_key("search", query, limit), lambda: self._fetch_search(query, limit)
+        )
+        return list(results)
+
+    async def _fetch_search(self, query: str | None, limit: int) -> list[RecipeSummary]:
         params: dict[str, Any] = {"perPage": limit, "page": 1}
         if query:
             params["search"] = query
 
-        response = await self.client.get("/recipes", params=params)
-        response.raise_for_status()
-        data = response.json()
-
-        return [
-            RecipeSummary(
-                slug=item["slug"],
-                name=item["name"],
-                description=item.get("description"),
-                total_time=item.get("totalTime"),
-                image=item.get("image"),
-            )
-            for item in data.get("items", [])
-        ]
+        try:
+            response = await self._get("/recipes", params=params)
+        except httpx.HTTPError as e:
+            if self.store is None or not _is_outage(e) or not (local := self.store.search(query, limit)):
+                raise
+            return local
+        data = json_loads(response.content)
+
+        return [parse_recipe_summary(item) for item in data.get("items", [])]
+
+    async def list_recipes(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        order_by: str | None = None,
+        order_direction: str = "asc",
+        query_filter: str | None = None,
+    ) -> tuple[list[RecipeSummary], int]:
+        """List one page of recipes, e.g. for syncing.
+
+        Args:
+            page: Page number, starting at 1
+            per_page: Recipes per page
+            order_by: Field to order by (e.g. "updatedAt")
+            order_direction: "asc" or "desc"
+            query_filter: Mealie query filter (e.g. 'updatedAt >= "2024-01-01T00:00:00"')
+
+        Returns:
+            The recipe summaries of the page and the total number of pages
+        """
+        params: dict[str, Any] = {"page": page, "perPage": per_page}
+        if order_by:
+            params["orderBy"] = order_by
+            params["orderDirection"] = order_direction
+        if query_filter:
+            params["queryFilter"] = query_filter
+
+        response = await self._get("/recipes", params=params)
+        data = json_loads(response.content)
+
+        return [parse_recipe_summary(item) for item in data.get("items", [])], data.get("total_pages", 1)
 
     async def get_recipe(self, slug: str) -> Recipe:
         """Get full recipe details.
@@ -118,35 +274,44 @@ class MealieClient:
         Returns:
             Full recipe with ingredients and instructions
         """
-        response = await self.client.get(f"/recipes/{slug}")
-        response.raise_for_status()
-        data = response.json()
+        if self.store is not None and (cached := self.store.get_recipe(slug)) is not None:
+            return cached
+        key = self._flight_key("recipe", slug)
+        if (cached := prefetched.get(key)) is not None:
+            return cached
+        return await _inflight.do(key, lambda: self._fetch_recipe(slug))
 
-        ingredients = [
-            Ingredient(
-                note=ing.get("note", ""),
-                quantity=ing.get("quantity"),
-                unit=ing.get("unit", {}).get("name") if ing.get("unit") else None,
-                food=ing.get("food", {}).get("name") if ing.get("food") else None,
-            )
-            for ing in data.get("recipeIngredient", [])
-        ]
-
-        instructions = [
-            step.get("text", "")
-            for step in data.get("recipeInstructions", [])
-        ]
-
-        return Recipe(
-            slug=data["slug"],
-            name=data["name"],
-            description=data.get("description"),
-            ingredients=ingredients,
-            instructions=instructions,
-            total_time=data.get("totalTime"),
-            prep_time=data.get("prepTime"),
-            cook_time=data.get("cookTime"),
-        )
+    async def prefetch_recipes(self, slugs: list[str]) -> int:
+        """Fetch recipes ahead of use into the in-memory cache (and the store).
+
+        Requests wait in the background lane of the rate limiter; recipes that
+        are stored or cached already are skipped and failures are ignored.
+
+        Args:
+            slugs: Recipe slugs, e.g. the top search results
+
+        Returns:
+            Number of recipes fetched
+        """
+
+        async def fetch(slug: str) -> bool:
+            key = self._flight_key("recipe", slug)
+            if key in prefetched or (self.store is not None and self.store.get_recipe(slug) is not None):
+                return False
+            prefetched.put(key, await _inflight.do(key, lambda: self._fetch_recipe(slug)))
+            return True
+
+        with background():
+            results = await asyncio.gather(*(fetch(slug) for slug in slugs), return_exceptions=True)
+        return sum(result is True for result in results)
+
+    async def _fetch_recipe(self, slug: str) -> Recipe:
+        response = await self._get(f"/recipes/{slug}")
+        data = json_loads(response.content)
+        recipe = parse_recipe(data)
+        if self.store is not None:
+            self.store.put_recipe(recipe, data.get("updatedAt") or data.get("dateUpdated"))
+        return recipe
 
     async def get_recipe_ingredients(self, slug: str) -> list[str]:
         """Get ingredient list for a recipe as strings.
@@ -158,6 +323,18 @@ class MealieClient:
             List of ingredient strings formatted for shopping list
         """
         recipe = await self.get_recipe(slug)
+        return self.format_ingredients(recipe)
+
+    @staticmethod
+    def format_ingredients(recipe: Recipe) -> list[str]:
+        """Format a recipe's ingredients as strings for a shopping list.
+
+        Args:
+            recipe: Recipe to format
+
+        Returns:
+            List of ingredient strings formatted for shopping list
+        """
         result = []
 
         for ing in recipe.ingredients:
@@ -0,0 +1,299 @@
+"""Columnar in-memory store for large recipe collections.
+
+Keeping tens of thousands of ``Recipe`` objects alive costs one object per
+recipe, ingredient and string. ``RecipeCollection`` instead stores every field
+in a column: ingredients are rows in flat ``array`` columns that reference a
+shared vocabulary of interned food, unit and note strings, and instructions
+are joined into one string per recipe. ``Recipe`` objects are materialized on
+access.
+
+Durations are parsed to minutes once when a recipe is added and kept in
+numeric columns, so time filters and sorting never touch the strings.
+"""
+
+import asyncio
+import logging
+import math
+import sys
+import time
+from array import array
+from collections.abc import Iterable, Iterator
+from weakref import WeakKeyDictionary
+
+from cooking_agent.mealie.client import Ingredient, MealieClient, Recipe
+from cooking_agent.mealie.durations import parse_duration
+from cooking_agent.mealie.store import start_store_sync
+from cooking_agent.ratelimit import background
+
+logger = logging.getLogger(__name__)
+
+_STEP_SEPARATOR = "\x1e"
+_TIME_COLUMNS = {"total": "total_minutes", "prep": "prep_minutes", "cook": "cook_minutes"}
+_NONE = 0  # vocabulary id of None
+
+# Seconds a collection crawled from Mealie is used before it is loaded again.
+COLLECTION_TTL = 3600.0
+
+
+class RecipeCollection:
+    """Columnar store of recipes keyed by slug."""
+
+    def __init__(self, recipes: Iterable[Recipe] = ()) -> None:
+        """Initialize the collection.
+
+        Args:
+            recipes: Recipes to add
+        """
+        self._reset()
+        for recipe in recipes:
+            self.add(recipe)
+
+    def _reset(self) -> None:
+        self._rows: dict[str, int] = {}
+        self._slugs: list[str] = []
+        self._names: list[str] = []
+        self._descriptions: list[str | None] = []
+        self._instructions: list[str] = []
+        self._total_times: list[str | None] = []
+        self._prep_times: list[str | None] = []
+        self._cook_times: list[str | None] = []
+        # Parsed durations in minutes, NaN if unknown.
+        self.total_minutes = array("d")
+        self.prep_minutes = array("d")
+        self.cook_minutes = array("d")
+
+        # Ingredients of row i are ingredient rows _offsets[i]:_offsets[i + 1].
+        self._offsets = array("L", [0])
+        self._foods = array("L")
+        self._units = array("L")
+        self._notes = array("L")
+        self._quantities = array("d")  # NaN for no quantity
+
+        self._vocabulary: list[str | None] = [None]
+        self._vocabulary_ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __contains__(self, slug: object) -> bool:
+        return slug in self._rows
+
+    def __getitem__(self, slug: str) -> Recipe:
+        return self._materialize(self._rows[slug])
+
+    def get(self, slug: str) -> Recipe | None:
+        """Get a recipe by slug, or None if it is not in the collection."""
+        row = self._rows.get(slug)
+        return None if row is None else self._materialize(row)
+
+    def recipes(self) -> Iterator[Recipe]:
+        """Iterate over all recipes, materializing one at a time."""
+        for row in self._rows.values():
+            yield self._materialize(row)
+
+    def _word(self, text: str | None) -> int:
+        if not text:
+            return _NONE
+        word_id = self._vocabulary_ids.get(text)
+        if word_id is None:
+            word_id = self._vocabulary_ids[text] = len(self._vocabulary)
+            self._vocabulary.append(sys.intern(text))
+        return word_id
+
+    def add(self, recipe: Recipe) -> None:
+        """Add a recipe, replacing any previous version with the same slug.
+
+        Replaced rows are left in the columns until ``compact`` is called.
+        """
+        self._rows[recipe.slug] = len(self._slugs)
+        self._slugs.append(recipe.slug)
+        self._names.append(recipe.name)
+        self._descriptions.append(recipe.description)
+        self._instructions.append(_STEP_SEPARATOR.join(recipe.instructions))
+        self._total_times.append(recipe.total_time)
+        self._prep_times.append(recipe.prep_time)
+        self._cook_times.append(recipe.cook_time)
+        prep, cook = _minutes(recipe.prep_time), _minutes(recipe.cook_time)
+        total = _minutes(recipe.total_time)
+        if math.isnan(total) and not (math.isnan(prep) and math.isnan(cook)):
+            total = (0.0 if math.isnan(prep) else prep) + (0.0 if math.isnan(cook) else cook)
+        self.total_minutes.append(total)
+        self.prep_minutes.append(prep)
+        self.cook_minutes.append(cook)
+        for ing in recipe.ingredients:
+            self._foods.append(self._word(ing.food))
+            self._units.append(self._word(ing.unit))
+            self._notes.append(self._word(ing.note))
+            self._quantities.append(math.nan if ing.quantity is None else ing.quantity)
+        self._offsets.append(len(self._foods))
+
+    def compact(self) -> None:
+        """Drop rows of replaced recipes."""
+        recipes = [self[slug] for slug in self._rows]
+        self._reset()
+        for recipe in recipes:
+            self.add(recipe)
+
+    def _materialize(self, row: int) -> Recipe:
+        vocabulary = self._vocabulary
+        start, end = self._offsets[row], self._offsets[row + 1]
+        ingredients = tuple(
+            Ingredient(
+                vocabulary[self._notes[i]] or "",
+                None if math.isnan(q := self._quantities[i]) else q,
+                vocabulary[self._units[i]],
+                vocabulary[self._foods[i]],
+            )
+            for i in range(start, end)
+        )
+        instructions = self._instructions[row]
+        return Recipe(
+            self._slugs[row],
+            self._names[row],
+            self._descriptions[row],
+            ingredients,
+            tuple(instructions.split(_STEP_SEPARATOR)) if instructions else (),
+            self._total_times[row],
+            self._prep_times[row],
+            self._cook_times[row],
+        )
+
+    def minutes(self, slug: str) -> float | None:
+        """Total time of a recipe in minutes, if known."""
+        minutes = self.total_minutes[self._rows[slug]]
+        return None if math.isnan(minutes) else minutes
+
+    def filter_by_time(
+        self,
+        max_minutes: float | None = None,
+        min_minutes: float | None = None,
+        field: str = "total",
+        query: str | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[str, float]]:
+        """Find recipes by time, fastest first.
+
+        Args:
+            max_minutes: Upper bound (inclusive)
+            min_minutes: Lower bound (inclusive)
+            field: Time to filter and sort on: "total", "prep" or "cook"
+            query: Only recipes whose name contains every word of the query
+            limit: Maximum number of results
+
+        Returns:
+            (slug, minutes) pairs sorted by minutes; recipes without a
+            known time are excluded
+        """
+        column = getattr(self, _TIME_COLUMNS[field])
+        upper = math.inf if max_minutes is None else max_minutes
+        lower = -math.inf if min_minutes is None else min_minutes
+        words = (query or "").lower().split()
+        live = set(self._rows.values()) if len(self._rows) != len(self._slugs) else None
+
+        hits = []
+        for row, minutes in enumerate(column):
+            if lower <= minutes <= upper and (live is None or row in live):  # NaN fails both
+                if words:
+                    name = self._names[row].lower()
+                    if not all(word in name for word in words):
+                        continue
+                hits.append((row, minutes))
+        hits.sort(key=lambda hit: hit[1])
+        return [(self._slugs[row], minutes) for row, minutes in hits[:limit]]
+
+    def foods(self, slug: str) -> list[str]:
+        """Food names of a recipe's ingredients, without materializing it."""
+        row = self._rows[slug]
+        vocabulary = self._vocabulary
+        return [
+            vocabulary[food_id]
+            for food_id in self._foods[self._offsets[row] : self._offsets[row + 1]]
+            if food_id != _NONE
+        ]
+
+
+def _minutes(text: str | None) -> float:
+    minutes = parse_duration(text)
+    return math.nan if minutes is None else minutes
+
+
+async def load_collection(client: MealieClient, concurrency: int = 8) -> RecipeCollection:
+    """Load the whole collection by listing and fetching every recipe from Mealie.
+
+    Recipes that fail to load are left out (and logged) rather than failing
+    the whole collection.
+    """
+    slugs: list[str] = []
+    page, total_pages = 1, 1
+    while page <= total_pages:
+        summaries, total_pages = await client.list_recipes(page)
+        slugs.extend(s.slug for s in summaries)
+        page += 1
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(slug: str) -> Recipe:
+        async with semaphore:
+            return await client.get_recipe(slug)
+
+    results = await asyncio.gather(*(fetch(slug) for slug in slugs), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result  # e.g. cancellation
+    recipes = [r for r in results if isinstance(r, Recipe)]
+    if len(recipes) < len(results):
+        logger.warning("Skipped %d of %d recipes that failed to load", len(results) - len(recipes), len(results))
+    return RecipeCollection(recipes)
+
+
+class CollectionNotReady(RuntimeError):
+    """The recipe store has not completed its first sync yet; it is syncing in the background."""
+
+
+# Answer of the whole-collection tools while the recipe store runs its first sync.
+NOT_READY = "The recipe index is not ready yet (the recipe store is still syncing). Use search_recipes instead."
+
+
+_collection: RecipeCollection | None = None
+_collection_version: str | None = None
+_collection_loaded_at = 0.0
+_locks: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = WeakKeyDictionary()
+
+
+async def get_recipe_collection(client: MealieClient) -> RecipeCollection:
+    """Get the shared in-memory collection, loading it on first use.
+
+    With a recipe store the collection is built from the stored recipes and
+    rebuilt after every sync; before the first sync, the sync is started in
+    the background and ``CollectionNotReady`` raised instead of crawling
+    Mealie. Without a store the collection is crawled from Mealie in the
+    background lane of the rate limiter, so it does not hold up other
+    interactive requests, and kept for ``COLLECTION_TTL`` seconds.
+    Concurrent callers share one load.
+
+    Raises:
+        CollectionNotReady: If the recipe store is still being synced
+    """
+    global _collection, _collection_version, _collection_loaded_at
+    store = client.store
+    if store is not None and not store.synced:
+        start_store_sync()
+        raise CollectionNotReady("The recipe collection is still being synced from Mealie")
+
+    async with _locks.setdefault(asyncio.get_running_loop(), asyncio.Lock()):
+        if store is not None:
+            version = f"store:{store.cursor}"
+            if _collection is None or _collection_version != version:
+                _collection, _collection_version = RecipeCollection(store.iter_recipes()), version
+        elif (
+            _collection is None
+            or _collection_version != "mealie"
+            or time.monotonic() - _collection_loaded_at >= COLLECTION_TTL
+        ):
+            with background():
+                _collection = await load_collection(client)
+            _collection_version, _collection_loaded_at = "mealie", time.monotonic()
+        return _collection
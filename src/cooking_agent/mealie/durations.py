@@ -0,0 +1,140 @@
+"""Parse Mealie's free-form recipe durations into minutes.
+
+Mealie stores ``totalTime``, ``prepTime`` and ``cookTime`` as whatever the
+recipe source used: ISO 8601 ("PT1H30M"), English or German text ("1 hour 30
+minutes", "1 Std. 30 Min."), clock notation ("1:30"), bare numbers ("45"),
+fractions ("1 1/2 hours", "1½ Std.") or ranges ("20-30 min").
+``parse_duration`` converts all of these to minutes; the distinct strings of a
+collection are few, so results are memoized.
+"""
+
+import math
+import re
+from array import array
+from collections.abc import Iterable
+from functools import lru_cache
+
+_ISO = re.compile(
+    r"P(?:(?P<days>\d+(?:[.,]\d+)?)D)?"
+    r"(?:T(?:(?P<hours>\d+(?:[.,]\d+)?)H)?(?:(?P<minutes>\d+(?:[.,]\d+)?)M)?(?:(?P<seconds>\d+(?:[.,]\d+)?)S)?)?",
+    re.IGNORECASE,
+)
+_CLOCK = re.compile(r"(\d+):([0-5]\d)(?::([0-5]\d))?")
+_NUMBER = r"(?:\d+\s+)?\d+/[1-9]\d*|\d*\s*[½¼¾]|\d+(?:[.,]\d+)?"
+_PART = re.compile(
+    rf"(?P<amount>{_NUMBER})(?:\s*(?:-|–|to|bis)\s*(?P<upper>{_NUMBER}))?\s*"
+    r"(?P<unit>d(?:ays?)?|tage?n?|h(?:ours?|rs?)?|std\.?|stunden?|m(?:in(?:ute)?s?|inuten?)?\.?|s(?:ec(?:ond)?s?|ekunden?)?)?"
+    r"(?![a-zäöü])",
+    re.IGNORECASE,
+)
+# Spelled-out numbers, replaced by digits when a time unit follows ("zwei Stunden").
+_NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "ein": 1, "eine": 1, "einer": 1, "einen": 1, "two": 2, "zwei": 2,
+    "three": 3, "drei": 3, "four": 4, "vier": 4, "five": 5, "fünf": 5, "ten": 10, "zehn": 10,
+    "fifteen": 15, "fünfzehn": 15, "twenty": 20, "zwanzig": 20, "thirty": 30, "dreißig": 30,
+}
+_UNIT_WORD = r"(?:tage?n?|days?|stunden?|hours?|minuten?|minutes?|sekunden?|seconds?)\b"
+_WORDS = [
+    (re.compile(r"\b(?:half an hour|eine halbe stunde)\b", re.IGNORECASE), "30 min"),
+    (
+        re.compile(r"\b(?:an hour and a half|one and a half hours|(?:anderthalb|eineinhalb) stunden)\b", re.IGNORECASE),
+        "90 min",
+    ),
+    (
+        re.compile(rf"\b({'|'.join(_NUMBER_WORDS)})\s+(?={_UNIT_WORD})", re.IGNORECASE),
+        lambda m: f"{_NUMBER_WORDS[m.group(1).lower()]} ",
+    ),
+]
+# A duration mentioned in running text: a number and a unit (no bare numbers
+# or single-letter units other than "h", which would match quantities).
+_MENTION = re.compile(
+    rf"(?:{_NUMBER})(?:\s*(?:-|–|to|bis)\s*(?:{_NUMBER}))?\s*"
+    r"(?:tage?n?|days?|stunden?|std\.?|hours?|hrs?|h|minuten?|minutes?|mins?|min\.?|sekunden?|seconds?|secs?|sek\.?)"
+    r"(?![a-zäöü])",
+    re.IGNORECASE,
+)
+_FRACTIONS = {"½": 0.5, "¼": 0.25, "¾": 0.75}
+_UNIT_MINUTES = {"d": 1440.0, "t": 1440.0, "h": 60.0, "s": 1 / 60}
+
+
+def _amount(text: str) -> float:
+    text = text.strip()
+    if "/" in text:  # "1 1/2" or "1/2"
+        *whole, fraction = text.split()
+        numerator, denominator = fraction.split("/")
+        return float(whole[0] if whole else 0) + int(numerator) / int(denominator)
+    if text and text[-1] in _FRACTIONS:
+        return float(text[:-1].strip() or 0) + _FRACTIONS[text[-1]]
+    return float(text.replace(",", "."))
+
+
+def _unit_minutes(unit: str) -> float:
+    unit = unit.lower()
+    if unit.startswith("std") or unit.startswith("stund"):
+        return 60.0
+    if unit.startswith(("sec", "sek")) or unit == "s":
+        return 1 / 60
+    if unit.startswith("m"):
+        return 1.0
+    return _UNIT_MINUTES.get(unit[0], 1.0)
+
+
+def _spell_out(text: str) -> str:
+    """Replace spelled-out durations and numbers by digits ("eine halbe Stunde" → "30 min")."""
+    for pattern, replacement in _WORDS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+@lru_cache(maxsize=4096)
+def parse_duration(text: str | None) -> float | None:
+    """Convert a duration string to minutes.
+
+    Ranges resolve to their upper bound; numbers without a unit are minutes
+    (also in "1 h 30").
+
+    Args:
+        text: Duration as stored by Mealie
+
+    Returns:
+        Minutes, or None if the text holds no duration
+    """
+    if not text or not (text := text.strip()):
+        return None
+
+    iso = _ISO.fullmatch(text)
+    if iso and any(iso.groupdict().values()):
+        parts = {k: float(v.replace(",", ".")) if v else 0.0 for k, v in iso.groupdict().items()}
+        return parts["days"] * 1440 + parts["hours"] * 60 + parts["minutes"] + parts["seconds"] / 60
+
+    clock = _CLOCK.fullmatch(text)
+    if clock:
+        return int(clock.group(1)) * 60 + int(clock.group(2)) + int(clock.group(3) or 0) / 60
+
+    text = _spell_out(text)
+    total = 0.0
+    found = False
+    for match in _PART.finditer(text):
+        unit = match.group("unit")
+        amount = _amount(match.group("upper") or match.group("amount"))
+        total += amount * (_unit_minutes(unit) if unit else 1.0)
+        found = True
+    return total if found else None
+
+
+def find_durations(text: str) -> list[float]:
+    """Durations mentioned in running text, in minutes.
+
+    "Zwei Stunden schmoren, dann 10 min ruhen lassen" → [120.0, 10.0]. Unlike
+    ``parse_duration``, numbers without a unit are not durations here.
+    """
+    return [
+        minutes
+        for match in _MENTION.finditer(_spell_out(text))
+        if (minutes := parse_duration(match.group())) is not None
+    ]
+
+
+def parse_durations(texts: Iterable[str | None]) -> array:
+    """Convert many duration strings to a column of minutes (NaN if unknown)."""
+    return array("d", (math.nan if (m := parse_duration(t)) is None else m for t in texts))
@@ -0,0 +1,148 @@
+"""Inverted index from ingredients to recipes ("what can I cook with ...").
+
+Mealie's search matches text, so finding recipes by ingredients otherwise
+takes several searches plus a fetch per candidate recipe. The index maps
+normalized food names (and the words of multi-word foods) to recipe slugs and
+answers ingredient queries with set intersections, ranked by how many of the
+given foods a recipe uses and how many other ingredients it needs.
+"""
+
+import re
+import unicodedata
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from cooking_agent.mealie.client import MealieClient, Recipe
+from cooking_agent.mealie.collection import RecipeCollection, get_recipe_collection
+
+# Plural/inflection suffixes stripped for matching, longest first, so singular
+# and plural meet in the same stem (kartoffeln/kartoffel → kartoffel,
+# tomaten/tomate → tomat, potatoes/potato → potato, eggs/egg → egg).
+_SUFFIXES = ("oes", "es", "en", "e", "n", "s")
+_FOLD = str.maketrans({"ä": "a", "ö": "o", "ü": "u", "ß": "ss"})
+
+
+def normalize_food(name: str) -> str:
+    """Normalize a food name for matching: lowercase, folded, singular."""
+    text = unicodedata.normalize("NFKD", unicodedata.normalize("NFC", name).lower().translate(_FOLD))
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    words = re.findall(r"[a-z0-9]+", text)
+    return " ".join(_stem(word) for word in words)
+
+
+def _stem(word: str) -> str:
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[: -len(suffix)] if suffix != "oes" else word[:-2]
+    return word
+
+
+@dataclass(slots=True, frozen=True)
+class IngredientMatch:
+    """A recipe matching an ingredient query."""
+
+    slug: str
+    name: str
+    matched: tuple[str, ...]
+    missing: tuple[str, ...]
+
+    @property
+    def coverage(self) -> int:
+        """Number of queried ingredients the recipe uses."""
+        return len(self.matched)
+
+
+class IngredientIndex:
+    """Inverted index from normalized food names to recipe slugs."""
+
+    def __init__(self, recipes: Iterable[Recipe] = ()) -> None:
+        """Build the index.
+
+        Args:
+            recipes: Recipes to index
+        """
+        self._postings: dict[str, set[str]] = {}
+        self._foods: dict[str, tuple[tuple[str, frozenset[str]], ...]] = {}
+        self._names: dict[str, str] = {}
+        for recipe in recipes:
+            self.add(recipe)
+
+    def __len__(self) -> int:
+        return len(self._foods)
+
+    def add(self, recipe: Recipe) -> None:
+        """Index (or re-index) a recipe's foods."""
+        if recipe.slug in self._foods:
+            self.remove(recipe.slug)
+        names = dict.fromkeys(i.food for i in recipe.ingredients if i.food)
+        foods = tuple((food, self._keys(food)) for food in names)
+        self._foods[recipe.slug] = foods
+        self._names[recipe.slug] = recipe.name
+        for _, keys in foods:
+            for key in keys:
+                self._postings.setdefault(key, set()).add(recipe.slug)
+
+    def remove(self, slug: str) -> None:
+        """Remove a recipe from the index."""
+        keys = set().union(*(keys for _, keys in self._foods.pop(slug, ())))
+        for key in keys:
+            postings = self._postings.get(key)
+            if postings is not None:
+                postings.discard(slug)
+                if not postings:
+                    del self._postings[key]
+        self._names.pop(slug, None)
+
+    @staticmethod
+    def _keys(food: str) -> frozenset[str]:
+        """Index keys of a food: its normalized name and the name's words."""
+        normalized = normalize_food(food)
+        return frozenset([normalized, *normalized.split()]) if normalized else frozenset()
+
+    def lookup(self, food: str) -> set[str]:
+        """Slugs of recipes using ``food``."""
+        return self._postings.get(normalize_food(food), set())
+
+    def find(self, foods: list[str], limit: int = 5, require_all: bool = False) -> list[IngredientMatch]:
+        """Find recipes using the given foods.
+
+        Args:
+            foods: Food names, e.g. ["Lauch", "Kartoffeln"]
+            limit: Maximum number of results
+            require_all: Only return recipes using every given food
+
+        Returns:
+            Matches ranked by number of given foods used (descending), then
+            number of other ingredients needed (ascending)
+        """
+        wanted = {normalize_food(f): f for f in foods if normalize_food(f)}
+        postings = {key: self._postings.get(key, set()) for key in wanted}
+        if require_all:
+            candidates = set.intersection(*postings.values()) if postings else set()
+        else:
+            candidates = set().union(*postings.values())
+
+        matches = []
+        for slug in candidates:
+            matched = tuple(wanted[key] for key, slugs in postings.items() if slug in slugs)
+            missing = tuple(food for food, keys in self._foods[slug] if not keys & wanted.keys())
+            matches.append(IngredientMatch(slug, self._names[slug], matched, missing))
+        matches.sort(key=lambda m: (-m.coverage, len(m.missing), m.name))
+        return matches[:limit]
+
+
+_index: IngredientIndex | None = None
+_index_source: RecipeCollection | None = None
+
+
+async def get_ingredient_index(client: MealieClient) -> IngredientIndex:
+    """Get the shared ingredient index over the cached recipe collection.
+
+    The index is rebuilt whenever the collection is reloaded (see
+    ``get_recipe_collection``).
+    """
+    global _index, _index_source
+    collection = await get_recipe_collection(client)
+    if _index is None or _index_source is not collection:
+        _index, _index_source = IngredientIndex(collection.recipes()), collection
+    return _index
@@ -0,0 +1,77 @@
+"""Speculative prefetching of recipe details after a search.
+
+A search is almost always followed by a details or ingredients call on one of
+its top hits. After ``search_recipes`` returns, the prefetcher fetches the top
+k recipes in a background task (in the background lane of the rate limiter)
+into the client's in-memory recipe cache, so the follow-up call is served from
+memory or joins the request already in flight.
+"""
+
+import asyncio
+from functools import lru_cache
+
+from cooking_agent.config import get_settings
+from cooking_agent.mealie.client import MealieClient
+
+
+class RecipePrefetcher:
+    """Runs bounded, cancellable background prefetches of recipe details."""
+
+    def __init__(self, top_k: int = 3, max_pending: int = 4) -> None:
+        """Initialize the prefetcher.
+
+        Args:
+            top_k: Number of leading search results to prefetch (0 disables)
+            max_pending: Maximum prefetches running at once; further ones are
+                skipped
+        """
+        self.top_k = top_k
+        self.max_pending = max_pending
+        self._tasks: set[asyncio.Task[int]] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of prefetches running."""
+        return len(self._tasks)
+
+    def schedule(self, client: MealieClient, slugs: list[str]) -> asyncio.Task[int] | None:
+        """Start prefetching the top slugs in the background.
+
+        Args:
+            client: Client to fetch with; the prefetch enters it again, so it
+                may have been exited before the prefetch runs
+            slugs: Slugs in result order
+
+        Returns:
+            The prefetch task, or None if disabled, empty or too many are running
+        """
+        slugs = slugs[: self.top_k]
+        if not slugs or len(self._tasks) >= self.max_pending:
+            return None
+        task = asyncio.get_running_loop().create_task(self._prefetch(client, slugs))
+        self._tasks.add(task)
+        task.add_done_callback(self._done)
+        return task
+
+    async def _prefetch(self, client: MealieClient, slugs: list[str]) -> int:
+        async with client:
+            return await client.prefetch_recipes(slugs)
+
+    def _done(self, task: asyncio.Task[int]) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled():
+            task.exception()  # a failed prefetch only costs the follow-up its head start
+
+    async def cancel(self) -> None:
+        """Cancel the prefetches running on this event loop and wait until they stopped."""
+        loop = asyncio.get_running_loop()
+        tasks = [task for task in self._tasks if task.get_loop() is loop]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@lru_cache
+def get_prefetcher() -> RecipePrefetcher:
+    """Get the prefetcher configured in the settings."""
+    return RecipePrefetcher(get_settings().prefetch_recipes)
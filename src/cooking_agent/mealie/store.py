@@ -0,0 +1,338 @@
+"""Persistent SQLite store of the Mealie recipe collection.
+
+The store keeps a summary row for every recipe and the full recipe once it
+has been fetched. ``sync`` pulls only recipes updated since the last sync,
+using Mealie's ``updatedAt`` ordering and query filter, and invalidates stored
+details of changed recipes. ``MealieClient`` reads from the store first and
+falls back to it while Mealie is unreachable.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from weakref import WeakKeyDictionary
+
+from cooking_agent.config import get_settings
+from cooking_agent.mealie.client import Ingredient, MealieClient, Recipe, RecipeSummary
+from cooking_agent.ratelimit import background, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS recipes (
+    slug TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    total_time TEXT,
+    image TEXT,
+    updated_at TEXT,
+    search_text TEXT NOT NULL,
+    detail TEXT
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _search_text(name: str, description: str | None) -> str:
+    return f"{name} {description or ''}".lower()
+
+
+def _encode_detail(recipe: Recipe) -> str:
+    return json.dumps(
+        [
+            [[i.note, i.quantity, i.unit, i.food] for i in recipe.ingredients],
+            list(recipe.instructions),
+            recipe.prep_time,
+            recipe.cook_time,
+        ],
+        ensure_ascii=False,
+    )
+
+
+class RecipeStore:
+    """Recipe summaries and details in a local SQLite database."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (and create if needed) the store.
+
+        Args:
+            path: SQLite database file, or ":memory:"
+        """
+        self.path = str(path)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._db.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+    def _state(self, key: str) -> str | None:
+        row = self._db.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: str | None) -> None:
+        self._db.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value))
+
+    @property
+    def synced(self) -> bool:
+        """Whether the store has completed at least one sync."""
+        return self._state("last_sync") is not None
+
+    @property
+    def last_sync(self) -> float | None:
+        """Time (``time.time()``) the last sync completed, or None."""
+        value = self._state("last_sync")
+        return float(value) if value is not None else None
+
+    def stale(self, max_age: float) -> bool:
+        """Whether the last sync is older than ``max_age`` seconds, or there was none."""
+        last_sync = self.last_sync
+        return last_sync is None or time.time() - last_sync >= max_age
+
+    @property
+    def cursor(self) -> str | None:
+        """Newest ``updatedAt`` seen by a sync; the next sync starts here."""
+        return self._state("cursor")
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM recipes").fetchone()[0]
+
+    def get_recipe(self, slug: str) -> Recipe | None:
+        """Get a stored recipe, or None if its details are not stored."""
+        row = self._db.execute(
+            "SELECT slug, name, description, total_time, detail FROM recipes WHERE slug = ?",
+            (slug,),
+        ).fetchone()
+        if row is None or row[4] is None:
+            return None
+        return self._decode(row)
+
+    def iter_recipes(self) -> Iterator[Recipe]:
+        """Iterate over all recipes whose details are stored."""
+        rows = self._db.execute(
+            "SELECT slug, name, description, total_time, detail FROM recipes WHERE detail IS NOT NULL"
+        )
+        for row in rows:
+            yield self._decode(row)
+
+    @staticmethod
+    def _decode(row: tuple) -> Recipe:
+        ingredients, instructions, prep_time, cook_time = json.loads(row[4])
+        return Recipe(
+            row[0],
+            row[1],
+            row[2],
+            tuple(Ingredient(*ing) for ing in ingredients),
+            tuple(instructions),
+            row[3],
+            prep_time,
+            cook_time,
+        )
+
+    def put_recipe(self, recipe: Recipe, updated_at: str | None = None) -> None:
+        """Store a full recipe."""
+        self._db.execute(
+            """
+            INSERT INTO recipes (slug, name, description, total_time, updated_at, search_text, detail)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (slug) DO UPDATE SET
+                name = excluded.name,
+                description = excluded.description,
+                total_time = excluded.total_time,
+                updated_at = COALESCE(excluded.updated_at, recipes.updated_at),
+                search_text = excluded.search_text,
+                detail = excluded.detail
+            """,
+            (
+                recipe.slug,
+                recipe.name,
+                recipe.description,
+                recipe.total_time,
+                updated_at,
+                _search_text(recipe.name, recipe.description),
+                _encode_detail(recipe),
+            ),
+        )
+
+    def put_summaries(self, summaries: list[RecipeSummary]) -> list[str]:
+        """Store recipe summaries; drops stored details of changed recipes.
+
+        Returns:
+            Slugs of recipes that are new or changed
+        """
+        changed = []
+        with self._transaction():
+            for summary in summaries:
+                row = self._db.execute(
+                    "SELECT updated_at, detail IS NOT NULL FROM recipes WHERE slug = ?", (summary.slug,)
+                ).fetchone()
+                is_changed = row is None or row[0] != summary.updated_at or not row[1]
+                self._db.execute(
+                    """
+                    INSERT INTO recipes (slug, name, description, total_time, image, updated_at, search_text)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (slug) DO UPDATE SET
+                        name = excluded.name,
+                        description = excluded.description,
+                        total_time = excluded.total_time,
+                        image = excluded.image,
+                        updated_at = excluded.updated_at,
+                        search_text = excluded.search_text,
+                        detail = CASE WHEN recipes.updated_at IS excluded.updated_at
+                                      THEN recipes.detail END
+                    """,
+                    (
+                        summary.slug,
+                        summary.name,
+                        summary.description,
+                        summary.total_time,
+                        summary.image,
+                        summary.updated_at,
+                        _search_text(summary.name, summary.description),
+                    ),
+                )
+                if is_changed:
+                    changed.append(summary.slug)
+        return changed
+
+    def search(self, query: str | None, limit: int = 10) -> list[RecipeSummary]:
+        """Find recipes whose name or description contains every query word."""
+        words = (query or "").lower().split()
+        where = " AND ".join("search_text LIKE ? ESCAPE '\\'" for _ in words) or "1"
+        patterns = [
+            "%" + w.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%" for w in words
+        ]
+        rows = self._db.execute(
+            f"SELECT slug, name, description, total_time, image, updated_at FROM recipes "
+            f"WHERE {where} ORDER BY name LIMIT ?",
+            (*patterns, limit),
+        ).fetchall()
+        return [RecipeSummary(*row) for row in rows]
+
+    async def sync(
+        self, client: MealieClient, full: bool = False, details: bool = True, concurrency: int = 8
+    ) -> int:
+        """Pull recipes updated since the last sync from Mealie.
+
+        Sync requests wait in the background lane of the client's rate
+        limiter, behind interactive requests.
+
+        Args:
+            client: Mealie client, already inside its async context
+            full: Ignore the cursor and re-list the whole collection; also
+                removes recipes that were deleted in Mealie
+            details: Also fetch the full recipe of every new or changed recipe
+            concurrency: Maximum concurrent detail requests
+
+        Returns:
+            Number of new or changed recipes
+        """
+        with background():
+            return await self._sync(client, full, details, concurrency)
+
+    async def _sync(self, client: MealieClient, full: bool, details: bool, concurrency: int) -> int:
+        cursor = None if full else self.cursor
+        query_filter = f'updatedAt >= "{cursor}"' if cursor else None
+        seen: set[str] = set()
+        changed: list[str] = []
+        newest = cursor
+
+        page, total_pages = 1, 1
+        while page <= total_pages:
+            summaries, total_pages = await client.list_recipes(
+                page, order_by="updatedAt", order_direction="asc", query_filter=query_filter
+            )
+            changed.extend(self.put_summaries(summaries))
+            seen.update(s.slug for s in summaries)
+            newest = max([newest or "", *(s.updated_at or "" for s in summaries)]) or None
+            page += 1
+
+        if full:
+            stored = {row[0] for row in self._db.execute("SELECT slug FROM recipes")}
+            with self._transaction():
+                self._db.executemany("DELETE FROM recipes WHERE slug = ?", ((s,) for s in stored - seen))
+
+        if details and changed:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch(slug: str) -> None:
+                # Details of changed recipes were dropped above, so this hits Mealie.
+                async with semaphore:
+                    self.put_recipe(await client.get_recipe(slug))
+
+            await asyncio.gather(*(fetch(slug) for slug in changed))
+
+        self._set_state("cursor", newest)
+        self._set_state("last_sync", str(time.time()))
+        return len(changed)
+
+
+@lru_cache
+def get_recipe_store() -> RecipeStore | None:
+    """Get the recipe store configured in the settings, if any."""
+    path = get_settings().recipe_store_path
+    return RecipeStore(path) if path else None
+
+
+async def sync_recipe_store(full: bool = False) -> int:
+    """Sync the configured recipe store with Mealie.
+
+    Returns:
+        Number of new or changed recipes
+
+    Raises:
+        RuntimeError: If no recipe store is configured
+    """
+    store = get_recipe_store()
+    if store is None:
+        raise RuntimeError("No recipe store configured (set RECIPE_STORE_PATH)")
+    settings = get_settings()
+    limiter = get_rate_limiter("mealie")
+    async with MealieClient(settings.mealie_url, settings.mealie_api_token, limiter=limiter) as client:
+        return await store.sync(client, full=full)
+
+
+_syncs: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task[int]] = WeakKeyDictionary()
+
+
+def start_store_sync() -> asyncio.Task[int]:
+    """Start an incremental sync of the configured store in the background.
+
+    A sync that is already running on this event loop is reused instead of
+    starting another one. Failures are logged.
+
+    Returns:
+        The sync task
+    """
+    loop = asyncio.get_running_loop()
+    task = _syncs.get(loop)
+    if task is None or task.done():
+        task = _syncs[loop] = loop.create_task(sync_recipe_store())
+        task.add_done_callback(_log_store_sync)
+    return task
+
+
+def _log_store_sync(task: asyncio.Task[int]) -> None:
+    if not task.cancelled() and (error := task.exception()) is not None:
+        logger.warning("Background sync of the recipe store failed: %s", error)
@@ -3,31 +3,48 @@
 from langchain_core.tools import tool
 
 from cooking_agent.mealie.client import MealieClient
-from cooking_agent.config import get_settings
-
-
-def _get_mealie_client() -> MealieClient:
-    """Get a configured Mealie client."""
-    settings = get_settings()
-    return MealieClient(settings.mealie_url, settings.mealie_api_token)
+from cooking_agent.mealie.collection import NOT_READY, CollectionNotReady, get_recipe_collection
+from cooking_agent.mealie.durations import parse_duration
+from cooking_agent.mealie.index import get_ingredient_index
+from cooking_agent.mealie.prefetch import get_prefetcher
+from cooking_agent.pool import get_mealie_client
+from cooking_agent.tracing import traced
 
 
 @tool
-async def search_recipes(query: str, limit: int = 5) -> str:
+@traced("tool.search_recipes")
+async def search_recipes(
+    query: str, limit: int = 5, max_minutes: int | None = None, sort_by_time: bool = False
+) -> str:
     """Search for recipes by name or ingredients.
 
     Args:
         query: Search query (recipe name, ingredient, or keyword)
         limit: Maximum number of results to return (default: 5)
+        max_minutes: Only return recipes with a known total time up to this many minutes
+        sort_by_time: Sort results by total time, fastest first
 
     Returns:
         Formatted list of matching recipes with their slugs
     """
-    async with _get_mealie_client() as client:
-        recipes = await client.search_recipes(query, limit=limit)
+    # Over-fetch when filtering so the limit still applies to matching recipes.
+    fetch = limit * 4 if max_minutes is not None else limit
+    async with get_mealie_client() as client:
+        recipes = await client.search_recipes(query, limit=fetch)
+
+    if max_minutes is not None:
+        recipes = [
+            r for r in recipes if (m := parse_duration(r.total_time)) is not None and m <= max_minutes
+        ]
+    if sort_by_time:
+        # Unknown times sort last; a time of 0 minutes is known.
+        recipes.sort(key=lambda r: m if (m := parse_duration(r.total_time)) is not None else float("inf"))
+    recipes = recipes[:limit]
+    get_prefetcher().schedule(client, [r.slug for r in recipes])
 
     if not recipes:
-        return f"No recipes found matching '{query}'"
+        suffix = f" within {max_minutes} minutes" if max_minutes is not None else ""
+        return f"No recipes found matching '{query}'{suffix}"
 
     lines = [f"Found {len(recipes)} recipes:"]
     for r in recipes:
@@ -40,6 +57,7 @@ async def search_recipes(query: str, limit: int = 5) -> str:
 
 
 @tool
+@traced("tool.get_recipe_details")
 async def get_recipe_details(recipe_slug: str) -> str:
     """Get full recipe details including instructions.
 
@@ -49,7 +67,7 @@ async def get_recipe_details(recipe_slug: str) -> str:
     Returns:
         Full recipe with ingredients and cooking instructions
     """
-    async with _get_mealie_client() as client:
+    async with get_mealie_client() as client:
         recipe = await client.get_recipe(recipe_slug)
 
     lines = [f"# {recipe.name}"]
@@ -90,6 +108,7 @@ async def get_recipe_details(recipe_slug: str) -> str:
 
 
 @tool
+@traced("tool.get_recipe_ingredients")
 async def get_recipe_ingredients(recipe_slug: str) -> str:
     """Get the ingredient list for a recipe.
 
@@ -101,12 +120,90 @@ async def get_recipe_ingredients(recipe_slug: str) -> str:
     Returns:
         List of ingredients formatted for shopping
     """
-    async with _get_mealie_client() as client:
+    async with get_mealie_client() as client:
         recipe = await client.get_recipe(recipe_slug)
-        ingredients = await client.get_recipe_ingredients(recipe_slug)
 
+    ingredients = MealieClient.format_ingredients(recipe)
     lines = [f"Ingredients for {recipe.name}:"]
     for ing in ingredients:
         lines.append(f"• {ing}")
 
     return "\n".join(lines)
+
+
+@tool
+@traced("tool.find_recipes_by_ingredients")
+async def find_recipes_by_ingredients(ingredients: list[str], limit: int = 5) -> str:
+    """Find recipes that use the given ingredients ("what can I cook with ...").
+
+    Ranks recipes by how many of the ingredients they use, then by how few other
+    ingredients they need. One call replaces searching and inspecting recipes.
+
+    Args:
+        ingredients: Food names, e.g. ["Lauch", "Kartoffeln"]
+        limit: Maximum number of results to return (default: 5)
+
+    Returns:
+        Matching recipes with their slugs, used and missing ingredients
+    """
+    try:
+        async with get_mealie_client() as client:
+            index = await get_ingredient_index(client)
+    except CollectionNotReady:
+        return NOT_READY
+    matches = index.find(ingredients, limit=limit)
+
+    if not matches:
+        return f"No recipes found using {', '.join(ingredients)}"
+
+    lines = [f"Found {len(matches)} recipes:"]
+    for m in matches:
+        lines.append(f"• {m.name} (uses {m.coverage}/{len(ingredients)}: {', '.join(m.matched)})")
+        lines.append(f"  slug: {m.slug}")
+        if m.missing:
+            lines.append(f"  also needs {len(m.missing)}: {', '.join(m.missing)}")
+
+    return "\n".join(lines)
+
+
+@tool
+@traced("tool.find_recipes_by_time")
+async def find_recipes_by_time(
+    max_minutes: int | None = None,
+    min_minutes: int | None = None,
+    time: str = "total",
+    query: str | None = None,
+    limit: int = 10,
+) -> str:
+    """Find recipes in the whole collection by cooking time, fastest first.
+
+    Use this for requests like "quick recipes under 30 minutes".
+
+    Args:
+        max_minutes: Maximum time in minutes
+        min_minutes: Minimum time in minutes
+        time: Which time to filter on: "total", "prep" or "cook" (default: "total")
+        query: Only recipes whose name contains all these words
+        limit: Maximum number of results to return (default: 10)
+
+    Returns:
+        Matching recipes with their time and slug
+    """
+    if time not in ("total", "prep", "cook"):
+        return f"Unknown time '{time}', use 'total', 'prep' or 'cook'"
+    try:
+        async with get_mealie_client() as client:
+            collection = await get_recipe_collection(client)
+    except CollectionNotReady:
+        return NOT_READY
+    hits = collection.filter_by_time(max_minutes, min_minutes, field=time, query=query, limit=limit)
+
+    if not hits:
+        return "No recipes found with these times"
+
+    lines = [f"Found {len(hits)} recipes:"]
+    for slug, minutes in hits:
+        lines.append(f"• {collection[slug].name} ({minutes:g} min {time} time)")
+        lines.append(f"  slug: {slug}")
+
+    return "\n".join(lines)
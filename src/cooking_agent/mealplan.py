@@ -0,0 +1,223 @@
+"""Weekly meal planning over the whole recipe collection.
+
+Planning a week through the agents costs a search and a detail call per
+recipe, each behind two LLM layers. ``MealPlanner`` instead scores every recipe
+of the cached collection at once and selects the plan locally:
+
+- a feature matrix holds each recipe's total time in minutes and its foods
+  (normalized like the ingredient index)
+- foods to use up add score through an inverted index, so only recipes that
+  use them are touched
+- recipes are picked greedily day by day; after each pick, recipes sharing its
+  ingredients gain score (fewer distinct items to buy), and picked recipes are
+  never repeated
+
+The result includes an aggregated shopping list, and the whole plan is one
+tool call without per-recipe LLM calls.
+"""
+
+import math
+import random
+from array import array
+from dataclasses import dataclass, field
+
+from langchain_core.tools import tool
+
+from cooking_agent.mealie.client import MealieClient, Recipe
+from cooking_agent.mealie.collection import NOT_READY, CollectionNotReady, RecipeCollection, get_recipe_collection
+from cooking_agent.mealie.index import normalize_food
+from cooking_agent.pool import get_mealie_client
+from cooking_agent.shopping import get_pantry, plan_shopping
+from cooking_agent.tracing import traced
+
+# Score weights: using a food to use up outweighs everything else; shared
+# ingredients and short ingredient lists break ties between similar recipes.
+USE_UP_WEIGHT = 10.0
+SHARED_INGREDIENT_WEIGHT = 1.0
+INGREDIENT_COUNT_WEIGHT = 0.1
+
+
+@dataclass
+class PlannedMeal:
+    """A recipe assigned to one day."""
+
+    day: int
+    slug: str
+    name: str
+    minutes: float | None
+    use_up: list[str] = field(default_factory=list)
+
+
+@dataclass
+class MealPlan:
+    """Recipes for consecutive days and what to buy for them."""
+
+    meals: list[PlannedMeal]
+    shopping: list[tuple[str, str]]
+    in_pantry: list[str]
+
+
+class MealPlanner:
+    """Scores and selects recipes from a recipe collection."""
+
+    def __init__(self, collection: RecipeCollection) -> None:
+        """Build the feature matrix of the collection.
+
+        Args:
+            collection: Recipes to plan from
+        """
+        self.collection = collection
+        self.slugs: list[str] = []
+        self.names: list[str] = []
+        self.minutes = array("d")
+        self.foods: list[frozenset[str]] = []
+        self._postings: dict[str, list[int]] = {}
+        for row, recipe in enumerate(collection.recipes()):
+            foods = frozenset(filter(None, (normalize_food(i.food) for i in recipe.ingredients if i.food)))
+            self.slugs.append(recipe.slug)
+            self.names.append(recipe.name)
+            minutes = collection.minutes(recipe.slug)
+            self.minutes.append(math.nan if minutes is None else minutes)
+            self.foods.append(foods)
+            for food in foods:
+                self._postings.setdefault(food, []).append(row)
+
+    def plan(
+        self,
+        days: int = 7,
+        max_minutes: float | None = None,
+        use_up: list[str] | None = None,
+        exclude: list[str] | None = None,
+        seed: int | None = None,
+    ) -> list[int]:
+        """Select one recipe row per day.
+
+        Args:
+            days: Number of days to plan
+            max_minutes: Only use recipes with a known total time up to this
+            use_up: Foods that should be used up (recipes using them first)
+            exclude: Slugs of recipes not to plan (e.g. eaten recently)
+            seed: Seed for the random tie-breaking between equal recipes
+
+        Returns:
+            Selected rows, one per day (fewer if not enough recipes qualify)
+        """
+        n = len(self.slugs)
+        rng = random.Random(seed)
+        # Base score: small random jitter for variety, fewer ingredients first.
+        scores = array("d", (rng.random() * 0.01 - INGREDIENT_COUNT_WEIGHT * len(f) for f in self.foods))
+
+        allowed = bytearray(b"\x01") * n
+        if max_minutes is not None:
+            for row, minutes in enumerate(self.minutes):
+                if not minutes <= max_minutes:  # also rejects unknown (NaN) times
+                    allowed[row] = 0
+        excluded = set(exclude or ())
+        for row, slug in enumerate(self.slugs):
+            if slug in excluded:
+                allowed[row] = 0
+
+        remaining_use_up = {normalize_food(f): f for f in use_up or () if normalize_food(f)}
+        for food in remaining_use_up:
+            for row in self._postings.get(food, ()):
+                scores[row] += USE_UP_WEIGHT
+
+        selected: list[int] = []
+        while len(selected) < days:
+            best = max((row for row in range(n) if allowed[row]), key=scores.__getitem__, default=None)
+            if best is None:
+                break
+            selected.append(best)
+            allowed[best] = 0
+            for food in self.foods[best]:
+                bonus = SHARED_INGREDIENT_WEIGHT
+                if remaining_use_up.pop(food, None) is not None:
+                    bonus -= USE_UP_WEIGHT  # used up now; no need to cook it again
+                for row in self._postings.get(food, ()):
+                    scores[row] += bonus
+        return selected
+
+    def recipe(self, row: int) -> Recipe:
+        """Materialize the recipe of a row."""
+        return self.collection[self.slugs[row]]
+
+
+_planner: MealPlanner | None = None
+
+
+async def plan_meals_for(
+    client: MealieClient,
+    days: int = 7,
+    max_minutes: float | None = None,
+    use_up: list[str] | None = None,
+    exclude: list[str] | None = None,
+) -> MealPlan:
+    """Plan meals from the cached collection and aggregate the shopping list."""
+    global _planner
+    collection = await get_recipe_collection(client)
+    if _planner is None or _planner.collection is not collection:
+        _planner = MealPlanner(collection)
+
+    rows = _planner.plan(days, max_minutes, use_up, exclude)
+    use_up_keys = {normalize_food(f): f for f in use_up or ()}
+    meals = [
+        PlannedMeal(
+            day=day,
+            slug=_planner.slugs[row],
+            name=_planner.names[row],
+            minutes=None if math.isnan(_planner.minutes[row]) else _planner.minutes[row],
+            use_up=[use_up_keys[f] for f in _planner.foods[row] & use_up_keys.keys()],
+        )
+        for day, row in enumerate(rows, 1)
+    ]
+    shopping = plan_shopping([_planner.recipe(row) for row in rows], [], [], get_pantry().keys())
+    return MealPlan(meals, shopping.to_buy, shopping.in_pantry)
+
+
+def format_meal_plan(plan: MealPlan) -> str:
+    """Describe a meal plan for the user."""
+    if not plan.meals:
+        return "No recipes match these constraints"
+    lines = [f"Meal plan for {len(plan.meals)} days:"]
+    for meal in plan.meals:
+        time_info = f" ({meal.minutes:g} min)" if meal.minutes is not None else ""
+        use_up = f" – uses up {', '.join(meal.use_up)}" if meal.use_up else ""
+        lines.append(f"Day {meal.day}: {meal.name}{time_info}{use_up}")
+        lines.append(f"  slug: {meal.slug}")
+    lines.append(f"\nShopping list ({len(plan.shopping)} items):")
+    for name, spec in plan.shopping:
+        lines.append(f"• {name} ({spec})" if spec else f"• {name}")
+    if plan.in_pantry:
+        lines.append(f"Already in the pantry: {', '.join(plan.in_pantry)}")
+    return "\n".join(lines)
+
+
+@tool
+@traced("tool.plan_meals")
+async def plan_meals(
+    days: int = 7,
+    max_minutes: int | None = None,
+    use_up: list[str] | None = None,
+    exclude: list[str] | None = None,
+) -> str:
+    """Plan meals for several days from the whole recipe collection.
+
+    Selects one recipe per day without repeats, preferring recipes that use up
+    the given foods and share ingredients, and returns an aggregated shopping
+    list. Use add_recipes_to_shopping_list with the slugs to put it on a list.
+
+    Args:
+        days: Number of days to plan (default: 7)
+        max_minutes: Maximum total cooking time per recipe in minutes
+        use_up: Foods that should be used up, e.g. ["Lauch", "Sahne"]
+        exclude: Slugs of recipes not to plan (e.g. eaten recently)
+
+    Returns:
+        The plan with recipe slugs and the shopping list
+    """
+    try:
+        async with get_mealie_client() as client:
+            plan = await plan_meals_for(client, days, max_minutes, use_up, exclude)
+    except CollectionNotReady:
+        return NOT_READY
+    return format_meal_plan(plan)
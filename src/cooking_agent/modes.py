@@ -0,0 +1,25 @@
+"""Selection of the agent execution mode."""
+
+from cooking_agent.config import get_settings
+from cooking_agent.flat import create_flat_agent
+from cooking_agent.planner import create_planner_agent
+from cooking_agent.supervisor import create_supervisor_agent
+
+
+def create_cooking_agent(mode: str | None = None):
+    """Create the agent for the configured execution mode.
+
+    Args:
+        mode: Execution mode, defaults to ``Settings.agent_mode``
+
+    Returns:
+        An agent exposing ``ainvoke({"messages": [...]})``
+    """
+    mode = mode or get_settings().agent_mode
+    if mode == "flat":
+        return create_flat_agent()
+    if mode == "planner":
+        return create_planner_agent()
+    if mode == "supervisor":
+        return create_supervisor_agent()
+    raise ValueError(f"Unknown agent mode: {mode}")
@@ -0,0 +1,480 @@
+"""Planner/executor mode: one LLM call plans, a local executor runs the tools.
+
+Instead of routing through supervisor → sub-agent → tool (one LLM call per
+level and step), the planner asks the model once for a DAG of direct
+``MealieClient``/``BringClient`` operations. The executor runs every step whose
+dependencies are satisfied concurrently and only goes back to the model for the
+final summary, so a typical "recipe to shopping list" turn costs two LLM calls.
+An invalid plan is sent back to the model once with the error; if the new
+plan is invalid too, the request goes to the fallback (supervisor) agent.
+"""
+
+import asyncio
+import json
+from collections.abc import Callable
+from contextlib import AsyncExitStack
+from typing import Any, Literal
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
+from langchain_core.runnables.config import merge_configs
+from pydantic import BaseModel, Field
+
+from cooking_agent.bring.catalog import add_ingredients, describe_items
+from cooking_agent.bring.client import BringClient, ShoppingList
+from cooking_agent.instrumentation import usage_handler
+from cooking_agent.llm import create_chat_model, escalation_model_name
+from cooking_agent.mealie.client import MealieClient
+from cooking_agent.mealie.collection import get_recipe_collection
+from cooking_agent.mealie.durations import parse_duration
+from cooking_agent.mealie.index import get_ingredient_index
+from cooking_agent.mealplan import plan_meals_for
+from cooking_agent.pool import get_bring_client, get_mealie_client
+from cooking_agent.shopping import shop_for_recipes
+from cooking_agent.supervisor import create_supervisor_agent
+
+
+PLANNER_SYSTEM_PROMPT = """You are the planner of a cooking assistant with access to a Mealie recipe collection and Bring shopping lists.
+
+Translate the user's request into a plan: a list of steps, each calling exactly one operation.
+
+Available operations and their args:
+- search_recipes: {"query": str, "limit": int (optional, default 5), "max_minutes": int (optional)}
+  → list of {slug, name, description, total_time, minutes}
+- find_recipes_by_time: {"max_minutes": int (optional), "min_minutes": int (optional), "query": str (optional),
+  "limit": int (optional, default 10)} → list of {slug, name, minutes}, fastest first
+- get_recipe: {"slug": str} → {slug, name, description, ingredients, instructions, times}
+- get_recipe_ingredients: {"slug": str} → list of ingredient strings
+- find_recipes_by_ingredients: {"ingredients": list[str], "limit": int (optional, default 5)} → list of {slug, name, uses, missing}
+- plan_meals: {"days": int (default 7), "max_minutes": int (optional), "use_up": list[str] (optional),
+  "exclude": list[str] (optional)} → list of {day, slug, name, minutes} and the shopping list
+- list_shopping_lists: {} → list of list names
+- view_shopping_list: {"list_name": str} → list of items on the list
+- add_to_shopping_list: {"list_name": str, "items": list[str]} → confirmation
+- add_recipes_to_shopping_list: {"recipe_slugs": list[str], "list_name": str, "skip_recently_bought": bool
+  (optional, default false)} → items added, and items skipped because they are already on the list, in the
+  pantry or (with skip_recently_bought) were bought recently. Prefer it over get_recipe_ingredients +
+  add_to_shopping_list.
+
+Rules:
+- Give every step a short unique id ("s1", "s2", ...).
+- To use the result of an earlier step as an argument, write "$<step id>" as the value
+  (e.g. {"items": "$s2"} or {"items": ["$s2", "$s3"]} to combine several ingredient lists),
+  and list that step in depends_on.
+- Only add depends_on when a step really needs another step's output. Independent steps run in parallel.
+- You cannot inspect search results before planning: only plan get_recipe/get_recipe_ingredients
+  when the user names a recipe slug, or use "$<search step id>" as the slug to take the top hit.
+- If the request needs no operations (e.g. small talk), return an empty plan.
+
+Recipes might be in English or German."""
+
+SUMMARY_SYSTEM_PROMPT = """You are a cooking assistant. Answer the user's request using the results of the operations that were executed on their behalf.
+
+Be concise and helpful. Mention failed or skipped operations honestly. Never invent recipes or list items that are not in the results."""
+
+
+Operation = Literal[
+    "search_recipes",
+    "get_recipe",
+    "get_recipe_ingredients",
+    "find_recipes_by_ingredients",
+    "find_recipes_by_time",
+    "plan_meals",
+    "list_shopping_lists",
+    "view_shopping_list",
+    "add_to_shopping_list",
+    "add_recipes_to_shopping_list",
+]
+
+BRING_OPERATIONS = {
+    "list_shopping_lists",
+    "view_shopping_list",
+    "add_to_shopping_list",
+    "add_recipes_to_shopping_list",
+}
+
+
+class PlanStep(BaseModel):
+    """A single operation in a plan."""
+
+    id: str = Field(description="Unique step id, e.g. 's1'")
+    operation: Operation = Field(description="Operation to execute")
+    args: dict[str, Any] = Field(default_factory=dict, description="Operation arguments")
+    depends_on: list[str] = Field(default_factory=list, description="Ids of steps whose output is used")
+
+
+class Plan(BaseModel):
+    """A DAG of operations that answers the user's request."""
+
+    steps: list[PlanStep] = Field(default_factory=list)
+
+
+class PlanError(ValueError):
+    """Raised when a plan is not a valid DAG."""
+
+
+def _references(value: Any) -> set[str]:
+    """Step ids referenced as "$<step id>" in an argument value (see ``_resolve``)."""
+    if isinstance(value, str) and value.startswith("$"):
+        return {value[1:]}
+    if isinstance(value, list):
+        return set().union(*(_references(item) for item in value))
+    return set()
+
+
+def validate_plan(plan: Plan) -> None:
+    """Check step ids are unique, dependencies exist and there are no cycles.
+
+    Steps whose arguments reference another step ("$s1") without listing it
+    in ``depends_on`` get the dependency added, so they never run before the
+    referenced result exists.
+
+    Raises:
+        PlanError: If the plan cannot be executed
+    """
+    ids = [step.id for step in plan.steps]
+    if len(ids) != len(set(ids)):
+        raise PlanError("Plan contains duplicate step ids")
+
+    for step in plan.steps:
+        referenced = set().union(*(_references(value) for value in step.args.values()))
+        step.depends_on.extend(sorted(referenced.intersection(ids) - set(step.depends_on) - {step.id}))
+
+    deps = {step.id: set(step.depends_on) for step in plan.steps}
+    for step_id, step_deps in deps.items():
+        unknown = step_deps - deps.keys()
+        if unknown:
+            raise PlanError(f"Step '{step_id}' depends on unknown steps: {sorted(unknown)}")
+
+    resolved: set[str] = set()
+    while len(resolved) < len(deps):
+        ready = {s for s, d in deps.items() if s not in resolved and d <= resolved}
+        if not ready:
+            raise PlanError("Plan contains a dependency cycle")
+        resolved |= ready
+
+
+def _resolve(value: Any, results: dict[str, Any]) -> Any:
+    """Replace "$<step id>" references with the referenced step's result."""
+    if isinstance(value, str) and value.startswith("$") and value[1:] in results:
+        result = results[value[1:]]
+        # Searches used as a slug resolve to the top hit.
+        if isinstance(result, list) and result and isinstance(result[0], dict):
+            return result[0].get("slug", result[0])
+        return result
+    if isinstance(value, list):
+        resolved = []
+        for item in value:
+            item = _resolve(item, results)
+            if isinstance(item, list):
+                resolved.extend(item)
+            else:
+                resolved.append(item)
+        return resolved
+    return value
+
+
+class PlanExecutor:
+    """Execute a plan against Mealie and Bring with maximal parallelism."""
+
+    def __init__(self, mealie: MealieClient, bring: BringClient | None = None) -> None:
+        """Initialize the executor.
+
+        Args:
+            mealie: Mealie client, already inside its async context
+            bring: Bring client, already inside its async context (only
+                required if the plan uses shopping list operations)
+        """
+        self.mealie = mealie
+        self.bring = bring
+
+    async def execute(self, plan: Plan) -> dict[str, Any]:
+        """Run all steps, starting each as soon as its dependencies are done.
+
+        Failed steps record an ``{"error": ...}`` result; steps depending on
+        them are skipped.
+
+        Returns:
+            Mapping of step id to its result
+        """
+        validate_plan(plan)
+        results: dict[str, Any] = {}
+        failed: set[str] = set()
+        tasks: dict[str, asyncio.Task[None]] = {}
+
+        async def run(step: PlanStep) -> None:
+            await asyncio.gather(*(tasks[dep] for dep in step.depends_on))
+            if failed.intersection(step.depends_on):
+                results[step.id] = {"skipped": "a dependency failed"}
+                failed.add(step.id)
+                return
+            try:
+                results[step.id] = await self._run_step(step, results)
+            except Exception as e:
+                results[step.id] = {"error": str(e)}
+                failed.add(step.id)
+
+        # All tasks exist before any of them runs, so dependencies can be awaited by id.
+        for step in plan.steps:
+            tasks[step.id] = asyncio.create_task(run(step))
+        await asyncio.gather(*tasks.values())
+
+        return results
+
+    async def _run_step(self, step: PlanStep, results: dict[str, Any]) -> Any:
+        """Resolve references in the step's args and run its operation."""
+        args = {key: _resolve(value, results) for key, value in step.args.items()}
+        handler = getattr(self, f"_op_{step.operation}")
+        return await handler(**args)
+
+    async def _op_search_recipes(
+        self, query: str, limit: int = 5, max_minutes: int | None = None
+    ) -> list[dict[str, Any]]:
+        fetch = limit * 4 if max_minutes is not None else limit
+        results = [
+            {
+                "slug": r.slug,
+                "name": r.name,
+                "description": r.description,
+                "total_time": r.total_time,
+                "minutes": parse_duration(r.total_time),
+            }
+            for r in await self.mealie.search_recipes(query, limit=fetch)
+        ]
+        if max_minutes is not None:
+            results = [r for r in results if r["minutes"] is not None and r["minutes"] <= max_minutes]
+        return results[:limit]
+
+    async def _op_find_recipes_by_time(
+        self,
+        max_minutes: int | None = None,
+        min_minutes: int | None = None,
+        query: str | None = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        collection = await get_recipe_collection(self.mealie)
+        return [
+            {"slug": slug, "name": collection[slug].name, "minutes": minutes}
+            for slug, minutes in collection.filter_by_time(max_minutes, min_minutes, query=query, limit=limit)
+        ]
+
+    async def _op_get_recipe(self, slug: str) -> dict[str, Any]:
+        recipe = await self.mealie.get_recipe(slug)
+        return {
+            "slug": recipe.slug,
+            "name": recipe.name,
+            "description": recipe.description,
+            "ingredients": MealieClient.format_ingredients(recipe),
+            "instructions": recipe.instructions,
+            "times": {
+                "prep": recipe.prep_time,
+                "cook": recipe.cook_time,
+                "total": recipe.total_time,
+            },
+        }
+
+    async def _op_get_recipe_ingredients(self, slug: str) -> list[str]:
+        return await self.mealie.get_recipe_ingredients(slug)
+
+    async def _op_find_recipes_by_ingredients(
+        self, ingredients: list[str] | str, limit: int = 5
+    ) -> list[dict[str, Any]]:
+        if isinstance(ingredients, str):
+            ingredients = [ingredients]
+        index = await get_ingredient_index(self.mealie)
+        return [
+            {"slug": m.slug, "name": m.name, "uses": list(m.matched), "missing": list(m.missing)}
+            for m in index.find(ingredients, limit=limit)
+        ]
+
+    async def _op_plan_meals(
+        self,
+        days: int = 7,
+        max_minutes: int | None = None,
+        use_up: list[str] | None = None,
+        exclude: list[str] | None = None,
+    ) -> dict[str, Any]:
+        plan = await plan_meals_for(self.mealie, days, max_minutes, use_up, exclude)
+        return {
+            "meals": [
+                {"day": m.day, "slug": m.slug, "name": m.name, "minutes": m.minutes} for m in plan.meals
+            ],
+            "shopping_list": [f"{name} ({spec})" if spec else name for name, spec in plan.shopping],
+        }
+
+    def _require_bring(self) -> BringClient:
+        if self.bring is None:
+            raise RuntimeError("Bring client is not available")
+        return self.bring
+
+    async def _op_list_shopping_lists(self) -> list[str]:
+        lists = await self._require_bring().get_shopping_lists()
+        return [lst.name for lst in lists]
+
+    async def _find_list(self, list_name: str) -> ShoppingList:
+        bring = self._require_bring()
+        lst = await bring.get_list_by_name(list_name)
+        if not lst:
+            lists = await bring.get_shopping_lists()
+            available = ", ".join(l.name for l in lists)
+            raise LookupError(f"Shopping list '{list_name}' not found. Available lists: {available}")
+        return lst
+
+    async def _op_view_shopping_list(self, list_name: str) -> list[str]:
+        lst = await self._find_list(list_name)
+        items = await self._require_bring().get_list_items(lst.uuid)
+        return [
+            f"{item.name} ({item.specification})" if item.specification else item.name
+            for item in items
+        ]
+
+    async def _op_add_to_shopping_list(self, list_name: str, items: list[str] | str) -> str:
+        if isinstance(items, str):
+            items = [items]
+        lst = await self._find_list(list_name)
+        added = await add_ingredients(self._require_bring(), lst, items)
+        return f"Added {len(added)} items to '{lst.name}': {describe_items(added)}"
+
+    async def _op_add_recipes_to_shopping_list(
+        self, recipe_slugs: list[str] | str, list_name: str, skip_recently_bought: bool = False
+    ) -> dict[str, Any]:
+        if isinstance(recipe_slugs, str):
+            recipe_slugs = [recipe_slugs]
+        name, plan = await shop_for_recipes(
+            self.mealie, self._require_bring(), recipe_slugs, list_name, skip_recently_bought
+        )
+        return {
+            "list": name,
+            "added": [f"{item} ({spec})" if spec else item for item, spec in plan.to_buy],
+            "already_on_list": plan.on_list,
+            "in_pantry": plan.in_pantry,
+            "recently_bought": plan.recently_bought,
+        }
+
+
+class PlannerAgent:
+    """Agent-compatible runner for the planner/executor mode.
+
+    Exposes ``ainvoke`` with the same input/output shape as the LangGraph
+    agents, so it can be used anywhere the supervisor agent is used.
+    """
+
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        callbacks: list[Any] | None = None,
+        escalation: BaseChatModel | None = None,
+        fallback: Callable[[], Any] | None = None,
+    ) -> None:
+        """Initialize the planner agent.
+
+        Args:
+            llm: Chat model used for planning and the final summary
+            callbacks: Callback handlers attached to every LLM call
+            escalation: Stronger model retried when ``llm`` fails or returns a
+                plan that does not match the schema
+            fallback: Factory of the agent that answers requests the model
+                cannot plan validly; built on first use
+        """
+        self.llm: Runnable = llm
+        self.callbacks = callbacks or []
+        self.fallback = fallback
+        self._fallback_agent: Any = None
+        self.planner: Runnable = llm.with_structured_output(Plan, method="function_calling")
+        if escalation is not None:
+            self.llm = llm.with_fallbacks([escalation])
+            self.planner = self.planner.with_fallbacks(
+                [escalation.with_structured_output(Plan, method="function_calling")]
+            )
+
+    async def plan(self, request: str, config: Any = None) -> Plan:
+        """Ask the model for a plan for ``request`` (LLM call 1).
+
+        An invalid plan is returned to the model once with the error.
+
+        Raises:
+            PlanError: If the corrected plan is invalid too
+        """
+        messages = [SystemMessage(PLANNER_SYSTEM_PROMPT), HumanMessage(request)]
+        plan = await self.planner.ainvoke(messages, config)
+        try:
+            validate_plan(plan)
+        except PlanError as e:
+            messages.append(
+                HumanMessage(f"This plan is invalid: {e}\n{plan.model_dump_json()}\nReturn a corrected plan.")
+            )
+            plan = await self.planner.ainvoke(messages, config)
+            validate_plan(plan)
+        return plan
+
+    async def execute(self, plan: Plan) -> dict[str, Any]:
+        """Open the clients the plan needs and execute it."""
+        async with AsyncExitStack() as stack:
+            mealie = await stack.enter_async_context(get_mealie_client())
+            bring = None
+            if any(step.operation in BRING_OPERATIONS for step in plan.steps):
+                bring = await stack.enter_async_context(get_bring_client())
+            return await PlanExecutor(mealie, bring).execute(plan)
+
+    async def summarize(
+        self, request: str, plan: Plan, results: dict[str, Any], config: Any = None
+    ) -> AIMessage:
+        """Turn the executed plan into an answer for the user (LLM call 2)."""
+        executed = [
+            {"id": step.id, "operation": step.operation, "args": step.args, "result": results.get(step.id)}
+            for step in plan.steps
+        ]
+        return await self.llm.ainvoke(
+            [
+                SystemMessage(SUMMARY_SYSTEM_PROMPT),
+                HumanMessage(
+                    f"Request: {request}\n\n"
+                    f"Executed operations:\n{json.dumps(executed, ensure_ascii=False, indent=1)}"
+                ),
+            ],
+            config,
+        )
+
+    async def ainvoke(self, input: dict[str, Any], config: Any = None) -> dict[str, Any]:
+        """Plan, execute and summarize the last user message.
+
+        Requests without a valid plan are answered by the fallback agent.
+
+        Args:
+            input: ``{"messages": [...]}`` as accepted by the LangGraph agents
+            config: Optional runnable config (e.g. callbacks) for the LLM calls
+
+        Returns:
+            ``{"messages": [...]}`` with the summary appended
+        """
+        messages = list(input["messages"])
+        last = messages[-1]
+        request = last["content"] if isinstance(last, dict) else last.text
+
+        planner_config = merge_configs(
+            {"callbacks": self.callbacks, "metadata": {"lc_agent_name": "planner"}},
+            config,
+        )
+        try:
+            plan = await self.plan(request, planner_config)
+        except PlanError:
+            if self.fallback is None:
+                raise
+            if self._fallback_agent is None:
+                self._fallback_agent = self.fallback()
+            return await self._fallback_agent.ainvoke(input, config)
+        results = await self.execute(plan) if plan.steps else {}
+        answer = await self.summarize(request, plan, results, planner_config)
+        return {"messages": [*messages, answer]}
+
+
+def create_planner_agent() -> PlannerAgent:
+    """Create the planner/executor agent."""
+    escalation = create_chat_model("planner", escalated=True) if escalation_model_name("planner") else None
+    return PlannerAgent(
+        create_chat_model("planner"),
+        callbacks=[usage_handler],
+        escalation=escalation,
+        fallback=create_supervisor_agent,
+    )
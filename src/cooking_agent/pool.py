@@ -0,0 +1,77 @@
+"""Mealie and Bring clients shared per event loop.
+
+Tools, the planner and the shopping helpers all use the clients returned
+here. Entering a shared client opens it if needed; it stays open while any
+task uses it, and for the whole session after ``open_clients`` (called by the
+startup warm-up), so connections, TLS sessions and the Bring login are reused
+across tool calls and turns. Clients are bound to the event loop they run in,
+so each loop gets its own. Getting the Mealie client also starts a background
+sync of the recipe store once its last sync is older than
+``recipe_store_max_age``, so stored recipes do not go stale.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from weakref import WeakKeyDictionary
+
+from cooking_agent.bring.client import BringClient
+from cooking_agent.config import get_settings
+from cooking_agent.mealie.client import MealieClient
+from cooking_agent.mealie.store import get_recipe_store, start_store_sync
+from cooking_agent.ratelimit import get_rate_limiter
+
+
+@dataclass
+class _Clients:
+    mealie: MealieClient | None = None
+    bring: BringClient | None = None
+    held: list[MealieClient | BringClient] = field(default_factory=list)
+
+
+_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, _Clients] = WeakKeyDictionary()
+
+
+def _loop_clients() -> _Clients:
+    return _clients.setdefault(asyncio.get_running_loop(), _Clients())
+
+
+def get_mealie_client() -> MealieClient:
+    """Get the shared Mealie client of the running event loop (use with ``async with``)."""
+    clients = _loop_clients()
+    settings = get_settings()
+    if clients.mealie is None:
+        clients.mealie = MealieClient(
+            settings.mealie_url, settings.mealie_api_token, get_recipe_store(), get_rate_limiter("mealie")
+        )
+    store, max_age = clients.mealie.store, settings.recipe_store_max_age
+    if store is not None and max_age > 0 and store.stale(max_age):
+        start_store_sync()
+    return clients.mealie
+
+
+def get_bring_client() -> BringClient:
+    """Get the shared Bring client of the running event loop (use with ``async with``)."""
+    clients = _loop_clients()
+    if clients.bring is None:
+        settings = get_settings()
+        clients.bring = BringClient(
+            settings.bring_email, settings.bring_password, settings.bring_api_url, get_rate_limiter("bring")
+        )
+    return clients.bring
+
+
+async def open_clients(mealie: bool = True, bring: bool = True) -> None:
+    """Open the shared clients and keep them open until ``close_clients``."""
+    clients = _loop_clients()
+    wanted = [get_mealie_client() if mealie else None, get_bring_client() if bring else None]
+    for client in wanted:
+        if client is not None and client not in clients.held:
+            await client.__aenter__()
+            clients.held.append(client)
+
+
+async def close_clients() -> None:
+    """Release the clients kept open by ``open_clients``."""
+    clients = _loop_clients()
+    while clients.held:
+        await clients.held.pop().__aexit__(None, None, None)
@@ -0,0 +1,180 @@
+"""Client-side rate limiting of the Mealie and Bring backends.
+
+Each backend gets one ``RateLimiter`` shared by all its clients: a token bucket
+bounds the request rate and a slot count bounds the requests in flight, so
+parallel tool calls and sessions cannot flood a small Mealie container or trip
+Bring's throttling. Waiting requests are served by priority lane, so
+interactive requests pre-empt background traffic (store sync, prefetching);
+code marks its requests as background with ``with background(): ...``.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import lru_cache
+
+
+class Priority(IntEnum):
+    """Priority lanes; lower values are served first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_priority: ContextVar[Priority] = ContextVar("cooking_agent_priority", default=Priority.INTERACTIVE)
+
+
+@contextmanager
+def background() -> Iterator[None]:
+    """Send the requests made inside the block (and tasks it starts) in the background lane."""
+    token = _priority.set(Priority.BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+@dataclass
+class LaneStats:
+    """Queueing of one priority lane."""
+
+    requests: int = 0
+    waiting: int = 0
+    max_waiting: int = 0
+    wait_s: float = 0.0
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    future: asyncio.Future[None] | None = field(default=None, compare=False)
+
+
+class RateLimiter:
+    """Async token bucket plus concurrency limit with priority lanes."""
+
+    def __init__(
+        self, rate: float | None = None, burst: int = 10, max_concurrency: int | None = None
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Sustained requests per second (None: unlimited)
+            burst: Requests that may start at once after an idle period
+            max_concurrency: Maximum requests in flight (None: unlimited)
+        """
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.max_concurrency = max_concurrency
+        self.active = 0
+        self.lanes = {priority: LaneStats() for priority in Priority}
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._waiters: list[_Waiter] = []
+        self._seq = itertools.count()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting in all lanes."""
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority | None = None) -> AsyncIterator[None]:
+        """Wait for a request slot and hold it for the duration of the block.
+
+        Args:
+            priority: Lane to wait in; defaults to the lane of the current context
+        """
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: Priority | None = None) -> None:
+        """Wait until a request may start; pair with ``release``."""
+        priority = _priority.get() if priority is None else priority
+        lane = self.lanes[priority]
+        lane.requests += 1
+        if not self._waiters and self._has_slot() and self._take_token() == 0.0:
+            self.active += 1
+            return
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(priority, next(self._seq))
+        heapq.heappush(self._waiters, waiter)
+        lane.waiting += 1
+        lane.max_waiting = max(lane.max_waiting, lane.waiting)
+        start = time.perf_counter()
+        try:
+            while True:
+                if self._waiters[0] is waiter and self._has_slot():
+                    delay = self._take_token()
+                    if delay == 0.0:
+                        break
+                    await asyncio.sleep(delay)  # the head waits for the bucket to refill
+                    continue
+                waiter.future = loop.create_future()
+                await waiter.future
+        finally:
+            self._waiters.remove(waiter)
+            heapq.heapify(self._waiters)
+            lane.waiting -= 1
+            lane.wait_s += time.perf_counter() - start
+            self._wake_head()
+        self.active += 1
+
+    def release(self) -> None:
+        """Release a slot taken by ``acquire``."""
+        self.active -= 1
+        self._wake_head()
+
+    def _has_slot(self) -> bool:
+        return self.max_concurrency is None or self.active < self.max_concurrency
+
+    def _take_token(self) -> float:
+        """Take a token if available; otherwise return seconds until one is."""
+        if self.rate is None:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return 0.0
+        return (1.0 - self._tokens) / self.rate
+
+    def _wake_head(self) -> None:
+        if self._waiters and (future := self._waiters[0].future) is not None and not future.done():
+            future.set_result(None)
+
+    def stats(self) -> dict[str, float]:
+        """Queue depth, requests and waiting time per lane."""
+        result: dict[str, float] = {"active": self.active, "queue_depth": self.queue_depth}
+        for priority, lane in self.lanes.items():
+            name = priority.name.lower()
+            result[f"{name}_requests"] = lane.requests
+            result[f"{name}_waiting"] = lane.waiting
+            result[f"{name}_max_waiting"] = lane.max_waiting
+            result[f"{name}_wait_s"] = round(lane.wait_s, 3)
+        return result
+
+
+@lru_cache
+def get_rate_limiter(backend: str) -> RateLimiter:
+    """Get the shared limiter of a backend ("mealie" or "bring") from the settings."""
+    from cooking_agent.config import get_settings
+
+    settings = get_settings()
+    return RateLimiter(
+        getattr(settings, f"{backend}_rate_limit"),
+        getattr(settings, f"{backend}_burst"),
+        getattr(settings, f"{backend}_max_concurrency"),
+    )
@@ -0,0 +1,258 @@
+"""Pantry-aware shopping: add only what actually needs buying.
+
+Combines a recipe's ingredients with the Bring list's current items, a local
+pantry and, on request, its recently bought items, and computes the items to
+buy in one pass with set operations over normalized food names, so "add the
+ingredients of X to my list" does not duplicate what is already on the list or
+at home.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from langchain_core.tools import tool
+
+from cooking_agent.bring.catalog import BringCatalog, get_catalog
+from cooking_agent.bring.client import BringClient, ShoppingItem
+from cooking_agent.config import get_settings
+from cooking_agent.mealie.client import MealieClient, Recipe
+from cooking_agent.mealie.index import normalize_food
+from cooking_agent.pool import get_bring_client, get_mealie_client
+from cooking_agent.tracing import traced
+
+
+class Pantry:
+    """Foods the household has at home, optionally persisted as JSON."""
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """Load the pantry.
+
+        Args:
+            path: JSON file holding the list of foods; kept in memory if None
+        """
+        self.path = Path(path) if path else None
+        self._foods: dict[str, str] = {}
+        if self.path and self.path.exists():
+            for food in json.loads(self.path.read_text(encoding="utf-8")):
+                self._foods[normalize_food(food)] = food
+
+    def __contains__(self, food: object) -> bool:
+        return isinstance(food, str) and normalize_food(food) in self._foods
+
+    def __len__(self) -> int:
+        return len(self._foods)
+
+    @property
+    def foods(self) -> list[str]:
+        """Foods in the pantry, sorted by name."""
+        return sorted(self._foods.values(), key=str.lower)
+
+    def keys(self) -> set[str]:
+        """Normalized names of the foods in the pantry."""
+        return set(self._foods)
+
+    def add(self, foods: list[str]) -> None:
+        """Add foods to the pantry."""
+        for food in foods:
+            if key := normalize_food(food):
+                self._foods[key] = food
+        self._save()
+
+    def remove(self, foods: list[str]) -> None:
+        """Remove foods from the pantry."""
+        for food in foods:
+            self._foods.pop(normalize_food(food), None)
+        self._save()
+
+    def _save(self) -> None:
+        if self.path:
+            self.path.write_text(json.dumps(self.foods, ensure_ascii=False, indent=1), encoding="utf-8")
+
+
+@lru_cache
+def get_pantry() -> Pantry:
+    """Get the pantry configured in the settings."""
+    return Pantry(get_settings().pantry_file)
+
+
+@dataclass
+class ShoppingPlan:
+    """What to buy for a set of ingredients, and why the rest is skipped."""
+
+    to_buy: list[tuple[str, str]] = field(default_factory=list)
+    on_list: list[str] = field(default_factory=list)
+    recently_bought: list[str] = field(default_factory=list)
+    in_pantry: list[str] = field(default_factory=list)
+
+
+def _specification(amounts: dict[str, float], details: dict[str, None]) -> str:
+    parts = [" + ".join(f"{quantity:g} {unit}".strip() for unit, quantity in amounts.items()), *details]
+    return ", ".join(part for part in parts if part)
+
+
+def plan_shopping(
+    recipes: list[Recipe],
+    on_list: list[ShoppingItem],
+    recently_bought: list[ShoppingItem],
+    pantry_keys: set[str],
+    skip_recently_bought: bool = False,
+    catalog: BringCatalog | None = None,
+) -> ShoppingPlan:
+    """Compute which recipe ingredients need to be bought.
+
+    Ingredients are merged by normalized food name across recipes, summing
+    quantities per unit. An ingredient is skipped if it is already on the
+    list, in the pantry or, if asked, was bought recently (a recent purchase
+    may well be used up, so this is off by default).
+
+    Args:
+        recipes: Recipes to shop for
+        on_list: Items currently on the shopping list
+        recently_bought: Items recently bought from the list
+        pantry_keys: Normalized names of foods at home
+        skip_recently_bought: Treat recently bought items as available
+        catalog: Bring catalog of the list; foods are then named and merged
+            as catalog items ("Onion" and "Zwiebel" are both "Zwiebeln")
+
+    Returns:
+        Items to buy as (name, specification) and the skipped items by reason
+    """
+    needed: dict[str, tuple[str, dict[str, float], dict[str, None]]] = {}
+    for recipe in recipes:
+        for ing in recipe.ingredients:
+            name = ing.food or ing.note
+            detail = ""
+            if name and catalog is not None:
+                item = catalog.match(name) if ing.food else catalog.parse(name)
+                name, detail = item.name, item.specification
+            key = normalize_food(name) if name else ""
+            if not key:
+                continue
+            _, amounts, details = needed.setdefault(key, (name, {}, {}))
+            if detail:
+                details[detail] = None
+            if ing.quantity:
+                unit = ing.unit or ""
+                amounts[unit] = amounts.get(unit, 0.0) + ing.quantity
+
+    listed = {normalize_food(item.name) for item in on_list}
+    recent = {normalize_food(item.name) for item in recently_bought} if skip_recently_bought else set()
+    wanted = needed.keys()
+    on_list_keys = wanted & listed
+    pantry_hits = (wanted & pantry_keys) - on_list_keys
+    recent_hits = (wanted & recent) - on_list_keys - pantry_hits
+
+    plan = ShoppingPlan()
+    for key, (name, amounts, details) in needed.items():
+        if key in on_list_keys:
+            plan.on_list.append(name)
+        elif key in pantry_hits:
+            plan.in_pantry.append(name)
+        elif key in recent_hits:
+            plan.recently_bought.append(name)
+        else:
+            plan.to_buy.append((name, _specification(amounts, details)))
+    return plan
+
+
+async def shop_for_recipes(
+    mealie: MealieClient,
+    bring: BringClient,
+    recipe_slugs: list[str],
+    list_name: str,
+    skip_recently_bought: bool = False,
+) -> tuple[str, ShoppingPlan]:
+    """Add the ingredients of recipes that need buying to a shopping list.
+
+    Fetches the recipes and the list concurrently and pushes the items to buy
+    with one ``add_items`` call.
+
+    Returns:
+        The name of the list and the shopping plan
+
+    Raises:
+        LookupError: If the shopping list does not exist
+    """
+    lst = await bring.get_list_by_name(list_name)
+    if lst is None:
+        lists = await bring.get_shopping_lists()
+        available = ", ".join(l.name for l in lists)
+        raise LookupError(f"Shopping list '{list_name}' not found. Available lists: {available}")
+
+    *recipes, (on_list, recently_bought) = await asyncio.gather(
+        *(mealie.get_recipe(slug) for slug in recipe_slugs),
+        bring.get_list_contents(lst.uuid),
+    )
+    catalog = get_catalog(bring.list_locale(lst.uuid))
+    plan = plan_shopping(recipes, on_list, recently_bought, get_pantry().keys(), skip_recently_bought, catalog)
+    if plan.to_buy:
+        await bring.add_items(lst.uuid, list(plan.to_buy))
+    return lst.name, plan
+
+
+def format_shopping_plan(list_name: str, plan: ShoppingPlan) -> str:
+    """Describe a shopping plan for the user."""
+    if plan.to_buy:
+        items = ", ".join(f"{name} ({spec})" if spec else name for name, spec in plan.to_buy)
+        lines = [f"Added {len(plan.to_buy)} items to '{list_name}': {items}"]
+    else:
+        lines = [f"Nothing to add to '{list_name}'"]
+    if plan.on_list:
+        lines.append(f"Already on the list: {', '.join(plan.on_list)}")
+    if plan.in_pantry:
+        lines.append(f"In the pantry: {', '.join(plan.in_pantry)}")
+    if plan.recently_bought:
+        lines.append(f"Recently bought: {', '.join(plan.recently_bought)}")
+    return "\n".join(lines)
+
+
+@tool
+@traced("tool.add_recipes_to_shopping_list")
+async def add_recipes_to_shopping_list(
+    recipe_slugs: list[str], list_name: str, skip_recently_bought: bool = False
+) -> str:
+    """Add the ingredients of one or more recipes to a shopping list, skipping
+    what is already on the list or in the pantry.
+
+    Args:
+        recipe_slugs: Slugs of the recipes to shop for
+        list_name: Name of the shopping list
+        skip_recently_bought: Also skip items recently bought from the list, e.g. when
+            the user says they just went shopping (default: false)
+
+    Returns:
+        The items added and the items skipped with the reason
+    """
+    async with get_mealie_client() as mealie, get_bring_client() as bring:
+        try:
+            name, plan = await shop_for_recipes(mealie, bring, recipe_slugs, list_name, skip_recently_bought)
+        except LookupError as e:
+            return str(e)
+    return format_shopping_plan(name, plan)
+
+
+@tool
+@traced("tool.update_pantry")
+async def update_pantry(add: list[str] | None = None, remove: list[str] | None = None) -> str:
+    """Record foods the user has at home (or has used up).
+
+    Pantry foods are skipped when adding recipe ingredients to a shopping list.
+
+    Args:
+        add: Foods to add to the pantry
+        remove: Foods to remove from the pantry
+
+    Returns:
+        The contents of the pantry
+    """
+    pantry = get_pantry()
+    if add:
+        pantry.add(add)
+    if remove:
+        pantry.remove(remove)
+    if not len(pantry):
+        return "The pantry is empty"
+    return f"Pantry ({len(pantry)}): {', '.join(pantry.foods)}"
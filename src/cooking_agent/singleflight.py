@@ -0,0 +1,56 @@
+"""Coalescing of concurrent identical reads ("singleflight").
+
+When parallel tool calls or sessions ask for the same recipe, search or
+shopping list at the same moment, only the first caller runs the request; the
+others await its result. Calls are keyed by the caller (e.g. the client class,
+base URL and account) plus the endpoint and its parameters, and are shared only
+while in flight, so this works alongside any cache rather than replacing one.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Shares in-flight awaitables between callers with the same key."""
+
+    def __init__(self) -> None:
+        self._calls: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task[Any]] = {}
+        self.shared = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn()``, or await the result of an identical call in flight.
+
+        The call runs as its own task, so a cancelled caller does not cancel
+        it for the others. Calls are only shared within one event loop:
+        identical calls on another loop (e.g. another thread) run on their own.
+
+        Args:
+            key: Identity of the call, e.g. ``(base_url, "recipe", slug)``
+            fn: Coroutine function performing the call
+
+        Returns:
+            The result of the call (the same object for all sharing callers)
+        """
+        loop = asyncio.get_running_loop()
+        call_key = (loop, key)
+        task = self._calls.get(call_key)
+        if task is not None and not task.done():
+            self.shared += 1
+        else:
+            task = loop.create_task(fn())
+            self._calls[call_key] = task
+            task.add_done_callback(lambda t: self._forget(call_key, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, call_key: tuple[asyncio.AbstractEventLoop, Hashable], task: asyncio.Task[Any]) -> None:
+        if self._calls.get(call_key) is task:
+            del self._calls[call_key]
+        if not task.cancelled():
+            task.exception()  # retrieved by the callers; avoids "never retrieved" warnings
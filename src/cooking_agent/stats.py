@@ -0,0 +1,212 @@
+"""Per-turn accounting of LLM, tool and HTTP usage.
+
+The statistics of the running turn live in a context variable, so LLM
+callbacks, tools and HTTP hooks running anywhere below ``run_agent_async``
+record into the same ``TurnStats`` without passing it around. This module has
+no LangChain dependency so the API clients can import it cheaply.
+"""
+
+import json
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class ToolStats:
+    """Calls and latency of one tool."""
+
+    calls: int = 0
+    errors: int = 0
+    latency_s: float = 0.0
+
+
+@dataclass
+class AgentStats:
+    """LLM usage of one agent and the tools it called."""
+
+    llm_calls: int = 0
+    llm_latency_s: float = 0.0
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
+    tools: dict[str, ToolStats] = field(default_factory=dict)
+
+
+@dataclass
+class HttpStats:
+    """Requests and latency against one backend."""
+
+    calls: int = 0
+    errors: int = 0
+    latency_s: float = 0.0
+
+
+@dataclass
+class TokenPrices:
+    """Prices in USD per million tokens."""
+
+    input: float
+    cached_input: float
+    output: float
+
+
+@dataclass
+class TurnStats:
+    """Usage of a single user turn.
+
+    ``agents`` is keyed by the agent path, e.g. ``supervisor/mealie`` for the
+    Mealie sub-agent running below the supervisor.
+    """
+
+    prompt: str
+    started_at: float
+    duration_s: float = 0.0
+    agents: dict[str, AgentStats] = field(default_factory=dict)
+    http: dict[str, HttpStats] = field(default_factory=dict)
+    escalations: dict[str, int] = field(default_factory=dict)
+    cost_usd: float | None = None
+
+    def agent(self, path: str) -> AgentStats:
+        """Get the stats of an agent, creating them on first use."""
+        return self.agents.setdefault(path, AgentStats())
+
+    def record_http(self, client: str, latency_s: float, error: bool = False) -> None:
+        """Record one HTTP request made by ``client``."""
+        stats = self.http.setdefault(client, HttpStats())
+        stats.calls += 1
+        stats.errors += error
+        stats.latency_s += latency_s
+
+    def record_escalation(self, agent: str) -> None:
+        """Record that a model call of ``agent`` was retried on its stronger model."""
+        self.escalations[agent] = self.escalations.get(agent, 0) + 1
+
+    def totals(self) -> dict[str, float]:
+        """Sum LLM, tool and HTTP usage over all agents and clients."""
+        agents = self.agents.values()
+        tools = [tool for agent in agents for tool in agent.tools.values()]
+        return {
+            "llm_calls": sum(a.llm_calls for a in agents),
+            "llm_latency_s": sum(a.llm_latency_s for a in agents),
+            "input_tokens": sum(a.input_tokens for a in agents),
+            "cached_input_tokens": sum(a.cached_input_tokens for a in agents),
+            "output_tokens": sum(a.output_tokens for a in agents),
+            "tool_calls": sum(t.calls for t in tools),
+            "http_calls": sum(h.calls for h in self.http.values()),
+            "escalations": sum(self.escalations.values()),
+        }
+
+    def compute_cost(self, prices: TokenPrices) -> float:
+        """Compute and store the cost of the turn in USD."""
+        totals = self.totals()
+        uncached = totals["input_tokens"] - totals["cached_input_tokens"]
+        self.cost_usd = (
+            uncached * prices.input
+            + totals["cached_input_tokens"] * prices.cached_input
+            + totals["output_tokens"] * prices.output
+        ) / 1_000_000
+        return self.cost_usd
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return asdict(self)
+
+
+_current_turn: ContextVar[TurnStats | None] = ContextVar("cooking_agent_turn", default=None)
+
+
+def current_turn() -> TurnStats | None:
+    """Get the stats of the turn running in this context, if any."""
+    return _current_turn.get()
+
+
+class UsageTracker:
+    """Collects ``TurnStats`` for every turn of a session."""
+
+    def __init__(self, jsonl_path: str | Path | None = None, prices: TokenPrices | None = None) -> None:
+        """Initialize the tracker.
+
+        Args:
+            jsonl_path: Append each finished turn as a JSON line to this file
+            prices: Token prices used to compute the cost of each turn
+        """
+        self.jsonl_path = Path(jsonl_path) if jsonl_path else None
+        self.prices = prices
+        self.turns: list[TurnStats] = []
+
+    @contextmanager
+    def turn(self, prompt: str) -> Iterator[TurnStats]:
+        """Track everything that happens inside the block as one turn."""
+        stats = TurnStats(prompt=prompt, started_at=time.time())
+        token = _current_turn.set(stats)
+        start = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            stats.duration_s = time.perf_counter() - start
+            _current_turn.reset(token)
+            if self.prices:
+                stats.compute_cost(self.prices)
+            self.turns.append(stats)
+            if self.jsonl_path:
+                with self.jsonl_path.open("a", encoding="utf-8") as f:
+                    f.write(json.dumps(stats.to_dict(), ensure_ascii=False) + "\n")
+
+    @property
+    def last_turn(self) -> TurnStats | None:
+        """The most recently finished turn."""
+        return self.turns[-1] if self.turns else None
+
+    def session_totals(self) -> dict[str, float]:
+        """Sum the totals of all finished turns."""
+        totals: dict[str, float] = {"turns": len(self.turns), "duration_s": 0.0}
+        for turn in self.turns:
+            totals["duration_s"] += turn.duration_s
+            for key, value in turn.totals().items():
+                totals[key] = totals.get(key, 0) + value
+            if turn.cost_usd is not None:
+                totals["cost_usd"] = totals.get("cost_usd", 0.0) + turn.cost_usd
+        return totals
+
+
+def httpx_event_hooks(client: str) -> dict[str, list[Any]]:
+    """Event hooks for ``httpx.AsyncClient`` recording requests of ``client``."""
+
+    async def on_request(request: Any) -> None:
+        request.extensions["cooking_agent_start"] = time.perf_counter()
+
+    async def on_response(response: Any) -> None:
+        turn = current_turn()
+        if turn is None:
+            return
+        start = response.request.extensions.get("cooking_agent_start", time.perf_counter())
+        turn.record_http(client, time.perf_counter() - start, error=response.is_error)
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+def aiohttp_trace_config(client: str) -> Any:
+    """``aiohttp.TraceConfig`` recording requests of ``client``."""
+    import aiohttp
+
+    async def on_request_start(session: Any, ctx: Any, params: Any) -> None:
+        ctx.start = time.perf_counter()
+
+    async def on_request_end(session: Any, ctx: Any, params: Any) -> None:
+        if (turn := current_turn()) is not None:
+            turn.record_http(client, time.perf_counter() - ctx.start, error=params.response.status >= 400)
+
+    async def on_request_exception(session: Any, ctx: Any, params: Any) -> None:
+        if (turn := current_turn()) is not None:
+            turn.record_http(client, time.perf_counter() - ctx.start, error=True)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
@@ -1,17 +1,20 @@
 """Supervisor agent that orchestrates Mealie and Bring agents."""
 
 from langchain.agents import create_agent
-from langchain.chat_models import init_chat_model
 
-from cooking_agent.config import get_settings
+from cooking_agent.escalation import escalation_middleware
+from cooking_agent.instrumentation import usage_handler
+from cooking_agent.llm import create_chat_model, ordered_tools
 from cooking_agent.mealie.agent import mealie_recipes
 from cooking_agent.bring.agent import bring_shopping
+from cooking_agent.mealplan import plan_meals
+from cooking_agent.shopping import add_recipes_to_shopping_list, update_pantry
 
 
 SUPERVISOR_SYSTEM_PROMPT = """You are a cooking assistant supervisor that coordinates between recipe management and shopping list operations.
 
 You manage two specialized agents:
-1. **mealie** - Handles recipe search, viewing recipe details, and getting ingredients
+1. **mealie** - Handles recipe search, viewing recipe details, getting ingredients, and finding recipes by ingredients on hand
 2. **bring** - Handles shopping list management (viewing lists, adding items)
 
 For each user request, decide which agent(s) should handle it:
@@ -19,21 +22,48 @@ For each user request, decide which agent(s) should handle it:
 - Shopping list questions → bring  
 - "Add recipe ingredients to shopping list" → First mealie (get ingredients), then bring (add to list)
 
+You can also call these tools directly:
+- **add_recipes_to_shopping_list** - Adds the ingredients of recipes (by slug) to a list, skipping items
+  already on the list or in the pantry (and recently bought ones if the user just went shopping). Prefer
+  it over mealie → bring when the recipe slugs are known.
+- **update_pantry** - Records foods the user has at home or has used up
+- **plan_meals** - Plans meals for several days from the whole collection (time limits, foods to use up)
+  and returns the shopping list; use it instead of searching recipe by recipe
+
 After delegating to agents, synthesize their responses for the user.
 
+PARALLEL DELEGATION: When a request contains sub-tasks that do not depend on each other
+(e.g. "find a pasta recipe and show my Einkaufsliste"), call all of the needed agents in the
+SAME response so they run concurrently. Do not wait for one independent result before
+requesting the other.
+
 IMPORTANT: For multi-step tasks (like adding recipe ingredients to a shopping list):
 1. First route to mealie to get the ingredients
-2. Then route to bring to add them to the list
-3. Finally, provide a summary to the user"""
+2. Then route to bring to add them to the list, once the ingredients are known
+3. Finally, provide a summary to the user
+
+Only this ingredients → shopping list flow needs to be sequential, because bring needs the
+output of mealie. Any other work in the same request can still be delegated in parallel."""
 
 def create_supervisor_agent():
-    llm = init_chat_model(model=get_settings().model_name, api_key=get_settings().openai_api_key)
+    """Create the supervisor agent.
+
+    Tool calls emitted in a single model response are executed concurrently by
+    the agent graph, so independent Mealie and Bring work overlaps instead of
+    costing two sequential round-trips.
+    """
+    llm = create_chat_model("supervisor")
     supervisor_agent = create_agent(
         llm,
-        tools=[
+        tools=ordered_tools([
             mealie_recipes,
             bring_shopping,
-        ],
+            add_recipes_to_shopping_list,
+            update_pantry,
+            plan_meals,
+        ]),
         system_prompt=SUPERVISOR_SYSTEM_PROMPT,
+        name="supervisor",
+        middleware=escalation_middleware("supervisor"),
     )
-    return supervisor_agent
+    return supervisor_agent.with_config(callbacks=[usage_handler])
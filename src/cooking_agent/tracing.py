@@ -0,0 +1,370 @@
+"""Lightweight span-based tracing across agents, tools and HTTP clients.
+
+Spans nest through a context variable, so a span opened in ``run_agent_async``
+is the parent of the delegating tool spans, which are the parents of the tool
+and HTTP request spans below them, even across asyncio tasks. Finished traces
+are handed to pluggable exporters:
+
+- ``ChromeTraceExporter`` writes the Chrome trace event format, which opens as
+  a flame graph in Perfetto, ``chrome://tracing`` or speedscope. No collector
+  is required.
+- ``OTLPHttpExporter`` posts OTLP/JSON to an OpenTelemetry collector.
+
+Tracing is disabled (and nearly free) until an exporter is added.
+"""
+
+import asyncio
+import functools
+import itertools
+import json
+import os
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ParamSpec, Protocol, TypeVar
+
+import httpx
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+    lane: int = 0
+    detached: bool = False  # started after the root of its trace ended; exported on its own
+
+    @property
+    def duration_ns(self) -> int:
+        """Duration of the finished span in nanoseconds."""
+        return (self.end_ns or time.time_ns()) - self.start_ns
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+        self.attributes[key] = value
+
+
+class SpanExporter(Protocol):
+    """Receives finished traces."""
+
+    def export(self, spans: list[Span]) -> None:
+        """Export the spans of one finished trace."""
+
+    def shutdown(self) -> None:
+        """Flush and release resources."""
+
+
+_current_span: ContextVar[Span | None] = ContextVar("cooking_agent_span", default=None)
+
+
+def _new_id(n_bytes: int) -> str:
+    return os.urandom(n_bytes).hex()
+
+
+class Tracer:
+    """Creates spans and hands finished traces to the exporters."""
+
+    def __init__(self) -> None:
+        self.exporters: list[SpanExporter] = []
+        # Spans and flame graph rows (task → lane) of the traces whose root is open.
+        self._pending: dict[str, list[Span]] = {}
+        self._lanes: dict[str, dict[int, int]] = {}
+        self._next_lane = itertools.count(1)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any exporter is configured."""
+        return bool(self.exporters)
+
+    def add_exporter(self, exporter: SpanExporter) -> None:
+        """Register an exporter; enables tracing."""
+        self.exporters.append(exporter)
+
+    def shutdown(self) -> None:
+        """Shut down and remove all exporters."""
+        for exporter in self.exporters:
+            exporter.shutdown()
+        self.exporters.clear()
+
+    def _lane(self, trace_id: str) -> int:
+        """Small integer identifying the current asyncio task within a trace (flame graph row)."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is None:
+            return 0
+        lanes = self._lanes.get(trace_id)
+        if lanes is None:  # the trace has ended
+            return next(self._next_lane)
+        if id(task) not in lanes:
+            lanes[id(task)] = next(self._next_lane)
+        return lanes[id(task)]
+
+    def start_span(self, name: str, **attributes: Any) -> Span | None:
+        """Start a span below the current one without making it current.
+
+        Use this when start and end happen in different callbacks (e.g. HTTP
+        hooks); end it with ``end_span``. Returns None if tracing is disabled.
+        """
+        if not self.exporters:
+            return None
+        parent = _current_span.get()
+        trace_id = parent.trace_id if parent else _new_id(16)
+        if parent is None:
+            self._pending[trace_id] = []
+            self._lanes[trace_id] = {}
+        span = Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=_new_id(8),
+            parent_id=parent.span_id if parent else None,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+            lane=self._lane(trace_id),
+        )
+        # Spans started after their root ended (e.g. by background prefetches)
+        # are not collected; they are exported on their own when they end.
+        if (pending := self._pending.get(trace_id)) is not None:
+            pending.append(span)
+        else:
+            span.detached = True
+        return span
+
+    def end_span(self, span: Span | None, error: BaseException | str | None = None) -> None:
+        """Finish a span; exports the trace once its root span ends."""
+        if span is None or span.end_ns is not None:
+            return
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = str(error) or type(error).__name__
+        if span.parent_id is None:
+            spans = self._pending.pop(span.trace_id, [])
+            self._lanes.pop(span.trace_id, None)
+        elif span.detached:
+            spans = [span]
+        else:
+            return
+        for exporter in self.exporters:
+            exporter.export(spans)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span | None]:
+        """Run the block inside a new current span."""
+        span = self.start_span(name, **attributes)
+        if span is None:
+            yield None
+            return
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, e)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+
+tracer = Tracer()
+span = tracer.span
+
+
+def traced(name: str) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Decorate an async function to run inside a span called ``name``."""
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with tracer.span(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def httpx_tracing_hooks(client: str) -> dict[str, list[Any]]:
+    """Event hooks for ``httpx.AsyncClient`` creating a span per request."""
+
+    async def on_request(request: httpx.Request) -> None:
+        request.extensions["cooking_agent_span"] = tracer.start_span(
+            f"http.{client}",
+            **{"http.method": request.method, "http.url": str(request.url)},
+        )
+
+    async def on_response(response: httpx.Response) -> None:
+        span = response.request.extensions.get("cooking_agent_span")
+        if span is not None:
+            span.set_attribute("http.status_code", response.status_code)
+            tracer.end_span(span, f"HTTP {response.status_code}" if response.is_error else None)
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+def aiohttp_tracing_config(client: str) -> Any:
+    """``aiohttp.TraceConfig`` creating a span per request."""
+    import aiohttp
+
+    async def on_request_start(session: Any, ctx: Any, params: Any) -> None:
+        ctx.span = tracer.start_span(
+            f"http.{client}",
+            **{"http.method": params.method, "http.url": str(params.url)},
+        )
+
+    async def on_request_end(session: Any, ctx: Any, params: Any) -> None:
+        if ctx.span is not None:
+            status = params.response.status
+            ctx.span.set_attribute("http.status_code", status)
+            tracer.end_span(ctx.span, f"HTTP {status}" if status >= 400 else None)
+
+    async def on_request_exception(session: Any, ctx: Any, params: Any) -> None:
+        tracer.end_span(ctx.span, params.exception)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
+
+
+class ChromeTraceExporter:
+    """Write spans as Chrome trace events ("X" complete events).
+
+    The file is a JSON array that is appended to after every trace; the
+    closing bracket is optional in this format, so the file stays loadable
+    while the process is running.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the exporter.
+
+        Args:
+            path: Trace file to write; it is truncated on start
+        """
+        self.path = Path(path)
+        self.path.write_text("[\n", encoding="utf-8")
+        self._pid = os.getpid()
+
+    def export(self, spans: list[Span]) -> None:
+        """Append the spans of one trace to the file."""
+        with self.path.open("a", encoding="utf-8") as f:
+            for span in spans:
+                event = {
+                    "name": span.name,
+                    "cat": span.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": span.duration_ns / 1000,
+                    "pid": self._pid,
+                    "tid": span.lane,
+                    "args": {
+                        **span.attributes,
+                        "trace_id": span.trace_id,
+                        "span_id": span.span_id,
+                        "parent_id": span.parent_id,
+                        **({"error": span.error} if span.error else {}),
+                    },
+                }
+                f.write(json.dumps(event, ensure_ascii=False, default=str) + ",\n")
+
+    def shutdown(self) -> None:
+        """Nothing to flush; every trace is written on export."""
+
+
+class OTLPHttpExporter:
+    """Post spans to an OpenTelemetry collector using OTLP/HTTP with JSON.
+
+    Requests are sent from a background thread so exporting never blocks a
+    turn.
+    """
+
+    def __init__(self, endpoint: str, service_name: str = "cooking-agent", timeout: float = 5.0) -> None:
+        """Initialize the exporter.
+
+        Args:
+            endpoint: Collector base URL, e.g. http://localhost:4318
+            service_name: Reported ``service.name`` resource attribute
+            timeout: Request timeout in seconds
+        """
+        self.url = f"{endpoint.rstrip('/')}/v1/traces"
+        self.service_name = service_name
+        self._client = httpx.Client(timeout=timeout)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="otlp-export")
+
+    @staticmethod
+    def _attribute(key: str, value: Any) -> dict[str, Any]:
+        if isinstance(value, bool):
+            return {"key": key, "value": {"boolValue": value}}
+        if isinstance(value, int):
+            return {"key": key, "value": {"intValue": str(value)}}
+        if isinstance(value, float):
+            return {"key": key, "value": {"doubleValue": value}}
+        return {"key": key, "value": {"stringValue": str(value)}}
+
+    def _payload(self, spans: list[Span]) -> dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [self._attribute("service.name", self.service_name)]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "cooking_agent.tracing"},
+                            "spans": [
+                                {
+                                    "traceId": span.trace_id,
+                                    "spanId": span.span_id,
+                                    **({"parentSpanId": span.parent_id} if span.parent_id else {}),
+                                    "name": span.name,
+                                    "kind": 3 if span.name.startswith("http.") else 1,
+                                    "startTimeUnixNano": str(span.start_ns),
+                                    "endTimeUnixNano": str(span.end_ns or span.start_ns),
+                                    "attributes": [self._attribute(k, v) for k, v in span.attributes.items()],
+                                    "status": (
+                                        {"code": 2, "message": span.error} if span.error else {"code": 1}
+                                    ),
+                                }
+                                for span in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def _post(self, payload: dict[str, Any]) -> None:
+        try:
+            self._client.post(self.url, json=payload)
+        except httpx.HTTPError:
+            pass  # Tracing must never break the assistant.
+
+    def export(self, spans: list[Span]) -> None:
+        """Send the spans of one trace in the background."""
+        self._executor.submit(self._post, self._payload(spans))
+
+    def shutdown(self) -> None:
+        """Wait for pending exports and close the HTTP client."""
+        self._executor.shutdown(wait=True)
+        self._client.close()
+
+
+def configure_tracing(trace_file: str | None = None, otlp_endpoint: str | None = None) -> None:
+    """Add the exporters selected in the settings to the global tracer."""
+    if trace_file:
+        tracer.add_exporter(ChromeTraceExporter(trace_file))
+    if otlp_endpoint:
+        tracer.add_exporter(OTLPHttpExporter(otlp_endpoint))
@@ -0,0 +1,94 @@
+"""Startup warm-up of connections, caches and agents.
+
+Without it the first turn pays for the Mealie TLS handshake, the Bring login,
+loading the shopping lists and building the agents (including importing
+LangChain) on its critical path. The CLI runs ``build_agent`` and ``warm_up``
+on its background loop right after showing the prompt. The heavy modules are
+imported inside the coroutines so that importing this module stays cheap.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class WarmupReport:
+    """Duration of each warm-up step, and the error of failed steps."""
+
+    durations: dict[str, float] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+
+async def build_agent(mode: str | None = None) -> Any:
+    """Import the agent modules and build the agent for ``mode``."""
+    from cooking_agent.modes import create_cooking_agent
+
+    return create_cooking_agent(mode)
+
+
+async def _warm_mealie() -> None:
+    from cooking_agent.pool import get_mealie_client, open_clients
+
+    await open_clients(mealie=True, bring=False)
+    await get_mealie_client().list_recipes(per_page=1)  # connect
+
+
+async def _sync_store() -> None:
+    from cooking_agent.mealie.store import get_recipe_store, start_store_sync
+
+    if get_recipe_store() is not None:
+        await start_store_sync()  # in the background lane, behind the first turn
+
+
+async def _warm_bring() -> None:
+    from cooking_agent.pool import get_bring_client, open_clients
+
+    await open_clients(mealie=False, bring=True)  # logs in
+    await get_bring_client().get_shopping_lists()
+
+
+async def _build_sub_agents() -> None:
+    from cooking_agent.bring.agent import get_bring_agent
+    from cooking_agent.mealie.agent import get_mealie_agent
+
+    get_mealie_agent()
+    get_bring_agent()
+
+
+async def warm_up() -> WarmupReport:
+    """Open the shared clients, load the shopping lists, sync the recipe store and build the sub-agents.
+
+    Steps run concurrently and fail independently; a failed step only means
+    the first turn does that work itself.
+
+    Returns:
+        Timing and errors of the steps
+    """
+    report = WarmupReport()
+
+    async def step(name: str, coro: Any) -> None:
+        start = time.perf_counter()
+        try:
+            await coro
+        except Exception as e:
+            report.errors[name] = str(e) or type(e).__name__
+        report.durations[name] = time.perf_counter() - start
+
+    await asyncio.gather(
+        step("mealie", _warm_mealie()),
+        step("recipe store", _sync_store()),
+        step("bring", _warm_bring()),
+        step("agents", _build_sub_agents()),
+    )
+    return report
+
+
+async def shut_down() -> None:
+    """Stop running recipe prefetches and close the shared clients kept open by the warm-up."""
+    from cooking_agent.mealie.prefetch import get_prefetcher
+    from cooking_agent.pool import close_clients
+
+    await get_prefetcher().cancel()
+    await close_clients()
@@ -0,0 +1,78 @@
+import unittest
+from types import SimpleNamespace
+
+from cooking_agent.bring.client import BringClient, ShoppingList
+
+
+class StubBringClient(BringClient):
+    """Client serving fixed cached and reloaded lists."""
+
+    def __init__(self, cached: list[str], reloaded: list[str]) -> None:
+        super().__init__("user@example.com", "secret")
+        self.cached = [ShoppingList(f"uuid-{name}", name) for name in cached]
+        self.reloaded = [ShoppingList(f"uuid-{name}", name) for name in reloaded]
+        self.reloads = 0
+
+    async def get_shopping_lists(self, refresh: bool = False) -> list[ShoppingList]:
+        if not refresh:
+            return list(self.cached)
+        self.reloads += 1
+        return list(self.reloaded)
+
+
+class GetListByNameTest(unittest.IsolatedAsyncioTestCase):
+    async def test_exact_cached_match_does_not_reload(self) -> None:
+        client = StubBringClient(["Einkaufsliste"], ["Einkaufsliste"])
+        lst = await client.get_list_by_name("einkaufsliste")
+        self.assertEqual(lst.name, "Einkaufsliste")
+        self.assertEqual(client.reloads, 0)
+
+    async def test_new_exact_list_wins_over_cached_fuzzy_match(self) -> None:
+        client = StubBringClient(["Einkaufsliste"], ["Einkaufsliste", "Einkauf"])
+        lst = await client.get_list_by_name("Einkauf")
+        self.assertEqual(lst.name, "Einkauf")
+
+    async def test_fuzzy_match_on_reloaded_lists(self) -> None:
+        client = StubBringClient([], ["Einkaufsliste", "Drogerie"])
+        lst = await client.get_list_by_name("drogeri")
+        self.assertEqual(lst.name, "Drogerie")
+        self.assertEqual(client.reloads, 1)
+
+    async def test_unknown_list(self) -> None:
+        client = StubBringClient(["Einkaufsliste"], ["Einkaufsliste"])
+        self.assertIsNone(await client.get_list_by_name("Shopping"))
+
+
+class FakeBring:
+    """Bring API whose lists can change between loads."""
+
+    def __init__(self, names: list[str]) -> None:
+        self.names = names
+        self.loads = 0
+
+    async def load_lists(self) -> SimpleNamespace:
+        self.loads += 1
+        return SimpleNamespace(lists=[SimpleNamespace(listUuid=f"uuid-{n}", name=n) for n in self.names])
+
+
+class GetShoppingListsTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.bring = FakeBring(["Einkaufsliste"])
+        self.client = BringClient("user@example.com", "secret")
+        self.client._bring = self.bring
+
+    async def test_lists_are_cached(self) -> None:
+        await self.client.get_shopping_lists()
+        self.bring.names = ["Einkaufsliste", "Drogerie"]
+        lists = await self.client.get_shopping_lists()
+        self.assertEqual([lst.name for lst in lists], ["Einkaufsliste"])
+        self.assertEqual(self.bring.loads, 1)
+
+    async def test_refresh_reloads_cached_lists(self) -> None:
+        await self.client.get_shopping_lists()
+        self.bring.names = ["Einkaufsliste", "Drogerie"]
+        lists = await self.client.get_shopping_lists(refresh=True)
+        self.assertEqual([lst.name for lst in lists], ["Einkaufsliste", "Drogerie"])
+        self.assertEqual(self.bring.loads, 2)
+        self.assertEqual(len(await self.client.get_shopping_lists()), 2)  # the reload is cached
+        self.assertEqual(self.bring.loads, 2)
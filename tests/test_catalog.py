@@ -0,0 +1,72 @@
+import unittest
+
+from bring_api.const import BRING_DEFAULT_LOCALE
+
+from cooking_agent.bring.catalog import BringCatalog, CatalogItem, describe_items, get_catalog, split_amount
+
+ARTICLES = {"Zwiebeln": "Zwiebeln", "Tomaten": "Tomaten", "Spaghetti": "Spaghetti", "Zitrone": "Zitrone"}
+ENGLISH = {"Zwiebeln": "Onions", "Tomaten": "Tomatoes", "Zitrone": "Lemon", "Unbekannt": "Unknown"}
+
+
+class SplitAmountTest(unittest.TestCase):
+    def test_amounts(self) -> None:
+        cases = [
+            ("400 g Spaghetti", ("400 g", "Spaghetti")),
+            ("2 Zitronen", ("2", "Zitronen")),
+            ("1,5 l Milch", ("1,5 l", "Milch")),
+            ("½ TL Zimt", ("½ TL", "Zimt")),
+            ("2-3 Knoblauchzehen", ("2-3", "Knoblauchzehen")),
+            ("2 cloves garlic", ("2 cloves", "garlic")),
+            ("Salz", ("", "Salz")),
+            ("3 EL", ("", "3 EL")),  # nothing left to be the food
+        ]
+        for line, expected in cases:
+            with self.subTest(line=line):
+                self.assertEqual(split_amount(line), expected)
+
+
+class BringCatalogTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.catalog = BringCatalog(ARTICLES, [ENGLISH])
+
+    def test_lookup_by_name_plural_and_alias(self) -> None:
+        cases = [("Zwiebeln", "Zwiebeln"), ("Zwiebel", "Zwiebeln"), ("onion", "Zwiebeln"), ("Tomate", "Tomaten")]
+        for food, expected in cases:
+            with self.subTest(food=food):
+                self.assertEqual(self.catalog.lookup(food), expected)
+
+    def test_aliases_of_articles_not_in_the_catalog_are_ignored(self) -> None:
+        self.assertIsNone(self.catalog.lookup("Unknown"))
+
+    def test_unmatched_words_become_the_specification(self) -> None:
+        self.assertEqual(self.catalog.match("Tomaten passiert"), CatalogItem("Tomaten", "passiert", "Tomaten"))
+        self.assertEqual(self.catalog.match("rote Zwiebel", "2"), CatalogItem("Zwiebeln", "2, rote", "Zwiebeln"))
+
+    def test_unknown_food_becomes_a_custom_item(self) -> None:
+        self.assertEqual(self.catalog.match(" Drachenfrucht "), CatalogItem("Drachenfrucht"))
+
+    def test_parse_ingredient_lines(self) -> None:
+        cases = [
+            ("400 g Spaghetti, gekocht", CatalogItem("Spaghetti", "400 g, gekocht", "Spaghetti")),
+            ("2 Zitronen", CatalogItem("Zitrone", "2", "Zitrone")),
+            ("1 Drachenfrucht", CatalogItem("Drachenfrucht", "1")),
+            ("Zwiebeln", CatalogItem("Zwiebeln", "", "Zwiebeln")),
+        ]
+        for line, expected in cases:
+            with self.subTest(line=line):
+                self.assertEqual(self.catalog.parse(line), expected)
+
+    def test_describe_items(self) -> None:
+        items = [CatalogItem("Spaghetti", "400 g", "Spaghetti"), CatalogItem("Salz")]
+        self.assertEqual(describe_items(items), "Spaghetti (400 g), Salz")
+
+
+class GetCatalogTest(unittest.TestCase):
+    def test_names_follow_the_list_language(self) -> None:
+        self.assertEqual(get_catalog("de-CH").parse("1 Onion"), CatalogItem("Zwiebeln", "1", "Zwiebeln"))
+        self.assertEqual(get_catalog("en-US").parse("2 Zwiebeln"), CatalogItem("Onions", "2", "Zwiebeln"))
+
+    def test_unknown_locale_falls_back_to_the_default(self) -> None:
+        with self.assertLogs("cooking_agent.bring.catalog", "WARNING"):
+            catalog = get_catalog("xx-XX")
+        self.assertIs(catalog, get_catalog(BRING_DEFAULT_LOCALE))
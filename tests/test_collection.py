@@ -0,0 +1,168 @@
+import unittest
+
+from cooking_agent.mealie import collection as collection_module
+from cooking_agent.mealie.client import Ingredient, Recipe, RecipeSummary
+from cooking_agent.mealie.collection import RecipeCollection, get_recipe_collection
+from cooking_agent.mealie.index import IngredientIndex, normalize_food
+from cooking_agent.ratelimit import RateLimiter
+
+
+def recipe(slug: str, foods: list[str], total: str | None = None, prep: str | None = None,
+           cook: str | None = None, name: str | None = None) -> Recipe:
+    ingredients = tuple(Ingredient(f"1 {food}", 1.0, None, food) for food in foods)
+    return Recipe(slug, name or slug.replace("-", " ").title(), None, ingredients, ("Mix", "Cook"), total, prep, cook)
+
+
+RECIPES = [
+    recipe("lauch-kartoffel-suppe", ["Lauch", "Kartoffeln", "Sahne"], total="45 minutes"),
+    recipe("pasta-al-limone", ["Spaghetti", "Zitrone", "Parmesan"], total="20 minutes"),
+    recipe("chicken-curry", ["Chicken", "Curry Paste", "Coconut Milk"], prep="15 minutes", cook="30 minutes"),
+    recipe("bratkartoffeln", ["Kartoffel", "Zwiebel"]),
+]
+
+
+class RecipeCollectionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.collection = RecipeCollection(RECIPES)
+
+    def test_recipes_round_trip(self) -> None:
+        self.assertEqual(len(self.collection), 4)
+        for original in RECIPES:
+            with self.subTest(slug=original.slug):
+                self.assertEqual(self.collection[original.slug], original)
+        self.assertIn("chicken-curry", self.collection)
+        self.assertIsNone(self.collection.get("lasagne"))
+        with self.assertRaises(KeyError):
+            self.collection["lasagne"]
+
+    def test_ingredient_quantities_and_empty_fields(self) -> None:
+        bare = Recipe("brot", "Brot", None, (Ingredient("Salz"),), ())
+        collection = RecipeCollection([bare])
+        self.assertEqual(collection["brot"], bare)
+
+    def test_filter_by_time(self) -> None:
+        self.assertEqual(
+            self.collection.filter_by_time(max_minutes=45),
+            [("pasta-al-limone", 20.0), ("lauch-kartoffel-suppe", 45.0), ("chicken-curry", 45.0)],
+        )
+        self.assertEqual(self.collection.filter_by_time(min_minutes=30, limit=1), [("lauch-kartoffel-suppe", 45.0)])
+        self.assertEqual(self.collection.filter_by_time(field="prep"), [("chicken-curry", 15.0)])
+        self.assertEqual(self.collection.filter_by_time(query="suppe lauch"), [("lauch-kartoffel-suppe", 45.0)])
+
+    def test_recipes_without_time_are_excluded(self) -> None:
+        self.assertNotIn("bratkartoffeln", dict(self.collection.filter_by_time()))
+        self.assertIsNone(self.collection.minutes("bratkartoffeln"))
+        self.assertEqual(self.collection.minutes("chicken-curry"), 45.0)  # prep + cook
+
+    def test_foods(self) -> None:
+        self.assertEqual(self.collection.foods("pasta-al-limone"), ["Spaghetti", "Zitrone", "Parmesan"])
+
+    def test_replaced_recipe_and_compact(self) -> None:
+        self.collection.add(recipe("pasta-al-limone", ["Linguine", "Zitrone"], total="15 minutes"))
+        self.assertEqual(len(self.collection), 4)
+        self.assertEqual(self.collection.foods("pasta-al-limone"), ["Linguine", "Zitrone"])
+        self.assertEqual(self.collection.filter_by_time(max_minutes=20), [("pasta-al-limone", 15.0)])
+        self.collection.compact()
+        self.assertEqual([self.collection[slug] for slug in self.collection], list(self.collection.recipes()))
+        self.assertEqual(self.collection.filter_by_time(max_minutes=20), [("pasta-al-limone", 15.0)])
+
+
+class NormalizeFoodTest(unittest.TestCase):
+    def test_normalize_food(self) -> None:
+        cases = [
+            ("Kartoffeln", "kartoffel"),
+            ("Kartoffel", "kartoffel"),
+            ("Tomaten", "tomat"),
+            ("Tomate", "tomat"),
+            ("Potatoes", "potato"),
+            ("Eggs", "egg"),
+            ("Olivenöl", "olivenol"),
+            ("Crème fraîche", "crem fraich"),
+            ("  Curry-Paste ", "curry past"),
+            ("Ei", "ei"),
+            ("", ""),
+        ]
+        for name, expected in cases:
+            with self.subTest(name=name):
+                self.assertEqual(normalize_food(name), expected)
+
+
+class IngredientIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = IngredientIndex(RECIPES)
+
+    def test_lookup_matches_singular_plural_and_words(self) -> None:
+        self.assertEqual(self.index.lookup("Kartoffel"), {"lauch-kartoffel-suppe", "bratkartoffeln"})
+        self.assertEqual(self.index.lookup("milk"), {"chicken-curry"})
+
+    def test_find_ranks_by_coverage_then_missing(self) -> None:
+        matches = self.index.find(["Kartoffeln", "Zwiebeln", "Lauch"])
+        self.assertEqual([m.slug for m in matches], ["bratkartoffeln", "lauch-kartoffel-suppe"])
+        self.assertEqual(matches[0].matched, ("Kartoffeln", "Zwiebeln"))
+        self.assertEqual(matches[0].missing, ())
+        self.assertEqual(matches[1].matched, ("Kartoffeln", "Lauch"))
+        self.assertEqual(matches[1].missing, ("Sahne",))
+
+    def test_find_require_all_and_limit(self) -> None:
+        self.assertEqual([m.slug for m in self.index.find(["Kartoffel", "Lauch"], require_all=True)],
+                         ["lauch-kartoffel-suppe"])
+        self.assertEqual(self.index.find(["Kartoffel", "Reis"], require_all=True), [])
+        self.assertEqual(len(self.index.find(["Kartoffel"], limit=1)), 1)
+        self.assertEqual(self.index.find([]), [])
+
+    def test_add_and_remove(self) -> None:
+        self.index.add(recipe("bratkartoffeln", ["Süßkartoffel"]))  # re-index
+        self.assertEqual(self.index.lookup("Kartoffel"), {"lauch-kartoffel-suppe"})
+        self.assertEqual(len(self.index), 4)
+
+        self.index.remove("lauch-kartoffel-suppe")
+        self.assertEqual(self.index.lookup("Kartoffel"), set())
+        self.assertEqual(self.index.find(["Lauch"]), [])
+        self.assertEqual(len(self.index), 3)
+        self.index.remove("lauch-kartoffel-suppe")  # already gone
+
+
+class FakeMealie:
+    """Mealie client serving fixed recipes through a rate limiter."""
+
+    store = None
+
+    def __init__(self, recipes: list[Recipe]) -> None:
+        self.recipes = {r.slug: r for r in recipes}
+        self.limiter = RateLimiter()
+        self.failing: set[str] = set()
+
+    async def list_recipes(self, page: int = 1) -> tuple[list[RecipeSummary], int]:
+        async with self.limiter.slot():
+            return [RecipeSummary(r.slug, r.name) for r in self.recipes.values()], 1
+
+    async def get_recipe(self, slug: str) -> Recipe:
+        async with self.limiter.slot():
+            if slug in self.failing:
+                raise RuntimeError(f"{slug} failed")
+            return self.recipes[slug]
+
+
+class GetRecipeCollectionTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        collection_module._collection = None
+        self.addCleanup(setattr, collection_module, "_collection", None)
+
+    async def test_crawl_runs_in_the_background_lane_and_is_cached(self) -> None:
+        client = FakeMealie(RECIPES)
+        collection = await get_recipe_collection(client)
+        self.assertEqual(sorted(collection), sorted(r.slug for r in RECIPES))
+        stats = client.limiter.stats()
+        self.assertEqual(stats["background_requests"], 5)
+        self.assertEqual(stats["interactive_requests"], 0)
+
+        self.assertIs(await get_recipe_collection(client), collection)
+        self.assertEqual(client.limiter.stats()["background_requests"], 5)
+
+    async def test_failed_recipes_are_skipped(self) -> None:
+        client = FakeMealie(RECIPES)
+        client.failing.add("chicken-curry")
+        with self.assertLogs("cooking_agent.mealie.collection", "WARNING"):
+            collection = await get_recipe_collection(client)
+        self.assertEqual(len(collection), 3)
+        self.assertNotIn("chicken-curry", collection)
@@ -0,0 +1,75 @@
+import math
+import unittest
+
+from cooking_agent.mealie.durations import find_durations, parse_duration, parse_durations
+
+
+class ParseDurationTest(unittest.TestCase):
+    def test_formats(self) -> None:
+        cases = [
+            ("PT1H30M", 90.0),
+            ("P1DT2H", 1560.0),
+            ("1:30", 90.0),
+            ("45", 45.0),
+            ("1 hour 30 minutes", 90.0),
+            ("1 Std. 30 Min.", 90.0),
+            ("1 h 30", 90.0),
+            ("20-30 min", 30.0),
+            ("20 bis 30 Minuten", 30.0),
+            ("90 Sekunden", 1.5),
+            ("half an hour", 30.0),
+            ("eine halbe Stunde", 30.0),
+            ("an hour", 60.0),
+            ("0 min", 0.0),
+        ]
+        for text, minutes in cases:
+            with self.subTest(text=text):
+                self.assertAlmostEqual(parse_duration(text), minutes)
+
+    def test_fractions(self) -> None:
+        cases = [
+            ("1 1/2 hours", 90.0),
+            ("1 1/2 h", 90.0),
+            ("1 1/2 Stunden", 90.0),
+            ("ca. 1 1/2 Stunden", 90.0),
+            ("1/2 Stunde", 30.0),
+            ("2 1/4 h", 135.0),
+            ("1/2-1 h", 60.0),
+            ("1½ Stunden", 90.0),
+            ("1 ½ Std.", 90.0),
+            ("½ Stunde", 30.0),
+            ("¾ h", 45.0),
+        ]
+        for text, minutes in cases:
+            with self.subTest(text=text):
+                self.assertAlmostEqual(parse_duration(text), minutes)
+
+    def test_no_duration(self) -> None:
+        for text in (None, "", "   ", "over night", "nach Belieben"):
+            with self.subTest(text=text):
+                self.assertIsNone(parse_duration(text))
+
+    def test_parse_durations(self) -> None:
+        column = parse_durations(["10 min", None, "1 h"])
+        self.assertEqual(column[0], 10.0)
+        self.assertTrue(math.isnan(column[1]))
+        self.assertEqual(column[2], 60.0)
+
+
+class FindDurationsTest(unittest.TestCase):
+    def test_durations_in_text(self) -> None:
+        cases = [
+            ("Zwei Stunden schmoren, dann 10 min ruhen lassen", [120.0, 10.0]),
+            ("20-25 Minuten backen", [25.0]),
+            ("1½ Stunden backen", [90.0]),
+            ("½ Stunde ziehen lassen", [30.0]),
+            ("ca. 1 1/2 Stunden köcheln", [90.0]),
+            ("eine halbe Stunde ruhen lassen", [30.0]),
+            ("Eine Minute rühren", [1.0]),
+            ("Bake for an hour", [60.0]),
+            ("3 Eier und 200 g Mehl verrühren", []),
+            ("Bei 180 Grad backen", []),
+        ]
+        for text, minutes in cases:
+            with self.subTest(text=text):
+                self.assertEqual(find_durations(text), minutes)
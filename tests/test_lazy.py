@@ -0,0 +1,28 @@
+import subprocess
+import sys
+import unittest
+
+import cooking_agent.mealie
+from cooking_agent.mealie.client import MealieClient
+
+
+class LazyModuleTest(unittest.TestCase):
+    def test_names_resolve_on_access(self) -> None:
+        self.assertIs(cooking_agent.mealie.MealieClient, MealieClient)
+        self.assertIn("MealieClient", vars(cooking_agent.mealie))  # cached after the first access
+        self.assertIn("RecipeStore", dir(cooking_agent.mealie))
+        self.assertIn("search_recipes", cooking_agent.mealie.__all__)
+
+    def test_unknown_name(self) -> None:
+        with self.assertRaisesRegex(AttributeError, "'cooking_agent.mealie' has no attribute 'Nope'"):
+            cooking_agent.mealie.Nope
+
+    def test_clients_do_not_load_langchain(self) -> None:
+        code = (
+            "import sys\n"
+            "from cooking_agent.mealie import MealieClient\n"
+            "from cooking_agent.bring import BringClient\n"
+            "print(sorted(m for m in sys.modules if m.split('.')[0] in ('langchain', 'langgraph')))"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "[]")
@@ -0,0 +1,83 @@
+import unittest
+
+from cooking_agent.bring.matching import ITEM_THRESHOLD, LIST_THRESHOLD, best_match, normalize_name, similarity
+
+LISTS = ["Einkaufsliste", "Drogerie", "Baumarkt", "WG Liste"]
+ITEMS = ["Käse", "Milch", "Tomaten", "Zitrone", "Parmesan", "Butter", "Milchreis", "Äpfel"]
+
+
+class NormalizeNameTest(unittest.TestCase):
+    def test_folds_case_accents_and_umlaut_spellings(self) -> None:
+        cases = [
+            ("Käse", "kase"),
+            ("Kaese", "kase"),
+            ("kase", "kase"),
+            ("Aepfel", "apfel"),
+            ("Crème Fraîche", "creme fraiche"),
+            ("Weißwurst", "weisswurst"),
+            ("  WG   Liste ", "wg liste"),
+            ("Milch (3,5 %)", "milch 3 5"),
+        ]
+        for name, expected in cases:
+            with self.subTest(name=name):
+                self.assertEqual(normalize_name(name), expected)
+
+
+class SimilarityTest(unittest.TestCase):
+    def test_scores(self) -> None:
+        cases = [
+            ("kase", "kase", 1.0),
+            ("", "kase", 0.0),
+            ("einkauf", "einkaufsliste", 0.6 + 0.4 * 7 / 13),
+            ("drogeri", "drogerie", 0.6 + 0.4 * 7 / 8),
+            ("liste wg", "wg liste", 0.95),
+            ("liste", "wg liste", 0.85),
+            ("milk", "milch", 0.6),
+        ]
+        for query, name, expected in cases:
+            with self.subTest(query=query, name=name):
+                self.assertAlmostEqual(similarity(query, name), expected)
+
+    def test_prefix_of_a_longer_food_scores_below_item_threshold(self) -> None:
+        self.assertLess(similarity("butter", "butterschmalz"), ITEM_THRESHOLD)
+
+
+class BestMatchTest(unittest.TestCase):
+    def test_lists(self) -> None:
+        cases = [
+            ("einkauf", "Einkaufsliste"),
+            ("Einkaufliste", "Einkaufsliste"),
+            ("drogeri", "Drogerie"),
+            ("liste wg", "WG Liste"),
+            ("Liste", "WG Liste"),
+            ("Bau", "Baumarkt"),
+            ("Shopping", None),
+        ]
+        for query, expected in cases:
+            with self.subTest(query=query):
+                match = best_match(query, LISTS, LIST_THRESHOLD)
+                self.assertEqual(match.name if match else None, expected)
+
+    def test_items(self) -> None:
+        cases = [
+            ("Kaese", "Käse"),
+            ("Tomate", "Tomaten"),
+            ("zitronen", "Zitrone"),
+            ("Aepfel", "Äpfel"),
+            ("Apfel", "Äpfel"),
+            ("Butterschmalz", None),
+            ("Parmesan Käse", None),
+        ]
+        for query, expected in cases:
+            with self.subTest(query=query):
+                match = best_match(query, ITEMS, ITEM_THRESHOLD)
+                self.assertEqual(match.name if match else None, expected)
+
+    def test_exact_match_scores_one(self) -> None:
+        self.assertEqual(best_match("kaese", ITEMS, ITEM_THRESHOLD).score, 1.0)
+
+    def test_ambiguous_match_is_rejected(self) -> None:
+        self.assertIsNone(best_match("Milch", ["Milchreis", "Milchbrot"], 0.5))
+
+    def test_no_names(self) -> None:
+        self.assertIsNone(best_match("Milch", [], ITEM_THRESHOLD))
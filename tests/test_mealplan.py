@@ -0,0 +1,85 @@
+import unittest
+
+from cooking_agent.mealie.client import Ingredient, Recipe
+from cooking_agent.mealie.collection import RecipeCollection
+from cooking_agent.mealplan import MealPlan, MealPlanner, PlannedMeal, format_meal_plan
+
+
+def recipe(slug: str, foods: list[str], total: str | None = None) -> Recipe:
+    return Recipe(slug, slug.title(), None, tuple(Ingredient(food, None, None, food) for food in foods), (), total)
+
+
+RECIPES = [
+    recipe("lauchsuppe", ["Lauch", "Kartoffeln", "Sahne"], "45 minutes"),
+    recipe("pasta", ["Spaghetti", "Zitrone"], "20 minutes"),
+    recipe("gratin", ["Kartoffeln", "Sahne", "Käse", "Zwiebeln"], "60 minutes"),
+    recipe("salat", ["Gurke"]),  # no known time
+    recipe("curry", ["Hähnchen", "Reis", "Currypaste"], "30 minutes"),
+]
+
+
+class MealPlannerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.planner = MealPlanner(RecipeCollection(RECIPES))
+
+    def slugs(self, rows: list[int]) -> list[str]:
+        return [self.planner.slugs[row] for row in rows]
+
+    def test_fewer_ingredients_first(self) -> None:
+        self.assertEqual(self.slugs(self.planner.plan(days=2, seed=1)), ["salat", "pasta"])
+
+    def test_use_up_first_then_shared_ingredients(self) -> None:
+        # Lauchsuppe uses up the leek; gratin then shares potatoes and cream.
+        rows = self.planner.plan(days=3, use_up=["Lauch"], seed=1)
+        self.assertEqual(self.slugs(rows), ["lauchsuppe", "gratin", "salat"])
+
+    def test_food_is_used_up_only_once(self) -> None:
+        planner = MealPlanner(RecipeCollection([*RECIPES, recipe("lauchkuchen", ["Lauch", "Mehl", "Eier", "Speck"])]))
+        rows = planner.plan(days=2, use_up=["Lauch"], seed=1)
+        self.assertEqual([planner.slugs[row] for row in rows], ["lauchsuppe", "gratin"])
+
+    def test_max_minutes_excludes_slow_and_unknown_times(self) -> None:
+        rows = self.planner.plan(days=7, max_minutes=30, seed=1)
+        self.assertEqual(self.slugs(rows), ["pasta", "curry"])
+
+    def test_exclude(self) -> None:
+        rows = self.planner.plan(days=1, exclude=["salat"], seed=1)
+        self.assertEqual(self.slugs(rows), ["pasta"])
+
+    def test_too_few_recipes_plans_each_recipe_once(self) -> None:
+        rows = self.planner.plan(days=10, seed=1)
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(sorted(self.slugs(rows)), sorted(r.slug for r in RECIPES))
+
+    def test_ties_are_broken_reproducibly_by_seed(self) -> None:
+        twins = MealPlanner(RecipeCollection([recipe(f"brot-{i}", ["Mehl", f"Zutat {i}"]) for i in range(6)]))
+        plans = {tuple(twins.plan(days=3, seed=seed)) for seed in range(20)}
+        self.assertGreater(len(plans), 1)
+        self.assertEqual(twins.plan(days=3, seed=7), twins.plan(days=3, seed=7))
+
+    def test_empty_collection(self) -> None:
+        self.assertEqual(MealPlanner(RecipeCollection()).plan(days=7), [])
+
+
+class FormatMealPlanTest(unittest.TestCase):
+    def test_format(self) -> None:
+        plan = MealPlan(
+            [PlannedMeal(1, "lauchsuppe", "Lauchsuppe", 45.0, ["Lauch"]), PlannedMeal(2, "salat", "Salat", None)],
+            [("Kartoffeln", "1 kg"), ("Gurke", "")],
+            ["Sahne"],
+        )
+        self.assertEqual(
+            format_meal_plan(plan),
+            "Meal plan for 2 days:\n"
+            "Day 1: Lauchsuppe (45 min) – uses up Lauch\n"
+            "  slug: lauchsuppe\n"
+            "Day 2: Salat\n"
+            "  slug: salat\n"
+            "\nShopping list (2 items):\n"
+            "• Kartoffeln (1 kg)\n"
+            "• Gurke\n"
+            "Already in the pantry: Sahne",
+        )
+
+    def test_no_meals(self) -> None:
+        self.assertEqual(format_meal_plan(MealPlan([], [], [])), "No recipes match these constraints")
@@ -0,0 +1,98 @@
+import unittest
+
+from langchain_core.messages import AIMessage
+
+from cooking_agent.planner import Plan, PlanError, PlannerAgent, PlanStep, validate_plan
+
+
+def step(step_id: str, operation: str = "get_recipe", depends_on: list[str] | None = None, **args: object) -> PlanStep:
+    return PlanStep(id=step_id, operation=operation, args=args, depends_on=depends_on or [])
+
+
+class ValidatePlanTest(unittest.TestCase):
+    def test_referenced_steps_become_dependencies(self) -> None:
+        plan = Plan(
+            steps=[
+                step("s1", "search_recipes", query="Lasagne"),
+                step("s2", "get_recipe_ingredients", slug="$s1"),
+                step("s3", "add_to_shopping_list", ["s2"], list_name="Einkauf", items=["$s2", "$s1"]),
+            ]
+        )
+        validate_plan(plan)
+        self.assertEqual([s.depends_on for s in plan.steps], [[], ["s1"], ["s2", "s1"]])
+
+    def test_dollar_values_that_are_no_step_ids_are_left_alone(self) -> None:
+        plan = Plan(steps=[step("s1", "add_to_shopping_list", list_name="Einkauf", items=["$5 Gutschein"])])
+        validate_plan(plan)
+        self.assertEqual(plan.steps[0].depends_on, [])
+
+    def test_reference_cycle_is_rejected(self) -> None:
+        plan = Plan(steps=[step("s1", slug="$s2"), step("s2", slug="$s1")])
+        with self.assertRaisesRegex(PlanError, "cycle"):
+            validate_plan(plan)
+
+    def test_unknown_dependency_is_rejected(self) -> None:
+        with self.assertRaisesRegex(PlanError, "unknown steps"):
+            validate_plan(Plan(steps=[step("s1", depends_on=["s7"], slug="lasagne")]))
+
+    def test_duplicate_ids_are_rejected(self) -> None:
+        with self.assertRaisesRegex(PlanError, "duplicate"):
+            validate_plan(Plan(steps=[step("s1", slug="a"), step("s1", slug="b")]))
+
+
+class FakePlanner:
+    """Structured-output model returning fixed plans, one per call."""
+
+    def __init__(self, plans: list[Plan]) -> None:
+        self.plans = plans
+        self.requests: list[list] = []
+
+    async def ainvoke(self, messages: list, config: object = None) -> Plan:
+        self.requests.append(list(messages))
+        return self.plans[len(self.requests) - 1]
+
+
+class FakeLLM:
+    def __init__(self, plans: list[Plan]) -> None:
+        self.planner = FakePlanner(plans)
+
+    def with_structured_output(self, schema: type, method: str) -> FakePlanner:
+        return self.planner
+
+    async def ainvoke(self, messages: list, config: object = None) -> AIMessage:
+        return AIMessage("Summary")
+
+
+class FakeAgent:
+    def __init__(self) -> None:
+        self.inputs: list[dict] = []
+
+    async def ainvoke(self, input: dict, config: object = None) -> dict:
+        self.inputs.append(input)
+        return {"messages": [*input["messages"], AIMessage("Supervisor answer")]}
+
+
+CYCLE = Plan(steps=[step("s1", slug="$s2"), step("s2", slug="$s1")])
+REQUEST = {"messages": [{"role": "user", "content": "Add Lasagne to my list"}]}
+
+
+class PlanFallbackTest(unittest.IsolatedAsyncioTestCase):
+    async def test_invalid_plan_is_replanned_with_the_error(self) -> None:
+        llm = FakeLLM([CYCLE, Plan(steps=[])])
+        agent = PlannerAgent(llm)
+        result = await agent.ainvoke(REQUEST)
+        self.assertEqual(result["messages"][-1].content, "Summary")
+        self.assertEqual(len(llm.planner.requests), 2)
+        self.assertIn("cycle", llm.planner.requests[1][-1].content)
+
+    async def test_second_invalid_plan_falls_back_to_the_fallback_agent(self) -> None:
+        fallback = FakeAgent()
+        agent = PlannerAgent(FakeLLM([CYCLE, CYCLE]), fallback=lambda: fallback)
+        result = await agent.ainvoke(REQUEST)
+        self.assertEqual(result["messages"][-1].content, "Supervisor answer")
+        self.assertEqual(fallback.inputs, [REQUEST])
+
+    async def test_without_fallback_the_error_is_raised(self) -> None:
+        agent = PlannerAgent(FakeLLM([CYCLE, CYCLE]))
+        with self.assertRaises(PlanError):
+            await agent.ainvoke(REQUEST)
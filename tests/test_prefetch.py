@@ -0,0 +1,46 @@
+import asyncio
+import unittest
+
+from cooking_agent.mealie.prefetch import RecipePrefetcher
+
+
+class SlowClient:
+    """Client whose prefetches run until cancelled."""
+
+    def __init__(self) -> None:
+        self.started = asyncio.Event()
+        self.open = 0
+
+    async def __aenter__(self) -> "SlowClient":
+        self.open += 1
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        self.open -= 1
+
+    async def prefetch_recipes(self, slugs: list[str]) -> int:
+        self.started.set()
+        await asyncio.sleep(10)
+        return len(slugs)
+
+
+class RecipePrefetcherTest(unittest.IsolatedAsyncioTestCase):
+    async def test_schedules_top_k_and_limits_pending(self) -> None:
+        prefetcher = RecipePrefetcher(top_k=2, max_pending=1)
+        client = SlowClient()
+        self.assertIsNotNone(prefetcher.schedule(client, ["a", "b", "c"]))
+        self.assertIsNone(prefetcher.schedule(client, ["d"]))
+        self.assertIsNone(RecipePrefetcher(top_k=0).schedule(client, ["a"]))
+        await prefetcher.cancel()
+
+    async def test_cancel_stops_running_prefetches(self) -> None:
+        prefetcher = RecipePrefetcher()
+        client = SlowClient()
+        task = prefetcher.schedule(client, ["lasagne"])
+        await client.started.wait()
+        self.assertEqual(client.open, 1)
+
+        await prefetcher.cancel()
+        self.assertTrue(task.cancelled())
+        self.assertEqual(prefetcher.pending, 0)
+        self.assertEqual(client.open, 0)  # the client was exited
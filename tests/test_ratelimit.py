@@ -0,0 +1,131 @@
+import asyncio
+import time
+import unittest
+
+from cooking_agent.ratelimit import Priority, RateLimiter, background
+
+
+async def settle() -> None:
+    """Let queued tasks run until they block."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class PriorityTest(unittest.IsolatedAsyncioTestCase):
+    async def test_interactive_waiters_are_served_before_background(self) -> None:
+        limiter = RateLimiter(max_concurrency=1)
+        served: list[str] = []
+
+        async def request(name: str, priority: Priority) -> None:
+            async with limiter.slot(priority):
+                served.append(name)
+
+        await limiter.acquire()
+        tasks = [
+            asyncio.create_task(request("sync-1", Priority.BACKGROUND)),
+            asyncio.create_task(request("user-1", Priority.INTERACTIVE)),
+            asyncio.create_task(request("sync-2", Priority.BACKGROUND)),
+            asyncio.create_task(request("user-2", Priority.INTERACTIVE)),
+        ]
+        await settle()
+        self.assertEqual(limiter.queue_depth, 4)
+        limiter.release()
+        await asyncio.gather(*tasks)
+        self.assertEqual(served, ["user-1", "user-2", "sync-1", "sync-2"])
+        self.assertEqual(limiter.active, 0)
+
+    async def test_background_context_sets_the_lane(self) -> None:
+        limiter = RateLimiter()
+        with background():
+            async with limiter.slot():
+                pass
+        async with limiter.slot():
+            pass
+        stats = limiter.stats()
+        self.assertEqual(stats["background_requests"], 1)
+        self.assertEqual(stats["interactive_requests"], 1)
+
+
+class TokenBucketTest(unittest.IsolatedAsyncioTestCase):
+    async def test_burst_then_refill_rate(self) -> None:
+        limiter = RateLimiter(rate=20.0, burst=3)
+        start = time.monotonic()
+        for _ in range(3):
+            async with limiter.slot():
+                pass
+        self.assertLess(time.monotonic() - start, 0.05)  # the burst starts at once
+
+        for _ in range(2):
+            async with limiter.slot():
+                pass
+        # Two more tokens refill at 20/s: about 0.1 s.
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    async def test_tokens_refill_up_to_burst_while_idle(self) -> None:
+        limiter = RateLimiter(rate=20.0, burst=2)
+        for _ in range(2):
+            await limiter.acquire()
+            limiter.release()
+        await asyncio.sleep(0.25)  # refills 5 tokens, capped at 2
+        start = time.monotonic()
+        for _ in range(2):
+            await limiter.acquire()
+            limiter.release()
+        self.assertLess(time.monotonic() - start, 0.03)
+        await limiter.acquire()  # the third waits for a token: 0.05 s
+        limiter.release()
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+
+class CancellationTest(unittest.IsolatedAsyncioTestCase):
+    async def test_cancelled_waiter_leaves_the_queue(self) -> None:
+        limiter = RateLimiter(max_concurrency=1)
+        await limiter.acquire()
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire())
+        await settle()
+
+        first.cancel()
+        await settle()
+        self.assertEqual(limiter.queue_depth, 1)
+
+        limiter.release()
+        await asyncio.wait_for(second, 1.0)
+        self.assertTrue(first.cancelled())
+        self.assertEqual(limiter.active, 1)
+        self.assertEqual(limiter.queue_depth, 0)
+        limiter.release()
+
+    async def test_waiter_cancelled_after_wake_up_passes_the_slot_on(self) -> None:
+        limiter = RateLimiter(max_concurrency=1)
+        await limiter.acquire()
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire())
+        await settle()
+
+        limiter.release()  # wakes the first waiter ...
+        first.cancel()  # ... which is cancelled before it runs
+        await asyncio.wait_for(second, 1.0)
+        self.assertTrue(first.cancelled())
+        self.assertEqual(limiter.active, 1)
+        self.assertEqual(limiter.queue_depth, 0)
+        limiter.release()
+        self.assertEqual(limiter.active, 0)
+
+    async def test_slot_is_released_when_the_block_is_cancelled(self) -> None:
+        limiter = RateLimiter(max_concurrency=1)
+        entered = asyncio.Event()
+
+        async def hold() -> None:
+            async with limiter.slot():
+                entered.set()
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(hold())
+        await entered.wait()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        self.assertEqual(limiter.active, 0)
+        await asyncio.wait_for(limiter.acquire(), 1.0)
+        limiter.release()
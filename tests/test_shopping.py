@@ -0,0 +1,106 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from cooking_agent.bring.catalog import BringCatalog
+from cooking_agent.bring.client import ShoppingItem
+from cooking_agent.mealie.client import Ingredient, Recipe
+from cooking_agent.shopping import Pantry, ShoppingPlan, format_shopping_plan, plan_shopping
+
+
+def recipe(slug: str, *ingredients: Ingredient) -> Recipe:
+    return Recipe(slug, slug.title(), None, ingredients, ())
+
+
+BOLOGNESE = recipe(
+    "bolognese",
+    Ingredient("500 g Spaghetti", 500.0, "g", "Spaghetti"),
+    Ingredient("2 Zwiebeln", 2.0, None, "Zwiebeln"),
+    Ingredient("400 g Tomaten", 400.0, "g", "Tomaten"),
+    Ingredient("Salz"),
+)
+LASAGNE = recipe(
+    "lasagne",
+    Ingredient("1 Zwiebel", 1.0, None, "Zwiebel"),
+    Ingredient("1 Dose Tomaten", 1.0, "Dose", "Tomaten"),
+    Ingredient("Parmesan, gerieben", None, None, "Parmesan"),
+)
+
+
+def pantry_keys(*foods: str) -> set[str]:
+    pantry = Pantry()
+    pantry.add(list(foods))
+    return pantry.keys()
+
+
+class PlanShoppingTest(unittest.TestCase):
+    def test_quantities_are_summed_per_unit_across_recipes(self) -> None:
+        plan = plan_shopping([BOLOGNESE, LASAGNE], [], [], set())
+        self.assertEqual(
+            plan.to_buy,
+            [
+                ("Spaghetti", "500 g"),
+                ("Zwiebeln", "3"),
+                ("Tomaten", "400 g + 1 Dose"),
+                ("Salz", ""),
+                ("Parmesan", ""),
+            ],
+        )
+
+    def test_pantry_and_list_items_are_subtracted(self) -> None:
+        plan = plan_shopping(
+            [BOLOGNESE],
+            on_list=[ShoppingItem("Spaghetti", "1 Packung"), ShoppingItem("Salz")],
+            recently_bought=[],
+            pantry_keys=pantry_keys("Salz", "Zwiebel"),
+        )
+        self.assertEqual(plan.to_buy, [("Tomaten", "400 g")])
+        self.assertEqual(plan.on_list, ["Spaghetti", "Salz"])  # the list wins over the pantry
+        self.assertEqual(plan.in_pantry, ["Zwiebeln"])
+
+    def test_recently_bought_items_are_bought_again_by_default(self) -> None:
+        recent = [ShoppingItem("Tomaten")]
+        plan = plan_shopping([BOLOGNESE], [], recent, set())
+        self.assertIn(("Tomaten", "400 g"), plan.to_buy)
+        self.assertEqual(plan.recently_bought, [])
+
+        plan = plan_shopping([BOLOGNESE], [], recent, set(), skip_recently_bought=True)
+        self.assertNotIn("Tomaten", [name for name, _ in plan.to_buy])
+        self.assertEqual(plan.recently_bought, ["Tomaten"])
+
+    def test_ingredients_without_a_name_are_ignored(self) -> None:
+        plan = plan_shopping([recipe("leer", Ingredient(""), Ingredient(" - "))], [], [], set())
+        self.assertEqual(plan, ShoppingPlan())
+
+    def test_catalog_names_and_merges_foods(self) -> None:
+        catalog = BringCatalog({"Zwiebeln": "Zwiebeln", "Tomaten": "Tomaten"}, [{"Zwiebeln": "Onion"}])
+        onion = recipe("curry", Ingredient("1 Onion", 1.0, None, "Onion"), Ingredient("Tomaten passiert"))
+        plan = plan_shopping([BOLOGNESE, onion], [], [], set(), catalog=catalog)
+        self.assertEqual(dict(plan.to_buy)["Zwiebeln"], "3")
+        self.assertEqual(dict(plan.to_buy)["Tomaten"], "400 g, passiert")
+
+
+class PantryTest(unittest.TestCase):
+    def test_add_remove_and_persist(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "pantry.json"
+            pantry = Pantry(path)
+            pantry.add(["Olivenöl", "Kartoffeln", "salz"])
+            pantry.remove(["Kartoffel"])
+            self.assertIn("olivenöl", pantry)
+
+            reloaded = Pantry(path)
+            self.assertEqual(reloaded.foods, ["Olivenöl", "salz"])
+            self.assertNotIn("Kartoffeln", reloaded)
+
+
+class FormatShoppingPlanTest(unittest.TestCase):
+    def test_format(self) -> None:
+        plan = ShoppingPlan(to_buy=[("Tomaten", "400 g"), ("Salz", "")], on_list=["Spaghetti"], in_pantry=["Zwiebeln"])
+        self.assertEqual(
+            format_shopping_plan("Einkauf", plan),
+            "Added 2 items to 'Einkauf': Tomaten (400 g), Salz\n"
+            "Already on the list: Spaghetti\n"
+            "In the pantry: Zwiebeln",
+        )
+        self.assertEqual(format_shopping_plan("Einkauf", ShoppingPlan()), "Nothing to add to 'Einkauf'")
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import unittest
+
+from cooking_agent.singleflight import SingleFlight
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.flight = SingleFlight()
+        self.release = asyncio.Event()
+        self.runs = 0
+
+    async def fetch(self) -> dict[str, int]:
+        self.runs += 1
+        await self.release.wait()
+        return {"run": self.runs}
+
+    async def test_concurrent_callers_share_one_call(self) -> None:
+        callers = [asyncio.create_task(self.flight.do("recipe", self.fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.release.set()
+        results = await asyncio.gather(*callers)
+        self.assertEqual(self.runs, 1)
+        self.assertEqual(self.flight.shared, 2)
+        self.assertIs(results[0], results[1])
+        self.assertIs(results[0], results[2])
+        self.assertEqual(len(self.flight), 0)
+
+    async def test_different_keys_do_not_share(self) -> None:
+        self.release.set()
+        await asyncio.gather(self.flight.do("a", self.fetch), self.flight.do("b", self.fetch))
+        self.assertEqual(self.runs, 2)
+        self.assertEqual(self.flight.shared, 0)
+
+    async def test_cancelled_leader_does_not_cancel_followers(self) -> None:
+        leader = asyncio.create_task(self.flight.do("recipe", self.fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(self.flight.do("recipe", self.fetch)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        self.assertTrue(leader.cancelled())
+        self.release.set()
+        results = await asyncio.wait_for(asyncio.gather(*followers), 1.0)
+        self.assertEqual(results, [{"run": 1}, {"run": 1}])
+        self.assertEqual(self.runs, 1)
+
+    async def test_call_finishes_when_all_callers_are_cancelled(self) -> None:
+        caller = asyncio.create_task(self.flight.do("recipe", self.fetch))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.gather(caller, return_exceptions=True)
+        self.assertEqual(len(self.flight), 1)  # still in flight for later callers
+
+        late = asyncio.create_task(self.flight.do("recipe", self.fetch))
+        self.release.set()
+        self.assertEqual(await late, {"run": 1})
+        self.assertEqual(len(self.flight), 0)
+
+    async def test_errors_reach_all_callers_and_are_not_cached(self) -> None:
+        async def fail() -> None:
+            self.runs += 1
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            self.flight.do("recipe", fail), self.flight.do("recipe", fail), return_exceptions=True
+        )
+        self.assertEqual([type(r) for r in results], [ValueError, ValueError])
+        with self.assertRaises(ValueError):
+            await self.flight.do("recipe", fail)
+        self.assertEqual(self.runs, 2)
+
+    async def test_calls_are_not_shared_across_event_loops(self) -> None:
+        leader = asyncio.create_task(self.flight.do("recipe", self.fetch))
+        await asyncio.sleep(0)
+
+        # The same key on another loop must not await this loop's task, which
+        # would fail with "attached to a different loop"; it runs on its own.
+        async def other_loop_fetch() -> str:
+            return "other loop"
+
+        outcome: list[object] = []
+
+        def run_other_loop() -> None:
+            try:
+                outcome.append(asyncio.run(self.flight.do("recipe", other_loop_fetch)))
+            except Exception as e:  # reported below
+                outcome.append(e)
+
+        thread = threading.Thread(target=run_other_loop)
+        thread.start()
+        await asyncio.to_thread(thread.join, 5.0)
+        self.assertEqual(outcome, ["other loop"])
+
+        # The other loop's call did not replace this loop's call in flight.
+        follower = asyncio.create_task(self.flight.do("recipe", self.fetch))
+        self.release.set()
+        self.assertIs(await leader, await follower)
+        self.assertEqual(self.runs, 1)
+        self.assertEqual(len(self.flight), 0)
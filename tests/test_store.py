@@ -0,0 +1,82 @@
+import time
+import unittest
+
+from cooking_agent.mealie.client import Ingredient, Recipe, RecipeSummary
+from cooking_agent.mealie.store import RecipeStore
+
+
+class FakeMealie:
+    """Mealie serving an editable collection, with the list filters the sync uses."""
+
+    def __init__(self) -> None:
+        self.recipes: dict[str, tuple[Recipe, str]] = {}
+        self.filters: list[str | None] = []
+
+    def edit(self, recipe: Recipe, updated_at: str) -> None:
+        self.recipes[recipe.slug] = (recipe, updated_at)
+
+    async def list_recipes(
+        self,
+        page: int = 1,
+        per_page: int = 100,
+        order_by: str | None = None,
+        order_direction: str = "asc",
+        query_filter: str | None = None,
+    ) -> tuple[list[RecipeSummary], int]:
+        self.filters.append(query_filter)
+        since = query_filter.split('"')[1] if query_filter else ""
+        summaries = [
+            RecipeSummary(recipe.slug, recipe.name, recipe.description, recipe.total_time, None, updated_at)
+            for recipe, updated_at in self.recipes.values()
+            if updated_at >= since
+        ]
+        return sorted(summaries, key=lambda s: s.updated_at or ""), 1
+
+    async def get_recipe(self, slug: str) -> Recipe:
+        return self.recipes[slug][0]
+
+
+def lasagne(name: str, food: str) -> Recipe:
+    return Recipe("lasagne", name, None, (Ingredient(f"500 g {food}", 500.0, "g", food),), ("Bake",), "1 hour")
+
+
+class SyncTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.store = RecipeStore(":memory:")
+        self.mealie = FakeMealie()
+
+    async def asyncTearDown(self) -> None:
+        self.store.close()
+
+    async def test_updated_recipe_replaces_stored_recipe(self) -> None:
+        self.mealie.edit(lasagne("Lasagne", "Hackfleisch"), "2024-01-01T10:00:00")
+        self.assertEqual(await self.store.sync(self.mealie), 1)
+        self.assertEqual(self.store.get_recipe("lasagne").ingredients[0].food, "Hackfleisch")
+
+        self.mealie.edit(lasagne("Gemüselasagne", "Zucchini"), "2024-02-01T10:00:00")
+        self.assertEqual(await self.store.sync(self.mealie), 1)
+        recipe = self.store.get_recipe("lasagne")
+        self.assertEqual(recipe.name, "Gemüselasagne")
+        self.assertEqual(recipe.ingredients[0].food, "Zucchini")
+        self.assertEqual(self.store.cursor, "2024-02-01T10:00:00")
+        self.assertEqual(self.mealie.filters, [None, 'updatedAt >= "2024-01-01T10:00:00"'])
+
+    async def test_unchanged_recipe_keeps_its_details(self) -> None:
+        self.mealie.edit(lasagne("Lasagne", "Hackfleisch"), "2024-01-01T10:00:00")
+        await self.store.sync(self.mealie)
+        self.assertEqual(await self.store.sync(self.mealie), 0)
+        self.assertEqual(self.store.get_recipe("lasagne").name, "Lasagne")
+
+
+class StalenessTest(unittest.TestCase):
+    def test_stale_until_synced_and_after_max_age(self) -> None:
+        store = RecipeStore(":memory:")
+        self.assertIsNone(store.last_sync)
+        self.assertTrue(store.stale(900))
+
+        store._set_state("last_sync", str(time.time()))
+        self.assertFalse(store.stale(900))
+
+        store._set_state("last_sync", str(time.time() - 1000))
+        self.assertTrue(store.stale(900))
+        store.close()